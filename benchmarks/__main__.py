@@ -0,0 +1,52 @@
+"""Runs the benchmark suite.
+
+    python -m benchmarks                          # run everything
+    python -m benchmarks --filter 'game/*'        # run some cases
+    python -m benchmarks --json after.json        # save the results
+    python -m benchmarks --compare before.json    # flag regressions
+
+Exits with status 1 if any case is slower than the baseline by more than the
+threshold.
+"""
+import argparse
+import sys
+
+from benchmarks import cases, harness  # noqa: F401
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(prog="python -m benchmarks")
+    parser.add_argument("--filter", default="*", help="Glob pattern of cases.")
+    parser.add_argument("--json", help="Save the results to this file.")
+    parser.add_argument("--compare", help="Compare with results saved earlier.")
+    parser.add_argument(
+        "--threshold",
+        type=float,
+        default=0.1,
+        help="How much slower counts as a regression (default 0.1, i.e. 10%%).",
+    )
+    parser.add_argument(
+        "--min-time", type=float, default=0.2, help="Seconds per timing run."
+    )
+    args = parser.parse_args()
+
+    results = harness.run(args.filter, min_time=args.min_time)
+    if args.json:
+        harness.save(results, args.json)
+
+    baseline = harness.load(args.compare) if args.compare else {}
+    regressed = False
+    for result, ratio, slower in harness.compare(results, baseline, args.threshold):
+        line = (
+            f"{result.name:<40} {result.microseconds:12.2f} µs/{result.unit}"
+            f" {result.per_second:14,.0f} {result.unit}s/sec"
+        )
+        if ratio is not None:
+            line += f"  {ratio:5.2f}x" + ("  REGRESSION" if slower else "")
+        regressed |= slower
+        print(line)
+    return 1 if regressed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,172 @@
+"""The benchmark cases for the game engines, state helpers, signal dispatch and
+tournament runner."""
+from importlib import import_module, util
+
+from blinker import Signal
+
+from benchmarks.harness import case
+from notone import game, signals, tournament
+from notone.dice import RandomDice
+from notone.players import aggro_aiden, cautious_carter, p1, p2
+from notone.types import GameState, MutableGameState, do_nothing
+
+FIELD = [import_module(f"notone.players.p{i}") for i in range(1, 17)]
+MATCHUPS = {
+    "aiden-vs-carter": [aggro_aiden, cautious_carter],
+    "p1-vs-p2": [p1, p2],
+    "free-for-all-8": FIELD[:8],
+}
+STATE = GameState(turn_rolls=2, turn_score=20, scores=(40, 50), rolls=(10, 12))
+
+
+def receiver(state, **kwargs):
+    pass
+
+
+for matchup, players in MATCHUPS.items():
+
+    def play_frozen(players=players):
+        dice = RandomDice(1)
+        return lambda: game.play(players, dice=dice), 1
+
+    def play_mutable(players=players):
+        dice = RandomDice(1)
+        return lambda: game.play(players, engine="mutable", dice=dice), 1
+
+    def simulate(players=players):
+        dice = RandomDice(1)
+        return lambda: game.simulate(players, dice=dice), 1
+
+    def play_sampled(players=players):
+        dice = RandomDice(1)
+        return lambda: game.play(players, engine="sampled", dice=dice), 1
+
+    case(f"game/{matchup}/frozen", "game")(play_frozen)
+    case(f"game/{matchup}/mutable", "game")(play_mutable)
+    case(f"game/{matchup}/headless", "game")(simulate)
+    case(f"game/{matchup}/sampled", "game")(play_sampled)
+
+
+@case("state/roll", "call")
+def roll():
+    dice = RandomDice(1)
+    return lambda: game.roll(STATE, dice), 1
+
+
+@case("state/increment", "call")
+def increment():
+    return lambda: game.increment(STATE, "turn_score", 7), 1
+
+
+@case("state/reset", "call")
+def reset():
+    return lambda: game.reset(STATE, "turn_score"), 1
+
+
+@case("state/start_turn", "call")
+def start_turn():
+    return lambda: game.start_turn(STATE, 1), 1
+
+
+@case("state/end_turn", "call")
+def end_turn():
+    return lambda: game.end_turn(STATE, 1), 1
+
+
+for receivers in (0, 1, 10):
+
+    def send(receivers=receivers):
+        signal = Signal()
+        # Keep strong references, since blinker only holds weak ones.
+        connected = [lambda state, **kwargs: None for _ in range(receivers)]
+        for function in connected:
+            signal.connect(function)
+
+        def function():
+            signal.send(STATE, d1=3, d2=4)
+            return connected
+
+        return function, 1
+
+    case(f"signals/send/{receivers}-receivers", "send")(send)
+
+    def dispatch(receivers=receivers):
+        signal = Signal()
+        connected = [lambda state, **kwargs: None for _ in range(receivers)]
+        for function in connected:
+            signal.connect(function)
+        send = signals.Dispatch([signal]).send
+        state = MutableGameState(STATE)
+
+        def function():
+            send(signal, state, d1=3, d2=4)
+            return connected
+
+        return function, 1
+
+    case(f"signals/dispatch/{receivers}-receivers", "send")(dispatch)
+
+
+@case("signals/send/no-op-receiver", "send")
+def send_no_op():
+    signal = Signal()
+    signal.connect(do_nothing)
+    return lambda: signal.send(STATE, d1=3, d2=4), 1
+
+
+@case("signals/dispatch/no-op-receiver", "send")
+def dispatch_no_op():
+    signal = Signal()
+    signal.connect(do_nothing)
+    send = signals.Dispatch([signal]).send
+    state = MutableGameState(STATE)
+    return lambda: send(signal, state, d1=3, d2=4), 1
+
+
+LISTENERS = {
+    "per-roll": (signals.rolled, signals.turn_ended),
+    "turn-level": (signals.turn_completed,),
+}
+
+for listener, watched in LISTENERS.items():
+
+    def play_listened(watched=watched):
+        dice = RandomDice(1)
+
+        def function():
+            for signal in watched:
+                signal.connect(receiver)
+            try:
+                return game.play(
+                    [aggro_aiden, cautious_carter], engine="mutable", dice=dice
+                )
+            finally:
+                for signal in watched:
+                    signal.disconnect(receiver)
+
+        return function, 1
+
+    case(f"signals/{listener}-receiver/mutable", "game")(play_listened)
+
+
+@case("tournament/16-players/frozen", "tournament")
+def tournament_frozen():
+    dice = RandomDice(1)
+    return lambda: tournament.play(FIELD, dice=dice), 1
+
+
+@case("tournament/16-players/mutable", "tournament")
+def tournament_mutable():
+    dice = RandomDice(1)
+    return lambda: tournament.play(FIELD, dice=dice, engine="mutable"), 1
+
+
+if util.find_spec("numpy"):
+    from notone import batch
+
+    @case("batch/aiden-vs-carter/10k", "game")
+    def batch_games():
+        return (
+            lambda: batch.simulate([aggro_aiden, cautious_carter], 10_000, seed=1),
+            10_000,
+        )
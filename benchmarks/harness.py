@@ -0,0 +1,117 @@
+"""A tiny benchmark harness: register cases, time them, save the results as
+JSON and compare them against an earlier run to catch regressions."""
+from __future__ import annotations
+
+import fnmatch
+import json
+import platform
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+# A case sets itself up and returns the function to time, plus how many
+# operations (games, rolls, sends…) one call of that function performs.
+Case = Callable[[], tuple[Callable[[], object], int]]
+
+
+@dataclass(frozen=True)
+class Result:
+    name: str
+    unit: str
+    microseconds: float
+
+    @property
+    def per_second(self) -> float:
+        return 1_000_000 / self.microseconds
+
+
+cases: dict[str, tuple[Case, str]] = {}
+
+
+def case(name: str, unit: str = "op"):
+    """Registers a benchmark case.
+
+    Args:
+        name (str): The case's name; use slashes to group related cases.
+        unit (str, optional): What one operation is, e.g. "game" or "roll".
+        Defaults to "op".
+    """
+
+    def register(setup: Case) -> Case:
+        cases[name] = (setup, unit)
+        return setup
+
+    return register
+
+
+def measure(setup: Case, min_time: float = 0.2, repeat: int = 5) -> float:
+    """Times a case, returning the best per-operation time in microseconds.
+
+    Each repeat calls the function enough times to run for at least min_time
+    seconds, and the fastest repeat wins, since noise only ever slows things
+    down.
+    """
+    function, ops = setup()
+    calls = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time / 10:
+            break
+        calls *= 2
+    calls = max(1, int(calls * (min_time / max(elapsed, 1e-9))))
+
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for _ in range(calls):
+            function()
+        best = min(best, (time.perf_counter() - start) / (calls * ops))
+    return best * 1_000_000
+
+
+def run(pattern: str = "*", min_time: float = 0.2, repeat: int = 5) -> list[Result]:
+    results = []
+    for name, (setup, unit) in cases.items():
+        if not fnmatch.fnmatch(name, pattern):
+            continue
+        results.append(Result(name, unit, measure(setup, min_time, repeat)))
+    return results
+
+
+def save(results: list[Result], path: Path):
+    data = {
+        "python": platform.python_version(),
+        "machine": platform.machine(),
+        "results": [asdict(result) for result in results],
+    }
+    Path(path).write_text(json.dumps(data, indent=2))
+
+
+def load(path: Path) -> dict[str, Result]:
+    data = json.loads(Path(path).read_text())
+    return {result["name"]: Result(**result) for result in data["results"]}
+
+
+def compare(
+    results: list[Result], baseline: dict[str, Result], threshold: float = 0.1
+) -> list[tuple[Result, Optional[float], bool]]:
+    """Compares results with a baseline run.
+
+    Returns:
+        list[tuple[Result, Optional[float], bool]]: Each result, how many times
+        slower it is than the baseline (None if it's new), and whether that's
+        slower by more than the threshold.
+    """
+    compared = []
+    for result in results:
+        before = baseline.get(result.name)
+        if before is None:
+            compared.append((result, None, False))
+            continue
+        ratio = result.microseconds / before.microseconds
+        compared.append((result, ratio, ratio > 1 + threshold))
+    return compared
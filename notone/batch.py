@@ -0,0 +1,197 @@
+"""A vectorized engine that plays many independent games of Not One in
+lockstep using NumPy arrays.
+
+Players can opt into vectorized decisions by providing a
+`roll_again_batch(state: BatchState)` function that returns an array of
+booleans, one per game. Players without one are asked game by game via their
+regular `roll_again()`.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+import numpy as np
+
+from notone import game
+from notone.players import identify
+from notone.types import GameState, Player
+
+Decider = Callable[["BatchState"], np.ndarray]
+
+
+@dataclass(frozen=True)
+class BatchState:
+    """Mirrors GameState, but each field other than active and round holds one
+    entry per game still taking their turn."""
+
+    active: int
+    rolls: np.ndarray
+    round: int
+    scores: np.ndarray
+    turn_rolls: np.ndarray
+    turn_score: np.ndarray
+
+    def __len__(self) -> int:
+        return len(self.turn_score)
+
+    def game_state(self, index: int) -> GameState:
+        """Builds the regular GameState for a single game in the batch."""
+        return GameState(
+            active=self.active,
+            rolls=tuple(int(r) for r in self.rolls[index]),  # type: ignore
+            round=self.round,
+            scores=tuple(int(s) for s in self.scores[index]),  # type: ignore
+            turn_rolls=int(self.turn_rolls[index]),
+            turn_score=int(self.turn_score[index]),
+        )
+
+
+@dataclass(frozen=True)
+class BatchResult:
+    scores: np.ndarray
+    rolls: np.ndarray
+    winners: np.ndarray
+
+    @property
+    def games(self) -> int:
+        return len(self.winners)
+
+    @property
+    def wins(self) -> np.ndarray:
+        """The number of games won by each player."""
+        return np.bincount(
+            self.winners[self.winners >= 0], minlength=self.scores.shape[1]
+        )
+
+    @property
+    def ties(self) -> int:
+        return int(np.count_nonzero(self.winners < 0))
+
+
+def decider(player: Player) -> Decider:
+    """Picks the fastest way to ask a player whether to roll again.
+
+    Args:
+        player (Player): The player.
+
+    Raises:
+        ValueError: If the player has no roll_again_batch() and its roll_again()
+        is a coroutine function.
+
+    Returns:
+        Decider: A function taking a BatchState and returning one decision per
+        game.
+    """
+    roll_again_batch = getattr(player, "roll_again_batch", None)
+    if roll_again_batch is None and game.decides_async(player):
+        raise ValueError(
+            f"{identify(player)} decides asynchronously; give it a "
+            "roll_again_batch() or use game.play_async()."
+        )
+    if roll_again_batch is not None:
+
+        def decide(state: BatchState) -> np.ndarray:
+            decisions = np.asarray(roll_again_batch(state), dtype=bool)
+            return np.broadcast_to(decisions, (len(state),))
+
+    else:
+
+        def decide(state: BatchState) -> np.ndarray:
+            return np.fromiter(
+                (player.roll_again(state.game_state(i)) for i in range(len(state))),
+                dtype=bool,
+                count=len(state),
+            )
+
+    return decide
+
+
+def winners(scores: np.ndarray) -> np.ndarray:
+    """Finds the winner of each game: the player with the highest score, or -1
+    for a tie.
+
+    Args:
+        scores (np.ndarray): The final scores, one row per game.
+
+    Returns:
+        np.ndarray: The index of the winning player in each game.
+    """
+    best = scores.max(axis=1, keepdims=True)
+    unique = np.count_nonzero(scores == best, axis=1) == 1
+    return np.where(unique, scores.argmax(axis=1), -1)
+
+
+def play_turn(
+    decide: Decider,
+    active: int,
+    round: int,
+    scores: np.ndarray,
+    rolls: np.ndarray,
+    rng: np.random.Generator,
+) -> tuple[np.ndarray, np.ndarray]:
+    """Plays one turn for the active player in every game.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray]: The turn score and turn rolls for each
+        game.
+    """
+    n_games = len(scores)
+    turn_score = np.zeros(n_games, dtype=np.int64)
+    turn_rolls = np.zeros(n_games, dtype=np.int64)
+    live = np.arange(n_games)
+
+    while live.size:
+        state = BatchState(
+            active=active,
+            rolls=rolls[live],
+            round=round,
+            scores=scores[live],
+            turn_rolls=turn_rolls[live],
+            turn_score=turn_score[live],
+        )
+        live = live[decide(state)]
+        if not live.size:
+            break
+        d1, d2 = rng.integers(1, 7, size=(2, live.size))
+        turn_rolls[live] += 1
+        failed = (turn_rolls[live] > 1) & ((d1 == 1) | (d2 == 1))
+        turn_score[live] = np.where(failed, 0, turn_score[live] + d1 + d2)
+        live = live[~failed]
+
+    return turn_score, turn_rolls
+
+
+def simulate(
+    players: list[Player],
+    n_games: int,
+    rounds=10,
+    seed: Optional[int | np.random.SeedSequence] = None,
+) -> BatchResult:
+    """Plays many independent games between the same players at once.
+
+    Args:
+        players (list[Player]): The players, in turn order for odd rounds.
+        n_games (int): The number of games to play.
+        rounds (int, optional): The number of rounds per game. Defaults to 10.
+        seed (Optional[int | np.random.SeedSequence], optional): Seeds the
+        random number generator. Defaults to None.
+
+    Returns:
+        BatchResult: The final scores, rolls and winner of every game.
+    """
+    rng = np.random.default_rng(seed)
+    deciders = [decider(player) for player in players]
+    num_players = max(2, len(players))
+    scores = np.zeros((n_games, num_players), dtype=np.int64)
+    rolls = np.zeros((n_games, num_players), dtype=np.int64)
+
+    for round in range(1, rounds + 1):
+        for active in game.turn_order(len(players), round):
+            turn_score, turn_rolls = play_turn(
+                deciders[active], active, round, scores, rolls, rng
+            )
+            scores[:, active] += turn_score
+            rolls[:, active] += turn_rolls
+
+    return BatchResult(scores=scores, rolls=rolls, winners=winners(scores))
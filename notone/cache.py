@@ -0,0 +1,41 @@
+"""Where Not One keeps expensive, reusable artifacts like solved policies."""
+import os
+import tempfile
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Iterator
+
+
+def directory() -> Path:
+    """Finds (and creates) the cache directory. Set NOTONE_CACHE_DIR to move it
+    from the default of ~/.cache/notone.
+
+    Returns:
+        Path: The cache directory.
+    """
+    path = Path(os.environ.get("NOTONE_CACHE_DIR", Path.home() / ".cache" / "notone"))
+    path.mkdir(parents=True, exist_ok=True)
+    return path
+
+
+@contextmanager
+def atomic(path: Path) -> Iterator[BinaryIO]:
+    """Opens a temporary file next to `path` for writing, and only moves it into
+    place once it's complete, so other processes never read it half-written.
+
+    Args:
+        path (Path): Where the file belongs.
+
+    Yields:
+        BinaryIO: The temporary file to write.
+    """
+    file = tempfile.NamedTemporaryFile(
+        dir=path.parent, prefix=f".{path.name}.", delete=False
+    )
+    try:
+        with file:
+            yield file  # type: ignore
+        os.replace(file.name, path)
+    except BaseException:
+        os.unlink(file.name)
+        raise
@@ -0,0 +1,216 @@
+"""Compiles a player's roll_again() into a lookup table.
+
+The compiler first watches which GameState fields a player reads, then sweeps
+roll_again() over every combination of those fields within a bounded range and
+stores the decisions in a NumPy boolean array. The compiled player answers with
+a single array index, and falls back to the original roll_again() for states
+outside the table.
+
+Only players that decide on round, active, turn_rolls and turn_score can be
+compiled; the total scores and rolls have far too many combinations to sweep.
+Tables are bit-packed and cached on disk, keyed by a hash of the player's
+source code (or the code their strategy spec compiled to), so each version of a
+player is only swept once. Players whose source can't be found are swept every
+time they're compiled.
+"""
+from __future__ import annotations
+
+import hashlib
+import inspect
+import itertools
+import random
+from types import ModuleType
+from typing import Optional
+
+import numpy as np
+
+from notone import cache
+from notone.types import GameState, Player
+
+AXES = ("round", "active", "turn_rolls", "turn_score")
+UNSUPPORTED = ("scores", "rolls", "roll", "winner", "forfeited")
+SIZES = {"round": 11, "active": 2, "turn_rolls": 64, "turn_score": 512}
+VERSION = 2
+
+
+class TracingState:
+    """Stands in for a GameState, noting every field the player reads."""
+
+    def __init__(
+        self,
+        state: GameState,
+        accessed: set[str],
+        allowed: Optional[tuple[str, ...]] = None,
+    ):
+        self._state = state
+        self._accessed = accessed
+        self._allowed = allowed
+
+    def __getattr__(self, field: str):
+        if self._allowed is not None and field not in self._allowed:
+            raise ValueError(
+                f"The player read {field}, which the table doesn't cover; it only "
+                f"covers {', '.join(self._allowed) or 'nothing'}."
+            )
+        self._accessed.add(field)
+        return getattr(self._state, field)
+
+
+def sample_states(samples: int, seed: int = 0) -> list[GameState]:
+    rng = random.Random(seed)
+    return [
+        GameState(
+            active=rng.randint(0, 1),
+            rolls=(rng.randint(0, 60), rng.randint(0, 60)),
+            round=rng.randint(1, 10),
+            scores=(rng.randint(0, 300), rng.randint(0, 300)),
+            turn_rolls=rng.randint(0, 12),
+            turn_score=rng.randint(0, 120),
+        )
+        for _ in range(samples)
+    ]
+
+
+def accessed_fields(player: Player, samples: int = 500) -> set[str]:
+    """Finds out which GameState fields a player reads, by handing them a spread
+    of sample states.
+
+    Args:
+        player (Player): The player.
+        samples (int, optional): The number of sample states. Defaults to 500.
+
+    Returns:
+        set[str]: The fields read.
+    """
+    accessed: set[str] = set()
+    for state in sample_states(samples):
+        player.roll_again(TracingState(state, accessed))
+    return accessed
+
+
+def source_hash(player: Player) -> Optional[str]:
+    """Hashes the code behind a player's decisions: the source their strategy
+    spec compiled to, or their module's source.
+
+    Returns:
+        Optional[str]: The hash, or None if the source can't be found, so the
+        player's table can't be cached safely.
+    """
+    source = getattr(player, "source", None)
+    if not isinstance(source, str):
+        try:
+            source = inspect.getsource(player)
+        except (OSError, TypeError):
+            return None
+    return hashlib.sha256(source.encode()).hexdigest()[:16]
+
+
+def sweep(player: Player, axes: tuple[str, ...]) -> np.ndarray:
+    """Asks the player for a decision at every combination of the axes.
+
+    Args:
+        player (Player): The player.
+        axes (tuple[str, ...]): The GameState fields to sweep, in AXES order.
+
+    Raises:
+        ValueError: If the player reads any other field, which the sweep would
+        leave at its default.
+
+    Returns:
+        np.ndarray: The decisions, with one dimension per axis.
+    """
+    shape = tuple(SIZES[axis] for axis in axes)
+    table = np.zeros(shape, dtype=bool)
+    accessed: set[str] = set()
+    for index in itertools.product(*(range(size) for size in shape)):
+        state = GameState(**dict(zip(axes, index)))
+        table[index] = bool(player.roll_again(TracingState(state, accessed, axes)))
+    return table
+
+
+def load_or_sweep(player: Player, axes: tuple[str, ...]) -> np.ndarray:
+    source = source_hash(player)
+    if source is None:
+        return sweep(player, axes)
+    name = f"compiled-v{VERSION}-{source}-{'-'.join(axes) or 'const'}"
+    path = cache.directory() / f"{name}.npz"
+    shape = tuple(SIZES[axis] for axis in axes)
+    if path.exists():
+        with np.load(path) as data:
+            bits = np.unpackbits(data["table"], count=int(np.prod(shape)))
+            return bits.reshape(shape).astype(bool)
+    table = sweep(player, axes)
+    with cache.atomic(path) as file:
+        np.savez_compressed(file, table=np.packbits(table))
+    return table
+
+
+def compile(player: Player, axes: Optional[tuple[str, ...]] = None) -> Player:
+    """Compiles a player into a drop-in replacement backed by a lookup table.
+
+    Args:
+        player (Player): The player to compile.
+        axes (Optional[tuple[str, ...]], optional): The GameState fields the
+        player decides on. Defaults to None, which finds them by tracing.
+
+    Raises:
+        ValueError: If the player reads fields that can't be tabulated, even
+        if only in states the tracing samples missed.
+
+    Returns:
+        Player: A new player module with the same name, emoji and victory cry,
+        and table-driven roll_again() and roll_again_batch() functions.
+    """
+    if axes is None:
+        accessed = accessed_fields(player)
+        unsupported = sorted(accessed & set(UNSUPPORTED))
+        if unsupported:
+            raise ValueError(
+                f"Can't compile {player.__name__}: it reads {', '.join(unsupported)}."
+            )
+        axes = tuple(axis for axis in AXES if axis in accessed)
+    table = load_or_sweep(player, axes)
+    limits = tuple(SIZES[axis] for axis in axes)
+
+    def fallback(state: GameState) -> bool:
+        return player.roll_again(state)
+
+    # Indexing a flat Python list is much cheaper than indexing NumPy with
+    # Python ints, so single decisions use a flattened copy of the table.
+    decisions = table.ravel().tolist()
+    strides = [stride // table.itemsize for stride in table.strides]
+    lookups = list(zip(axes, limits, strides))
+
+    def roll_again(state: GameState) -> bool:
+        position = 0
+        for axis, limit, stride in lookups:
+            value = getattr(state, axis)
+            if not 0 <= value < limit:
+                return fallback(state)
+            position += value * stride
+        return decisions[position]
+
+    def roll_again_batch(state) -> np.ndarray:
+        """Looks up decisions for a notone.batch.BatchState."""
+        columns = [
+            np.broadcast_to(np.asarray(getattr(state, axis)), (len(state),))
+            for axis in axes
+        ]
+        inside = np.ones(len(state), dtype=bool)
+        for column, limit in zip(columns, limits):
+            inside &= (column >= 0) & (column < limit)
+        batch_decisions = np.zeros(len(state), dtype=bool)
+        batch_decisions[inside] = table[tuple(column[inside] for column in columns)]
+        for i in np.flatnonzero(~inside):
+            batch_decisions[i] = fallback(state.game_state(i))
+        return batch_decisions
+
+    compiled = ModuleType(f"{player.__name__}.compiled")
+    compiled.name = player.name  # type: ignore
+    compiled.emoji = player.emoji  # type: ignore
+    compiled.victory_cry = player.victory_cry  # type: ignore
+    compiled.roll_again = roll_again  # type: ignore
+    compiled.roll_again_batch = roll_again_batch  # type: ignore
+    compiled.table = table  # type: ignore
+    compiled.axes = axes  # type: ignore
+    return compiled
@@ -1,13 +1,129 @@
+import queue
 import sys
+import threading
+import time
+from collections import Counter
+from typing import Optional
 
 from rich import print
+from rich.console import Group
+from rich.live import Live
+from rich.table import Table
 
 from notone import signals
 from notone.types import SignalHandler, GameState, GameType, Player, TournamentState
 
+# Tells the writer thread there's nothing more to print.
+DONE = None
+
+
+class BufferedWriter:
+    """Prints messages from a background thread, so the game never waits on the
+    terminal. Messages queue up (to a limit, after which the game does wait)
+    and are printed in batches. If printing fails, say with a BrokenPipeError
+    when output is piped into `head`, the next write(), flush() or close()
+    raises the error instead of waiting forever."""
+
+    def __init__(self, batch_size: int = 500, buffer: int = 10_000):
+        self.batch_size = batch_size
+        self.pending: queue.Queue = queue.Queue(maxsize=buffer)
+        self.error: Optional[Exception] = None
+        self.thread = threading.Thread(target=self.run, daemon=True)
+        self.thread.start()
+
+    def write(self, message: str, **kwargs):
+        """Queues a message, waiting while the buffer is full.
+
+        Raises:
+            Exception: Whatever stopped the writer thread printing, if it
+            failed.
+        """
+        while True:
+            if self.error is not None:
+                raise self.error
+            try:
+                self.pending.put((message, kwargs), timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def flush(self):
+        """Waits until everything written so far has been printed.
+
+        Raises:
+            Exception: Whatever stopped the writer thread printing, if it
+            failed.
+        """
+        self.pending.join()
+        if self.error is not None:
+            raise self.error
+
+    def close(self):
+        """Prints everything still queued and stops the writer thread.
+
+        Raises:
+            Exception: Whatever stopped the writer thread printing, if it
+            failed.
+        """
+        if self.thread.is_alive():
+            self.pending.put(DONE)
+            self.thread.join()
+        if self.error is not None:
+            raise self.error
+
+    def run(self):
+        done = False
+        while not done:
+            batch = [self.pending.get()]
+            while len(batch) < self.batch_size:
+                try:
+                    batch.append(self.pending.get_nowait())
+                except queue.Empty:
+                    break
+            done = DONE in batch
+            try:
+                if self.error is None:
+                    self.print_batch(batch)
+            except Exception as e:
+                # Raised on the game thread by the next write(), flush() or
+                # close(). Messages queued after it are dropped, so nothing
+                # waits on them.
+                self.error = e
+            finally:
+                for _ in batch:
+                    self.pending.task_done()
+
+    def print_batch(self, batch: list):
+        lines: list[str] = []
+        options: dict = {}
+        for item in batch:
+            if item is DONE:
+                continue
+            message, kwargs = item
+            # Consecutive messages printed the same way go out together.
+            if lines and kwargs != options:
+                print("\n".join(lines), **options)
+                lines = []
+            lines.append(message)
+            options = kwargs
+        if lines:
+            print("\n".join(lines), **options)
+
+
+writer: Optional[BufferedWriter] = None
+pause_between_rounds = True
+
 
 def echo(message: str, **kwargs):
-    print(message, **kwargs)
+    if writer is None:
+        print(message, **kwargs)
+    else:
+        writer.write(message, **kwargs)
+
+
+def flush():
+    if writer is not None:
+        writer.flush()
 
 
 def error(e: Exception):
@@ -47,6 +163,9 @@ def handle_game_ended(game: GameState, players: list[Player]):
             f"{game.scores[active]} in {game.rolls[active]} rolls"
         )
 
+    if game.forfeited is not None:
+        loser = players[game.forfeited]
+        echo(f"\n{loser.emoji()} {loser.name()} FORFEITS")
     if game.winner is None:
         echo("\nTIE! Play again.\n")
     else:
@@ -78,8 +197,9 @@ def handle_tournament_round_started(tournament: TournamentState, players: list[P
 
 
 def handle_tournament_round_ended(tournament: TournamentState, players: list[Player]):
-    if len(players) <= 1:
+    if len(players) <= 1 or not pause_between_rounds:
         return
+    flush()
     input("\n  Press enter to play the next round...")
 
 
@@ -96,6 +216,9 @@ def handle_tournament_game_ended(game: GameState, players: list[Player]):
     loser = players[loser_idx]
     losing_score = game.scores[loser_idx]
 
+    if game.forfeited is not None:
+        echo(f"  {winner.name()} defeats {loser.name()}, who forfeits")
+        return
     echo(f"  {winner.name()} defeats {loser.name()}, {winning_score} to {losing_score}")
 
 
@@ -107,6 +230,140 @@ def handle_tournament_ended(tournament: TournamentState, players: list[Player]):
     echo("TOURNAMENT OVER")
 
 
+def show_matchup(result):
+    echo(f"{result.games:,} GAMES")
+    for player, wins, win_rate, mean_score in zip(
+        result.players, result.wins, result.win_rates, result.mean_scores
+    ):
+        echo(
+            f"  {player}: {wins:,} wins ({win_rate:.2%}), average score {mean_score:.1f}"
+        )
+    echo(f"  Ties: {result.ties:,} ({result.tie_rate:.2%})")
+    if result.seed is not None:
+        echo(f"  Seed: {result.seed}")
+
+
+def show_odds(odds):
+    for player, chance in zip(odds.players, odds.wins):
+        echo(f"  {player}: {chance:.4%} to win")
+    echo(f"  Tie: {odds.tie:.4%}")
+
+
+def show_league(league, ratings):
+    echo(f"{'PLAYER':<24} {'ELO':>6}  WIN RATE")
+    win_rates = league.win_rates
+    for i in sorted(range(len(league.players)), key=lambda i: -ratings[i]):
+        others = [win_rates[i, j] for j in range(len(league.players)) if j != i]
+        overall = sum(others) / len(others) if others else 0
+        echo(f"{league.players[i]:<24} {ratings[i]:>6.0f}  {overall:.2%}")
+
+
+def show_decision_stats(stats):
+    echo(f"{'PLAYER':<30} {'CALLS':>9} {'TOTAL':>8} {'MEAN':>8} {'P99':>8} {'MAX':>8}")
+    for player, latency in stats.report().items():
+        timings = (latency.mean, latency.p99, latency.max)
+        echo(
+            f"{player:<30} {latency.calls:>9,} {latency.total:>7.2f}s "
+            + " ".join(f"{seconds * 1e6:>6.1f}µs" for seconds in timings)
+        )
+
+
+class Summary:
+    """Keeps running totals of games and tournaments and shows them in a live
+    display that's redrawn at most every `refresh` seconds, instead of printing
+    every event."""
+
+    def __init__(
+        self,
+        total: Optional[int] = None,
+        unit: GameType = "game",
+        refresh: float = 0.25,
+    ):
+        """
+        Args:
+            total (Optional[int], optional): How many of `unit` the run will
+            play, for the ETA. Defaults to None.
+            unit (GameType, optional): Whether the run's progress is counted in
+            games or tournaments. Defaults to "game".
+            refresh (float, optional): The least time between redraws, in
+            seconds. Defaults to 0.25.
+        """
+        self.total = total
+        self.unit = unit
+        self.refresh = refresh
+        self.games = 0
+        self.ties = 0
+        self.tournaments = 0
+        self.played: Counter[str] = Counter()
+        self.wins: Counter[str] = Counter()
+        self.champions: Counter[str] = Counter()
+        self.started = time.monotonic()
+        self.redrawn = 0.0
+        self.live = Live(self.render(), auto_refresh=False)
+
+    def start(self):
+        self.started = time.monotonic()
+        self.live.start()
+
+    def stop(self):
+        self.live.update(self.render(), refresh=True)
+        self.live.stop()
+
+    def handle_game_ended(self, game: GameState, players: list[Player]):
+        self.games += 1
+        for player in players:
+            self.played[player.name()] += 1
+        if game.winner is None:
+            self.ties += 1
+        else:
+            self.wins[players[game.winner].name()] += 1
+        self.redraw()
+
+    def handle_tournament_ended(
+        self, tournament: TournamentState, players: list[Player]
+    ):
+        self.tournaments += 1
+        if tournament.champion is not None:
+            self.champions[players[tournament.champion].name()] += 1
+        self.redraw()
+
+    def redraw(self):
+        now = time.monotonic()
+        if now - self.redrawn >= self.refresh:
+            self.redrawn = now
+            self.live.update(self.render(), refresh=True)
+
+    def render(self) -> Group:
+        elapsed = max(time.monotonic() - self.started, 1e-9)
+        done = self.tournaments if self.unit == "tournament" else self.games
+        rate = self.games / elapsed
+        title = f"{self.games:,} games, {rate:,.0f}/sec"
+        if self.tournaments:
+            title += f", {self.tournaments:,} tournaments"
+        if self.total and done:
+            remaining = elapsed / done * max(self.total - done, 0)
+            title += f", {done / self.total:.0%} done, ETA {remaining:,.0f}s"
+
+        table = Table()
+        table.add_column("Player")
+        table.add_column("Win rate", justify="right")
+        if self.tournaments:
+            table.add_column("Titles", justify="right")
+        for name, _ in self.wins.most_common() + [
+            (name, 0) for name in self.played if name not in self.wins
+        ]:
+            row = [name, f"{self.wins[name] / self.played[name]:.1%}"]
+            if self.tournaments:
+                row.append(f"{self.champions[name]:,}")
+            table.add_row(*row)
+        if self.games:
+            title += f", {self.ties / self.games:.1%} ties"
+        return Group(title, table)
+
+
+summary: Optional[Summary] = None
+
+
 signal_handlers: dict[GameType, SignalHandler] = {
     "game": SignalHandler(
         game_started=handle_game_started,
@@ -127,24 +384,59 @@ signal_handlers: dict[GameType, SignalHandler] = {
 }
 
 
-def connect_output(type: GameType):
-    handle = signal_handlers[type]
-
-    signals.game_started.connect(handle.game_started)
-    signals.game_ended.connect(handle.game_ended)
-
-    signals.round_started.connect(handle.round_started)
-    signals.round_ended.connect(handle.round_ended)
-
-    signals.turn_started.connect(handle.turn_started)
-    signals.turn_ended.connect(handle.turn_ended)
-
-    signals.rolled.connect(handle.rolled)
-    signals.roll_succeeded.connect(handle.roll_succeeded)
-    signals.roll_failed.connect(handle.roll_failed)
-
-    signals.tournament_started.connect(handle.tournament_started)
-    signals.tournament_ended.connect(handle.tournament_ended)
-
-    signals.tournament_round_started.connect(handle.tournament_round_started)
-    signals.tournament_round_ended.connect(handle.tournament_round_ended)
+def connect_output(type: GameType, buffered: bool = False, interactive: bool = True):
+    """Prints what's happening in a game or tournament as it's played.
+
+    Args:
+        type (GameType): Whether to narrate a game or a tournament.
+        buffered (bool, optional): Whether to print from a background thread
+        instead of making the game wait on the terminal. Defaults to False.
+        interactive (bool, optional): Whether to pause between tournament
+        rounds. Defaults to True.
+    """
+    global writer, pause_between_rounds
+    pause_between_rounds = interactive
+    if buffered and writer is None:
+        writer = BufferedWriter()
+    # Handlers left as do_nothing aren't connected, so unnarrated signals
+    # cost nothing to send.
+    signals.connect(signal_handlers[type])
+
+
+def disconnect_output(type: GameType):
+    """Stops printing what's happening, undoing connect_output()."""
+    signals.disconnect(signal_handlers[type])
+
+
+def connect_summary(total: Optional[int] = None, unit: GameType = "game"):
+    """Shows a live summary of the results so far instead of narrating every
+    roll, for large runs.
+
+    Args:
+        total (Optional[int], optional): How many of `unit` will be played, for
+        the ETA. Defaults to None.
+        unit (GameType, optional): Whether the run plays games or tournaments.
+        Defaults to "game".
+    """
+    global summary
+    summary = Summary(total, unit)
+    signals.game_ended.connect(summary.handle_game_ended)
+    signals.tournament_ended.connect(summary.handle_tournament_ended)
+    summary.start()
+
+
+def close():
+    """Prints anything still buffered and stops the writer thread and the live
+    summary."""
+    global writer, summary
+    try:
+        if writer is not None:
+            # Forgotten first, so errors about a failed writer print directly.
+            closing, writer = writer, None
+            closing.close()
+    finally:
+        if summary is not None:
+            signals.game_ended.disconnect(summary.handle_game_ended)
+            signals.tournament_ended.disconnect(summary.handle_tournament_ended)
+            summary.stop()
+            summary = None
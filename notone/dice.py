@@ -0,0 +1,146 @@
+"""Sources of dice rolls for the game engines.
+
+Every source has a roll() method returning a face value from 1-6, and a
+spawn() method deriving an independent source for a sub-task (like a single
+tournament matchup), so parallel workers each get their own reproducible
+stream. Sources that can also draw a uniform random() number in [0, 1) let the
+"sampled" engine pick a whole turn's outcome at once.
+"""
+from __future__ import annotations
+
+import random
+import zlib
+from typing import Iterable, Optional, Protocol, Union
+
+Seed = Union[int, str, None]
+
+
+class Dice(Protocol):
+    def roll(self) -> int:
+        ...
+
+    def random(self) -> float:
+        ...
+
+    def spawn(self, key: str) -> Dice:
+        ...
+
+
+class GlobalDice:
+    """Rolls with the global random number generator, so random.seed() applies.
+    Spawned sources share the same global stream."""
+
+    def roll(self) -> int:
+        return random.randint(1, 6)
+
+    def random(self) -> float:
+        return random.random()
+
+    def spawn(self, key: str) -> Dice:
+        return self
+
+
+class RandomDice:
+    """Rolls with a private, seedable random.Random. For the same seed, rolls
+    match the global generator after random.seed(seed)."""
+
+    def __init__(self, seed: Seed = None):
+        self.seed = seed
+        self.rng = random.Random(seed)
+
+    def roll(self) -> int:
+        return self.rng.randint(1, 6)
+
+    def random(self) -> float:
+        return self.rng.random()
+
+    def spawn(self, key: str) -> Dice:
+        if self.seed is None:
+            return RandomDice(self.rng.getrandbits(64))
+        return RandomDice(f"{self.seed}:{key}")
+
+
+class NumpyDice:
+    """Rolls with a NumPy Generator, drawing dice in blocks so that most rolls
+    are just a list lookup."""
+
+    def __init__(self, seed=None, block: int = 4096):
+        # NumPy is an optional dependency, only needed for this source.
+        import numpy as np
+
+        self.seed_sequence = (
+            seed
+            if isinstance(seed, np.random.SeedSequence)
+            else np.random.SeedSequence(seed)
+        )
+        self.rng = np.random.default_rng(self.seed_sequence)
+        self.block = block
+        self.buffer: list[int] = []
+        self.position = 0
+        self.uniforms: list[float] = []
+        self.uniform_position = 0
+
+    def roll(self) -> int:
+        if self.position == len(self.buffer):
+            self.buffer = self.rng.integers(1, 7, size=self.block).tolist()
+            self.position = 0
+        self.position += 1
+        return self.buffer[self.position - 1]
+
+    def random(self) -> float:
+        if self.uniform_position == len(self.uniforms):
+            self.uniforms = self.rng.random(size=self.block).tolist()
+            self.uniform_position = 0
+        self.uniform_position += 1
+        return self.uniforms[self.uniform_position - 1]
+
+    def spawn(self, key: str) -> Dice:
+        import numpy as np
+
+        child = np.random.SeedSequence(
+            self.seed_sequence.entropy,
+            spawn_key=self.seed_sequence.spawn_key + (zlib.crc32(key.encode()),),
+        )
+        return NumpyDice(child, self.block)
+
+
+class ReplayDice:
+    """Replays previously recorded rolls, in order. Spawned sources continue
+    the same recording, so a serial run replays exactly."""
+
+    def __init__(self, rolls: Iterable[int]):
+        self.rolls = iter(rolls)
+
+    def roll(self) -> int:
+        try:
+            return next(self.rolls)
+        except StopIteration:
+            raise ValueError("Ran out of recorded rolls to replay.") from None
+
+    def random(self) -> float:
+        raise ValueError("Recorded rolls can't be replayed a turn at a time.")
+
+    def spawn(self, key: str) -> Dice:
+        return self
+
+
+class RecordingDice:
+    """Wraps another source and records every roll, for replaying later."""
+
+    def __init__(self, dice: Optional[Dice] = None):
+        self.dice = dice or default
+        self.rolls: list[int] = []
+
+    def roll(self) -> int:
+        rolled = self.dice.roll()
+        self.rolls.append(rolled)
+        return rolled
+
+    def random(self) -> float:
+        raise ValueError("Only individual rolls can be recorded.")
+
+    def spawn(self, key: str) -> Dice:
+        return self
+
+
+default: Dice = GlobalDice()
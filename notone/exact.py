@@ -0,0 +1,207 @@
+"""Works out exact odds for players who declare a Threshold policy, without
+playing a single game.
+
+A threshold player's turn is a Markov chain over (turn_rolls, turn_score), so
+the distribution of how a turn ends—its score and number of rolls—can be
+computed exactly by following every roll. Turns don't depend on the round or
+the scores, so a game's final score is the sum of independent turns, and its
+distribution is the turn distribution convolved with itself once per round.
+Comparing two players' final score distributions gives their exact odds.
+
+Every distribution is memoized, so each policy's turns are only worked out once.
+turn_table() also turns a policy's turn outcomes into an alias table, so the
+"sampled" engine can pick a whole turn with one random number.
+"""
+from __future__ import annotations
+
+import itertools
+from collections import defaultdict
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import Optional
+
+from notone.players import identify
+from notone.types import Player, Threshold
+
+
+def roll_sums(lowest: int) -> dict[int, float]:
+    """The chance of each total of two dice, counting only rolls where both
+    dice show at least `lowest`."""
+    sums: dict[int, float] = defaultdict(float)
+    for d1, d2 in itertools.product(range(lowest, 7), repeat=2):
+        sums[d1 + d2] += 1 / 36
+    return dict(sums)
+
+
+# The first roll of a turn can't fail; later rolls fail on any 1.
+FIRST_ROLL_SUMS = roll_sums(1)
+LATER_ROLL_SUMS = roll_sums(2)
+LATER_ROLL_FAILS = 11 / 36
+
+
+@dataclass(frozen=True)
+class Odds:
+    players: tuple[str, ...]
+    wins: tuple[float, float]
+    tie: float
+
+
+def policy(player: Player) -> Optional[Threshold]:
+    """Finds the Threshold policy a player declares, if they declare one."""
+    declared = getattr(player, "policy", None)
+    return declared if isinstance(declared, Threshold) else None
+
+
+@lru_cache(maxsize=None)
+def turn_outcomes(threshold: Threshold) -> dict[tuple[int, int], float]:
+    """Works out how likely each way a turn can end is.
+
+    Args:
+        threshold (Threshold): The player's policy.
+
+    Returns:
+        dict[tuple[int, int], float]: The chance of each (turn score, turn
+        rolls) outcome. A failed turn scores 0.
+    """
+    outcomes: dict[tuple[int, int], float] = defaultdict(float)
+    # The chance of reaching each (turn_rolls, turn_score) mid-turn.
+    frontier: dict[tuple[int, int], float] = {(0, 0): 1.0}
+    while frontier:
+        following: dict[tuple[int, int], float] = defaultdict(float)
+        for (rolls, score), chance in frontier.items():
+            value = score if threshold.attribute == "turn_score" else rolls
+            if value >= threshold.limit:
+                outcomes[score, rolls] += chance
+                continue
+            sums = FIRST_ROLL_SUMS if rolls == 0 else LATER_ROLL_SUMS
+            if rolls:
+                outcomes[0, rolls + 1] += chance * LATER_ROLL_FAILS
+            for total, odds in sums.items():
+                following[rolls + 1, score + total] += chance * odds
+        frontier = following
+    return dict(outcomes)
+
+
+class AliasTable:
+    def __init__(self, outcomes: dict[tuple[int, int], float]):
+        """Builds a table for drawing outcomes in constant time with Vose's alias
+        method: every slot holds an outcome, the chance of keeping it, and an
+        alias to draw instead.
+
+        Args:
+            outcomes (dict[tuple[int, int], float]): The chance of each outcome.
+        """
+        self.outcomes = list(outcomes)
+        size = len(self.outcomes)
+        total = sum(outcomes.values())
+        scaled = [outcomes[outcome] * size / total for outcome in self.outcomes]
+        self.keep = [1.0] * size
+        self.alias = list(range(size))
+        small = [i for i, chance in enumerate(scaled) if chance < 1]
+        large = [i for i, chance in enumerate(scaled) if chance >= 1]
+        while small and large:
+            less, more = small.pop(), large.pop()
+            self.keep[less] = scaled[less]
+            self.alias[less] = more
+            scaled[more] -= 1 - scaled[less]
+            (small if scaled[more] < 1 else large).append(more)
+        # Whatever's left over is 1, give or take rounding errors.
+
+    def sample(self, uniform: float) -> tuple[int, int]:
+        """Draws an outcome.
+
+        Args:
+            uniform (float): A uniform random number in [0, 1), which picks both
+            the slot and whether to take its alias.
+
+        Returns:
+            tuple[int, int]: The outcome.
+        """
+        position = uniform * len(self.outcomes)
+        slot = int(position)
+        if position - slot < self.keep[slot]:
+            return self.outcomes[slot]
+        return self.outcomes[self.alias[slot]]
+
+
+@lru_cache(maxsize=None)
+def turn_table(threshold: Threshold) -> AliasTable:
+    """An alias table of a policy's (turn score, turn rolls) outcomes."""
+    return AliasTable(turn_outcomes(threshold))
+
+
+@lru_cache(maxsize=None)
+def turn_scores(threshold: Threshold) -> dict[int, float]:
+    """The chance of each turn score, however many rolls it took."""
+    scores: dict[int, float] = defaultdict(float)
+    for (score, _), chance in turn_outcomes(threshold).items():
+        scores[score] += chance
+    return dict(scores)
+
+
+def convolve(a: dict[int, float], b: dict[int, float]) -> dict[int, float]:
+    """The distribution of the sum of two independent scores."""
+    total: dict[int, float] = defaultdict(float)
+    for x, p in a.items():
+        for y, q in b.items():
+            total[x + y] += p * q
+    return dict(total)
+
+
+@lru_cache(maxsize=None)
+def game_scores(threshold: Threshold, rounds: int = 10) -> dict[int, float]:
+    """Works out how likely each final score is after a number of rounds.
+
+    Args:
+        threshold (Threshold): The player's policy.
+        rounds (int, optional): The number of rounds. Defaults to 10.
+
+    Returns:
+        dict[int, float]: The chance of each final score.
+    """
+    if rounds == 0:
+        return {0: 1.0}
+    return convolve(game_scores(threshold, rounds - 1), turn_scores(threshold))
+
+
+def odds(players: list[Player], rounds: int = 10) -> Odds:
+    """Works out exactly how likely each of two players is to win.
+
+    Args:
+        players (list[Player]): The two players, who must both declare a
+        Threshold policy.
+        rounds (int, optional): The number of rounds per game. Defaults to 10.
+
+    Raises:
+        ValueError: If there aren't exactly two players, or a player doesn't
+        declare a Threshold policy.
+
+    Returns:
+        Odds: Each player's chance of winning, and the chance of a tie.
+    """
+    if len(players) != 2:
+        raise ValueError(f"Odds are for two players, not {len(players)}.")
+    policies = [policy(player) for player in players]
+    for player, declared in zip(players, policies):
+        if declared is None:
+            raise ValueError(f"{identify(player)} doesn't declare a Threshold policy.")
+    first = game_scores(policies[0], rounds)  # type: ignore
+    second = game_scores(policies[1], rounds)  # type: ignore
+
+    # The chance the second player scores below each total.
+    top = max(second)
+    below: dict[int, float] = {}
+    running = 0.0
+    for score in range(top + 2):
+        below[score] = running
+        running += second.get(score, 0.0)
+
+    first_wins = sum(
+        chance * below[min(score, top + 1)] for score, chance in first.items()
+    )
+    tie = sum(chance * second.get(score, 0.0) for score, chance in first.items())
+    return Odds(
+        players=tuple(identify(player) or "" for player in players),
+        wins=(first_wins, 1 - first_wins - tie),
+        tie=tie,
+    )
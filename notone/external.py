@@ -0,0 +1,262 @@
+"""Players written as separate programs, in any language, that decide over
+stdin and stdout.
+
+The protocol is line-delimited JSON. When the program starts, it writes one
+line introducing its player:
+
+    {"name": "External Eve", "emoji": "🛰️", "victory_cry": "Over and out."}
+
+After that, it reads one line at a time, each a list of game states, and
+answers each with one line listing its decisions in the same order:
+
+    [{"active": 0, "round": 3, "scores": [41, 35], "rolls": [12, 9],
+      "turn_rolls": 2, "turn_score": 17}, ...]
+    [true, ...]
+
+The program ends when its stdin closes. A program that takes longer than its
+timeout to answer is killed, forfeiting the games waiting on it, and restarted
+for the next message.
+
+Every game waiting on the player at the same moment is asked in one message, so
+the cost of a round trip is shared by all of them: with game.play_async() and
+tournament.play_async(), that's every concurrent game, and with the batch engine,
+every game in the batch. The engine only sends the next message once the last
+one is answered, so the next batch gathers while the program thinks.
+
+Load a player with load(), or by passing "external:<command>" wherever a player
+name is accepted, e.g. `notone -p "external:python eve.py"`.
+"""
+from __future__ import annotations
+
+import asyncio
+import json
+import queue
+import shlex
+import subprocess
+import threading
+from types import ModuleType
+from typing import IO, Any, Optional, Sequence, Union
+
+from notone.sandbox import Forfeit
+from notone.types import GameState, Player
+
+PREFIX = "external:"
+
+
+def encode(state: GameState) -> dict[str, Any]:
+    return {
+        "active": state.active,
+        "round": state.round,
+        "scores": list(state.scores),
+        "rolls": list(state.rolls),
+        "turn_rolls": state.turn_rolls,
+        "turn_score": state.turn_score,
+    }
+
+
+def pump(stdout: IO[str], lines: queue.Queue):
+    """Runs on a thread: passes on each line the program writes, then an empty
+    one when it exits."""
+    with stdout:
+        for line in stdout:
+            lines.put(line)
+    lines.put("")
+
+
+class ProgramError(Exception):
+    """Raised when an external player's program breaks the protocol or dies."""
+
+
+class Program:
+    def __init__(
+        self, command: Sequence[str], startup: float = 10.0, timeout: float = 10.0
+    ):
+        """Starts the program and reads its introduction.
+
+        Args:
+            command (Sequence[str]): The program and its arguments.
+            startup (float, optional): The most seconds the program may take to
+            introduce its player. Defaults to 10.
+            timeout (float, optional): The most seconds the program may take to
+            answer a message. Defaults to 10.
+
+        Raises:
+            ProgramError: If the program doesn't introduce its player.
+        """
+        self.command = list(command)
+        self.startup = startup
+        self.timeout = timeout
+        self.lock = threading.Lock()
+        self.pending: list[tuple[GameState, asyncio.Future]] = []
+        self.sender: Optional[asyncio.Task] = None
+        # How many messages have been sent, and how many states were in them.
+        self.messages = 0
+        self.decisions = 0
+        self.start()
+
+    def start(self):
+        self.process = subprocess.Popen(
+            self.command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+            encoding="utf-8",
+        )
+        # A thread reads the program's lines as they come, so waiting for one
+        # can have a deadline.
+        self.lines: queue.Queue[str] = queue.Queue()
+        threading.Thread(
+            target=pump, args=(self.process.stdout, self.lines), daemon=True
+        ).start()
+        try:
+            hello = self.read(self.startup)
+        except ProgramError:
+            hello = None
+        if not isinstance(hello, dict):
+            self.close()
+            raise ProgramError(f"{shlex.join(self.command)} didn't say hello.")
+        self.hello = hello
+
+    def read(self, timeout: float) -> Any:
+        """Waits for the program's next line, killing it if it takes too long.
+
+        Raises:
+            ProgramError: If the program is too slow, exits, or sends something
+            that isn't JSON.
+        """
+        try:
+            line = self.lines.get(timeout=timeout)
+        except queue.Empty:
+            self.kill()
+            raise ProgramError(
+                f"{shlex.join(self.command)} took longer than {timeout:g}s to answer."
+            ) from None
+        if not line:
+            raise ProgramError(f"{shlex.join(self.command)} exited.")
+        try:
+            return json.loads(line)
+        except ValueError:
+            raise ProgramError(f"{shlex.join(self.command)} sent {line!r}.") from None
+
+    def kill(self):
+        """Kills the program, waiting for it so the next message restarts it."""
+        self.process.kill()
+        self.process.wait()
+
+    def close(self):
+        if self.process.stdin:
+            try:
+                self.process.stdin.close()
+            except BrokenPipeError:
+                pass
+        try:
+            self.process.wait(timeout=1)
+        except subprocess.TimeoutExpired:
+            self.kill()
+
+    def decide(self, states: list[GameState]) -> list[bool]:
+        """Asks for a decision in every game, in one message.
+
+        Args:
+            states (list[GameState]): Each game's current state.
+
+        Raises:
+            ProgramError: If the program dies, answers wrongly, or takes longer
+            than its timeout. A fresh program starts for the next message.
+
+        Returns:
+            list[bool]: Whether to roll again in each game.
+        """
+        message = json.dumps([encode(state) for state in states], separators=(",", ":"))
+        with self.lock:
+            if self.process.poll() is not None:
+                self.close()
+                self.start()
+            self.messages += 1
+            self.decisions += len(states)
+            try:
+                self.process.stdin.write(message + "\n")  # type: ignore
+                self.process.stdin.flush()  # type: ignore
+                decisions = self.read(self.timeout)
+            except (BrokenPipeError, OSError):
+                raise ProgramError(f"{shlex.join(self.command)} exited.") from None
+            except ProgramError:
+                self.kill()
+                raise
+        if not isinstance(decisions, list) or len(decisions) != len(states):
+            raise ProgramError(
+                f"{shlex.join(self.command)} answered {len(states)} decisions "
+                f"with {decisions!r}."
+            )
+        return [bool(decision) for decision in decisions]
+
+    async def roll_again(self, state: GameState) -> bool:
+        """Queues a decision for the next message, waiting for its answer."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self.pending.append((state, future))
+        if self.sender is None or self.sender.done():
+            # Starts once every game that's ready to run has had its turn, so
+            # they all make it into the first message.
+            self.sender = loop.create_task(self.send())
+        return await future
+
+    async def send(self):
+        loop = asyncio.get_running_loop()
+        while self.pending:
+            batch, self.pending = self.pending, []
+            states = [state for state, _ in batch]
+            try:
+                decisions = await loop.run_in_executor(None, self.decide, states)
+            except ProgramError as e:
+                for state, future in batch:
+                    if not future.done():
+                        future.set_exception(Forfeit(state.active, str(e)))
+                continue
+            for (_, future), decision in zip(batch, decisions):
+                # A game that gave up waiting has cancelled its future.
+                if not future.done():
+                    future.set_result(decision)
+
+    def roll_again_batch(self, state: Any) -> list[bool]:
+        """Asks for every game in a notone.batch.BatchState in one message."""
+        return self.decide([state.game_state(i) for i in range(len(state))])
+
+
+def load(
+    command: Union[str, Sequence[str]], startup: float = 10.0, timeout: float = 10.0
+) -> Player:
+    """Starts an external player's program.
+
+    Args:
+        command (Union[str, Sequence[str]]): The program and its arguments, as a
+        list or a shell-style string.
+        startup (float, optional): The most seconds the program may take to
+        introduce its player. Defaults to 10.
+        timeout (float, optional): The most seconds the program may take to
+        answer a message; one that takes longer is killed, forfeiting every
+        game waiting on it, and restarted. Defaults to 10.
+
+    Raises:
+        ProgramError: If the program doesn't introduce its player.
+
+    Returns:
+        Player: A player module whose roll_again() is a coroutine function, for
+        game.play_async(), and with a roll_again_batch() for the batch engine.
+        Its program is attached as `program`; close it when done.
+    """
+    if isinstance(command, str):
+        command = shlex.split(command)
+    program = Program(command, startup, timeout)
+    player = ModuleType(PREFIX + shlex.join(command))
+
+    display_name = str(program.hello.get("name", command[0]))
+    emoji = str(program.hello.get("emoji", "🤖"))
+    victory_cry = str(program.hello.get("victory_cry", f"{display_name} wins!"))
+    player.name = lambda: display_name  # type: ignore
+    player.emoji = lambda: emoji  # type: ignore
+    player.victory_cry = lambda: victory_cry  # type: ignore
+    player.roll_again = program.roll_again  # type: ignore
+    player.roll_again_batch = program.roll_again_batch  # type: ignore
+    player.program = program  # type: ignore
+    return player
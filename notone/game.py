@@ -1,37 +1,54 @@
-import random
+import asyncio
+import inspect
+from array import array
 from dataclasses import asdict
-from typing import Iterator
-
-from notone import signals
+from typing import Callable, Iterator, Optional, Sequence
+
+from notone import dice as dice_sources
+from notone import exact, signals
+from notone.dice import Dice, RandomDice
+from notone.players import identify
+from notone.sandbox import Forfeit, Sandbox
+from notone.stats import DecisionStats
 from notone.types import (
+    Engine,
     GameState,
     IncrementableAttribute,
+    MutableGameState,
     Player,
     ResetableAttribute,
 )
 
 
-def roll_die() -> int:
+def roll_die(dice: Dice = dice_sources.default) -> int:
     """Rolls a single die by randomly selecting a value from 1-6.
 
+    Args:
+        dice (Dice, optional): The source of rolls. Defaults to the global
+        random number generator.
+
     Returns:
         int: The face value for the die.
     """
-    return random.randint(1, 6)
+    return dice.roll()
 
 
-def roll(state: GameState) -> GameState:
+def roll(state: GameState, dice: Dice = dice_sources.default) -> GameState:
     """Simulates rolling two dice.
 
     Args:
         state (GameState): The current game state.
+        dice (Dice, optional): The source of rolls. Defaults to the global
+        random number generator.
 
     Returns:
         GameState: The new game state, with the roll results saved and roll
         counter incremented.
     """
     increment_turn_rolls = increment(state, "turn_rolls", 1)
-    new_state = asdict(increment_turn_rolls) | {"roll": (roll_die(), roll_die())}
+    new_state = asdict(increment_turn_rolls) | {
+        "roll": (roll_die(dice), roll_die(dice))
+    }
     return GameState(**new_state)
 
 
@@ -137,10 +154,8 @@ def end_turn(state: GameState, active: int) -> GameState:
     """
     new_score = state.scores[active] + state.turn_score
     new_roll = state.rolls[active] + state.turn_rolls
-    new_scores = (
-        (state.scores[0], new_score) if active else (new_score, state.scores[1])
-    )
-    new_rolls = (state.rolls[0], new_roll) if active else (new_roll, state.rolls[1])
+    new_scores = state.scores[:active] + (new_score,) + state.scores[active + 1 :]
+    new_rolls = state.rolls[:active] + (new_roll,) + state.rolls[active + 1 :]
     new_state = asdict(state) | {
         "scores": new_scores,
         "rolls": new_rolls,
@@ -170,45 +185,491 @@ def select_winner(state: GameState) -> GameState:
     Returns:
         GameState: The new game state with the winner set.
     """
-    if state.scores[0] > state.scores[1]:
-        winner = 0
-    elif state.scores[1] > state.scores[0]:
-        winner = 1
-    else:
-        winner = None
-    new_state = asdict(state) | {"winner": winner}
+    new_state = asdict(state) | {"winner": leader(state.scores)}
     return GameState(**new_state)
 
 
-def play(players: list[Player], rounds=10) -> GameState:
-    state = GameState()
+def forfeit_game(state: GameState, active: int) -> GameState:
+    """Ends the game early, awarding it to the leader among the forfeiting
+    player's opponents.
+
+    Args:
+        state (GameState): The current game state.
+        active (int): The player who forfeits.
+
+    Returns:
+        GameState: The new game state with the winner set.
+    """
+    winner = leader(state.scores, exclude=active)
+    new_state = asdict(state) | {"winner": winner, "forfeited": active}
+    return GameState(**new_state)
+
+
+def leader(scores: Sequence[int], exclude: Optional[int] = None) -> Optional[int]:
+    """Finds the player with the highest total points.
+
+    Args:
+        scores (Sequence[int]): The total scores, indexed by player.
+        exclude (Optional[int], optional): A player who can't lead, like one
+        who forfeited. Defaults to None.
+
+    Returns:
+        Optional[int]: The index of the leading player, or None if two or more
+        players share the highest score.
+    """
+    best: Optional[int] = None
+    tied = False
+    for player, score in enumerate(scores):
+        if player == exclude:
+            continue
+        if best is None or score > scores[best]:
+            best, tied = player, False
+        elif score == scores[best]:
+            tied = True
+    return None if tied else best
+
+
+def new_game(num_players: int) -> GameState:
+    """The state a game starts in, with a score and roll count for every
+    player. There are always at least two, so a lone player can still be
+    measured against an opponent who scores nothing.
+
+    Args:
+        num_players (int): The number of players.
+
+    Returns:
+        GameState: The initial game state.
+    """
+    seats = max(num_players, 2)
+    return GameState(scores=(0,) * seats, rolls=(0,) * seats)
+
+
+def play_turn(
+    state: MutableGameState,
+    decide: Callable[[GameState], bool],
+    roll_die: Callable[[], int],
+    rolls: Optional[array],
+    send: Callable,
+):
+    """Plays out the active player's turn in the mutable engine, sending the
+    per-roll signals.
+
+    Args:
+        state (MutableGameState): The engine's current game state.
+        decide (Callable[[GameState], bool]): The player's decision function.
+        roll_die (Callable[[], int]): Rolls a die.
+        rolls (Optional[array]): Collects the turn's dice, if given.
+        send (Callable): The game's Dispatch.send().
+    """
+    while decide(state.snapshot()):
+        d1, d2 = roll_die(), roll_die()
+        state.record_roll(d1, d2)
+        if rolls is not None:
+            rolls.extend((d1, d2))
+        send(signals.rolled, state, d1=d1, d2=d2)
+        if failed(state, d1, d2):  # type: ignore
+            state.reset_turn_score()
+            send(signals.roll_failed, state, d1=d1, d2=d2)
+            return
+        state.add_turn_score(d1 + d2)
+        send(signals.roll_succeeded, state, d1=d1, d2=d2)
+
+
+def play_turn_quietly(
+    state: MutableGameState,
+    decide: Callable[[GameState], bool],
+    roll_die: Callable[[], int],
+    rolls: Optional[array],
+    send: Callable,
+):
+    """Plays out the active player's turn like play_turn(), for when nothing
+    listens to the per-roll signals, so it never sends them."""
+    while decide(state.snapshot()):
+        d1, d2 = roll_die(), roll_die()
+        state.record_roll(d1, d2)
+        if rolls is not None:
+            rolls.extend((d1, d2))
+        if failed(state, d1, d2):  # type: ignore
+            state.reset_turn_score()
+            return
+        state.add_turn_score(d1 + d2)
+
+
+def decides_async(player: Player) -> bool:
+    """Checks whether a player's roll_again() is a coroutine function, which
+    only play_async() can await."""
+    return inspect.iscoroutinefunction(getattr(player, "roll_again", None))
+
+
+def deciders(
+    players: list[Player],
+    stats: Optional[DecisionStats] = None,
+    sandbox: Optional[Sandbox] = None,
+) -> list[Callable[[GameState], bool]]:
+    """Looks up each player's roll_again() once per game, sandboxed and timed
+    if asked, so the engines' inner loops don't have to check.
+
+    Args:
+        players (list[Player]): The players, in seat order.
+        stats (Optional[DecisionStats], optional): Times every call. Defaults
+        to None.
+        sandbox (Optional[Sandbox], optional): Runs every call under a time
+        budget. Defaults to None.
+
+    Raises:
+        ValueError: If a player's roll_again() is a coroutine function.
+
+    Returns:
+        list[Callable[[GameState], bool]]: Each player's decision function.
+    """
+    for player in players:
+        if decides_async(player):
+            raise ValueError(
+                f"{identify(player)} decides asynchronously; use play_async()."
+            )
+    if sandbox:
+        decide = sandbox.deciders(players)
+    else:
+        decide = [player.roll_again for player in players]
+    if stats:
+        decide = [stats.timed(p, roll_again) for p, roll_again in zip(players, decide)]
+    return decide
+
+
+def play(
+    players: list[Player],
+    rounds=10,
+    engine: Engine = "frozen",
+    dice: Dice = dice_sources.default,
+    stats: Optional[DecisionStats] = None,
+    sandbox: Optional[Sandbox] = None,
+) -> GameState:
+    """Plays a game of Not One.
+
+    Args:
+        players (list[Player]): The players, in turn order for odd rounds.
+        rounds (int, optional): The number of rounds to play. Defaults to 10.
+        engine (Engine, optional): "frozen" rebuilds an immutable GameState on
+        every transition; "mutable" updates a slot-based state in place and
+        only snapshots it for players and connected signal receivers, and
+        plays turns without sending per-roll signals when nothing listens to
+        them. Both produce identical games for the same dice. "sampled" is the mutable
+        engine, except that players who declare a Threshold policy play each
+        turn in a single draw from its exact outcomes. Defaults to "frozen".
+        dice (Dice, optional): The source of rolls. Defaults to the global
+        random number generator.
+        stats (Optional[DecisionStats], optional): Times every roll_again()
+        call. Defaults to None.
+        sandbox (Optional[Sandbox], optional): Runs every roll_again() call in
+        a worker process under a time budget; a player who breaks the budget
+        forfeits the game. Defaults to None.
+
+    Returns:
+        GameState: The final game state.
+    """
+    if engine == "mutable":
+        return play_mutable(players, rounds, dice, stats, sandbox)
+    if engine == "sampled":
+        return play_sampled(players, rounds, dice, stats, sandbox)
+
+    decide = deciders(players, stats, sandbox)
+    state = new_game(len(players))
+    completed = signals.Dispatch().has_receivers(signals.turn_completed)
     signals.game_started.send(state)
 
-    for round in range(1, rounds + 1):
-        state = start_round(state, round)
-        signals.round_started.send(state, round=round)
-
-        for active in turn_order(len(players), round):
-            player = players[active]
-            state = start_turn(state, active)
-            signals.turn_started.send(state, player=player)
-
-            while player.roll_again(state):
-                state = roll(state)
-                d1, d2 = state.roll
-                signals.rolled.send(state, d1=d1, d2=d2)
-                if failed(state, d1, d2):
-                    state = reset(state, "turn_score")
-                    signals.roll_failed.send(state, d1=d1, d2=d2)
-                    break
-                state = increment(state, "turn_score", d1 + d2)
-                signals.roll_succeeded.send(state, d1=d1, d2=d2)
-            state = end_turn(state, active)
-            signals.turn_ended.send(state, player=player)
-
-        end_round(state)
-        signals.round_ended.send(state, round=round)
-
-    state = select_winner(state)
+    try:
+        for round in range(1, rounds + 1):
+            state = start_round(state, round)
+            signals.round_started.send(state, round=round)
+
+            for active in turn_order(len(players), round):
+                player = players[active]
+                state = start_turn(state, active)
+                signals.turn_started.send(state, player=player)
+                rolls = array("B") if completed else None
+
+                while decide[active](state):
+                    state = roll(state, dice)
+                    d1, d2 = state.roll
+                    if rolls is not None:
+                        rolls.extend((d1, d2))
+                    signals.rolled.send(state, d1=d1, d2=d2)
+                    if failed(state, d1, d2):
+                        state = reset(state, "turn_score")
+                        signals.roll_failed.send(state, d1=d1, d2=d2)
+                        break
+                    state = increment(state, "turn_score", d1 + d2)
+                    signals.roll_succeeded.send(state, d1=d1, d2=d2)
+                state = end_turn(state, active)
+                signals.turn_ended.send(state, player=player)
+                if rolls is not None:
+                    signals.turn_completed.send(state, player=player, rolls=rolls)
+
+            end_round(state)
+            signals.round_ended.send(state, round=round)
+    except Forfeit as forfeit:
+        state = forfeit_game(state, forfeit.player)
+    else:
+        state = select_winner(state)
     signals.game_ended.send(state, players=players)
     return state
+
+
+def play_mutable(
+    players: list[Player],
+    rounds=10,
+    dice: Dice = dice_sources.default,
+    stats: Optional[DecisionStats] = None,
+    sandbox: Optional[Sandbox] = None,
+) -> GameState:
+    roll_die = dice.roll
+    decide = deciders(players, stats, sandbox)
+    state = MutableGameState(new_game(len(players)))
+    dispatch = signals.Dispatch()
+    send = dispatch.send
+    turn = play_turn if dispatch.has_receivers(*signals.per_roll) else play_turn_quietly
+    completed = dispatch.has_receivers(signals.turn_completed)
+    send(signals.game_started, state)
+
+    try:
+        for round in range(1, rounds + 1):
+            state.start_round(round)
+            send(signals.round_started, state, round=round)
+
+            for active in turn_order(len(players), round):
+                player = players[active]
+                state.start_turn(active)
+                send(signals.turn_started, state, player=player)
+
+                rolls = array("B") if completed else None
+                turn(state, decide[active], roll_die, rolls, send)
+                state.end_turn(active)
+                send(signals.turn_ended, state, player=player)
+                if rolls is not None:
+                    send(signals.turn_completed, state, player=player, rolls=rolls)
+
+            send(signals.round_ended, state, round=round)
+    except Forfeit as forfeit:
+        state.forfeit(forfeit.player, leader(state.scores, exclude=forfeit.player))
+    else:
+        state.set_winner(leader(state.scores))
+    final = state.snapshot()
+    signals.game_ended.send(final, players=players)
+    return final
+
+
+def play_sampled(
+    players: list[Player],
+    rounds=10,
+    dice: Dice = dice_sources.default,
+    stats: Optional[DecisionStats] = None,
+    sandbox: Optional[Sandbox] = None,
+) -> GameState:
+    """Plays like play_mutable(), but a player who declares a Threshold policy
+    plays each turn in one draw from an alias table of its exact outcomes. Their
+    turns send turn_started and turn_ended, with the right totals, but no roll
+    signals, and roll_again() is never called. With no dice to report, they
+    don't send turn_completed either. Other players roll die by die.
+    """
+    roll_die = dice.roll
+    uniform = dice.random
+    decide = deciders(players, stats, sandbox)
+    tables = [
+        None if policy is None else exact.turn_table(policy)
+        for policy in map(exact.policy, players)
+    ]
+    state = MutableGameState(new_game(len(players)))
+    dispatch = signals.Dispatch()
+    send = dispatch.send
+    turn = play_turn if dispatch.has_receivers(*signals.per_roll) else play_turn_quietly
+    completed = dispatch.has_receivers(signals.turn_completed)
+    send(signals.game_started, state)
+
+    try:
+        for round in range(1, rounds + 1):
+            state.start_round(round)
+            send(signals.round_started, state, round=round)
+
+            for active in turn_order(len(players), round):
+                player = players[active]
+                state.start_turn(active)
+                send(signals.turn_started, state, player=player)
+
+                table = tables[active]
+                if table is not None:
+                    state.record_turn(*table.sample(uniform()))
+                    state.end_turn(active)
+                    # A drawn turn has no dice, so it doesn't send
+                    # turn_completed, which promises them.
+                    send(signals.turn_ended, state, player=player)
+                    continue
+
+                rolls = array("B") if completed else None
+                turn(state, decide[active], roll_die, rolls, send)
+                state.end_turn(active)
+                send(signals.turn_ended, state, player=player)
+                if rolls is not None:
+                    send(signals.turn_completed, state, player=player, rolls=rolls)
+
+            send(signals.round_ended, state, round=round)
+    except Forfeit as forfeit:
+        state.forfeit(forfeit.player, leader(state.scores, exclude=forfeit.player))
+    else:
+        state.set_winner(leader(state.scores))
+    final = state.snapshot()
+    signals.game_ended.send(final, players=players)
+    return final
+
+
+def play_headless(
+    players: list[Player],
+    rounds=10,
+    dice: Dice = dice_sources.default,
+    stats: Optional[DecisionStats] = None,
+    sandbox: Optional[Sandbox] = None,
+) -> GameState:
+    roll_die = dice.roll
+    decide = deciders(players, stats, sandbox)
+    state = MutableGameState(new_game(len(players)))
+
+    try:
+        for round in range(1, rounds + 1):
+            state.start_round(round)
+            for active in turn_order(len(players), round):
+                state.start_turn(active)
+                while decide[active](state.snapshot()):
+                    d1, d2 = roll_die(), roll_die()
+                    state.record_roll(d1, d2)
+                    if failed(state, d1, d2):  # type: ignore
+                        state.reset_turn_score()
+                        break
+                    state.add_turn_score(d1 + d2)
+                state.end_turn(active)
+    except Forfeit as forfeit:
+        state.forfeit(forfeit.player, leader(state.scores, exclude=forfeit.player))
+    else:
+        state.set_winner(leader(state.scores))
+    return state.snapshot()
+
+
+def simulate(
+    players: list[Player],
+    rounds=10,
+    seed: Optional[int] = None,
+    headless: Optional[bool] = None,
+    dice: Optional[Dice] = None,
+    stats: Optional[DecisionStats] = None,
+    sandbox: Optional[Sandbox] = None,
+) -> GameState:
+    """Plays a game of Not One as fast as possible, for batch runs.
+
+    Args:
+        players (list[Player]): The players, in turn order for odd rounds.
+        rounds (int, optional): The number of rounds to play. Defaults to 10.
+        seed (Optional[int], optional): Seeds a private random number generator
+        for the game. The game matches play() after random.seed(seed). Defaults
+        to None, which uses the global random number generator.
+        dice (Optional[Dice], optional): The source of rolls, instead of a
+        seed. Defaults to None.
+        headless (Optional[bool], optional): Whether to skip sending signals
+        entirely. Defaults to None, which goes headless only if nothing is
+        connected to any of the Not One signals.
+        stats (Optional[DecisionStats], optional): Times every roll_again()
+        call. Defaults to None.
+        sandbox (Optional[Sandbox], optional): Runs every roll_again() call in
+        a worker process under a time budget; a player who breaks the budget
+        forfeits the game. Defaults to None.
+
+    Returns:
+        GameState: The final game state.
+    """
+    if dice is None:
+        dice = dice_sources.default if seed is None else RandomDice(seed)
+    if headless is None:
+        headless = not signals.has_receivers()
+    if headless:
+        return play_headless(players, rounds, dice, stats, sandbox)
+    return play_mutable(players, rounds, dice, stats, sandbox)
+
+
+async def play_async(
+    players: list[Player],
+    rounds=10,
+    dice: Dice = dice_sources.default,
+    timeout: Optional[float] = None,
+) -> GameState:
+    """Plays a game of Not One on the running event loop, for players whose
+    `roll_again()` is a coroutine function, say because it asks a server.
+    While one of them waits for an answer, other games on the same loop carry
+    on. Regular players work too, and are called directly.
+
+    Moves and signals match play(engine="mutable") for the same dice, though
+    signals from concurrent games interleave.
+
+    Args:
+        players (list[Player]): The players, in turn order for odd rounds.
+        rounds (int, optional): The number of rounds to play. Defaults to 10.
+        dice (Dice, optional): The source of rolls. Give each concurrent game
+        its own, so games don't depend on how they're scheduled. Defaults to
+        the global random number generator.
+        timeout (Optional[float], optional): The most seconds to wait for any
+        one decision; a player who takes longer forfeits the game. Defaults to
+        None, no limit.
+
+    Returns:
+        GameState: The final game state.
+    """
+    roll_die = dice.roll
+    decide = [player.roll_again for player in players]
+    state = MutableGameState(new_game(len(players)))
+    dispatch = signals.Dispatch()
+    send = dispatch.send
+    completed = dispatch.has_receivers(signals.turn_completed)
+    send(signals.game_started, state)
+
+    try:
+        for round in range(1, rounds + 1):
+            state.start_round(round)
+            send(signals.round_started, state, round=round)
+
+            for active in turn_order(len(players), round):
+                player = players[active]
+                state.start_turn(active)
+                send(signals.turn_started, state, player=player)
+                rolls = array("B") if completed else None
+
+                while True:
+                    decision = decide[active](state.snapshot())
+                    if inspect.isawaitable(decision):
+                        try:
+                            decision = await asyncio.wait_for(decision, timeout)
+                        except asyncio.TimeoutError:
+                            raise Forfeit(
+                                active, f"took longer than {timeout:g}s to decide"
+                            ) from None
+                    if not decision:
+                        break
+                    d1, d2 = roll_die(), roll_die()
+                    state.record_roll(d1, d2)
+                    if rolls is not None:
+                        rolls.extend((d1, d2))
+                    send(signals.rolled, state, d1=d1, d2=d2)
+                    if failed(state, d1, d2):  # type: ignore
+                        state.reset_turn_score()
+                        send(signals.roll_failed, state, d1=d1, d2=d2)
+                        break
+                    state.add_turn_score(d1 + d2)
+                    send(signals.roll_succeeded, state, d1=d1, d2=d2)
+                state.end_turn(active)
+                send(signals.turn_ended, state, player=player)
+                if rolls is not None:
+                    send(signals.turn_completed, state, player=player, rolls=rolls)
+
+            send(signals.round_ended, state, round=round)
+    except Forfeit as forfeit:
+        state.forfeit(forfeit.player, leader(state.scores, exclude=forfeit.player))
+    else:
+        state.set_winner(leader(state.scores))
+    final = state.snapshot()
+    signals.game_ended.send(final, players=players)
+    return final
@@ -0,0 +1,237 @@
+"""Round-robin leagues: every player plays every other player many times, which
+ranks a field far more reliably than a single-elimination bracket.
+
+Each pairing plays half its games with each player going first, on a pool of
+processes. Every pairing's random numbers come from the master seed and the two
+players' names, so a league can grow incrementally—only the new pairings are
+played—and still match a league played from scratch. A league remembers the
+seed, games per pairing and rounds it was played with, and only grows with the
+same ones.
+"""
+from __future__ import annotations
+
+import json
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Optional
+
+import numpy as np
+
+from notone import montecarlo
+
+
+@dataclass(frozen=True)
+class League:
+    players: tuple[str, ...]
+    # wins[i, j] is how many games player i has won against player j.
+    wins: np.ndarray
+    # games[i, j] is how many games players i and j have played each other.
+    games: np.ndarray
+    # What every pairing was played with; None if unknown.
+    seed: Optional[int] = None
+    pairing_games: Optional[int] = None
+    rounds: Optional[int] = None
+
+    @property
+    def ties(self) -> np.ndarray:
+        return self.games - self.wins - self.wins.T
+
+    @property
+    def win_rates(self) -> np.ndarray:
+        """The share of games each player won against each other player, with
+        ties counting as half a win. Unplayed pairings are NaN."""
+        with np.errstate(invalid="ignore", divide="ignore"):
+            return (self.wins + self.ties / 2) / self.games
+
+    def played(self, a: str, b: str) -> bool:
+        i, j = self.players.index(a), self.players.index(b)
+        return bool(self.games[i, j])
+
+    def save(self, path: Path):
+        data = {
+            "players": list(self.players),
+            "wins": self.wins.tolist(),
+            "games": self.games.tolist(),
+            "seed": self.seed,
+            "pairing_games": self.pairing_games,
+            "rounds": self.rounds,
+        }
+        Path(path).write_text(json.dumps(data))
+
+    @classmethod
+    def load(cls, path: Path) -> League:
+        data = json.loads(Path(path).read_text())
+        return cls(
+            players=tuple(data["players"]),
+            wins=np.array(data["wins"], dtype=np.int64),
+            games=np.array(data["games"], dtype=np.int64),
+            seed=data.get("seed"),
+            pairing_games=data.get("pairing_games"),
+            rounds=data.get("rounds"),
+        )
+
+
+def empty(
+    players: list[str],
+    seed: Optional[int] = None,
+    pairing_games: Optional[int] = None,
+    rounds: Optional[int] = None,
+) -> League:
+    size = len(players)
+    return League(
+        players=tuple(players),
+        wins=np.zeros((size, size), dtype=np.int64),
+        games=np.zeros((size, size), dtype=np.int64),
+        seed=seed,
+        pairing_games=pairing_games,
+        rounds=rounds,
+    )
+
+
+def extend(league: League, players: list[str]) -> League:
+    """Adds any new players to a league, keeping all the results so far."""
+    names = list(league.players) + [p for p in players if p not in league.players]
+    extended = empty(names, league.seed, league.pairing_games, league.rounds)
+    size = len(league.players)
+    extended.wins[:size, :size] = league.wins
+    extended.games[:size, :size] = league.games
+    return extended
+
+
+def pairing_seed(seed: int, a: str, b: str) -> np.random.SeedSequence:
+    """Derives a pairing's seed from the master seed and the players' names, so
+    it doesn't depend on who else is in the league."""
+    return np.random.SeedSequence(
+        [seed, zlib.crc32(a.encode()), zlib.crc32(b.encode())]
+    )
+
+
+def play_pairing(
+    a: str, b: str, games: int, rounds: int, seed: np.random.SeedSequence
+) -> tuple[int, int]:
+    """Plays a pairing, half the games with each player going first.
+
+    Returns:
+        tuple[int, int]: The games won by a and by b.
+    """
+    first, second = seed.spawn(2)
+    a_first = montecarlo.play_shard((a, b), games - games // 2, rounds, first)
+    b_first = montecarlo.play_shard((b, a), games // 2, rounds, second)
+    return (
+        int(a_first.wins[0] + b_first.wins[1]),
+        int(a_first.wins[1] + b_first.wins[0]),
+    )
+
+
+def play(
+    players: list[str],
+    games: int = 1_000,
+    rounds=10,
+    seed: int = 0,
+    previous: Optional[League] = None,
+    workers: Optional[int] = None,
+) -> League:
+    """Plays a round-robin league.
+
+    Args:
+        players (list[str]): The players' short names or module paths.
+        games (int, optional): The number of games per pairing. Defaults to
+        1,000.
+        rounds (int, optional): The number of rounds per game. Defaults to 10.
+        seed (int, optional): The master seed. Defaults to 0.
+        previous (Optional[League], optional): An earlier league to build on,
+        played with the same games, rounds and seed; only pairings it hasn't
+        played yet are played. Defaults to None.
+        workers (Optional[int], optional): The number of worker processes; 1
+        plays every pairing in this process. Defaults to None, one per CPU.
+
+    Raises:
+        ValueError: If `previous` was played with a different number of games,
+        rounds or seed.
+
+    Returns:
+        League: The results of every pairing.
+    """
+    settings = (seed, games, rounds)
+    if previous is None:
+        league = empty(players, *settings)
+    elif (previous.seed, previous.pairing_games, previous.rounds) != settings:
+        raise ValueError(
+            f"The previous league was played with seed {previous.seed}, "
+            f"{previous.pairing_games} games per pairing and {previous.rounds} "
+            f"rounds, not seed {seed}, {games} games and {rounds} rounds."
+        )
+    else:
+        league = extend(previous, players)
+    pairings = [
+        (a, b)
+        for i, a in enumerate(league.players)
+        for b in league.players[i + 1 :]
+        if not league.played(a, b)
+    ]
+    args = (
+        [a for a, _ in pairings],
+        [b for _, b in pairings],
+        [games] * len(pairings),
+        [rounds] * len(pairings),
+        [pairing_seed(seed, a, b) for a, b in pairings],
+    )
+
+    if workers == 1 or len(pairings) <= 1:
+        results = list(map(play_pairing, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            results = list(pool.map(play_pairing, *args))
+
+    for (a, b), (a_wins, b_wins) in zip(pairings, results):
+        i, j = league.players.index(a), league.players.index(b)
+        league.wins[i, j] += a_wins
+        league.wins[j, i] += b_wins
+        league.games[i, j] += games
+        league.games[j, i] += games
+    return league
+
+
+def bradley_terry(league: League, iterations: int = 1_000) -> np.ndarray:
+    """Fits Bradley-Terry strengths to the league results, where player i beats
+    player j with probability s[i] / (s[i] + s[j]). Ties count as half a win.
+
+    Args:
+        league (League): The league results.
+        iterations (int, optional): The most iterations of the minorization-
+        maximization algorithm to run. Defaults to 1,000.
+
+    Returns:
+        np.ndarray: Each player's strength, with a geometric mean of 1.
+    """
+    scores = league.wins + league.ties / 2
+    total_wins = scores.sum(axis=1)
+    strengths = np.ones(len(league.players))
+    for _ in range(iterations):
+        pairs = strengths[:, None] + strengths[None, :]
+        denominator = (league.games / pairs).sum(axis=1)
+        updated = np.where(denominator > 0, total_wins / denominator, strengths)
+        # A player who never wins would collapse to zero strength.
+        updated = np.maximum(updated, 1e-9)
+        updated /= np.exp(np.log(updated).mean())
+        if np.allclose(updated, strengths, rtol=1e-10, atol=0):
+            return updated
+        strengths = updated
+    return strengths
+
+
+def elo(strengths: np.ndarray, average: float = 1_500) -> np.ndarray:
+    """Puts Bradley-Terry strengths on the familiar Elo scale, where a 400
+    point gap means 10-to-1 odds.
+
+    Args:
+        strengths (np.ndarray): Bradley-Terry strengths.
+        average (float, optional): The average rating. Defaults to 1,500.
+
+    Returns:
+        np.ndarray: Each player's Elo rating.
+    """
+    ratings = 400 * np.log10(strengths)
+    return ratings - ratings.mean() + average
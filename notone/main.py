@@ -6,24 +6,222 @@ on how to work with this code, including setting up your Not One player:
 
 https://github.com/mednax-it/kata-notone#creating-your-own-player
 """
+import asyncio
+from pathlib import Path
+from typing import List, Optional
+
 import typer
 
-from notone import console, game, players, tournament
+from notone import console, game, players, registry, tournament
+from notone import dice as dice_sources
+from notone.dice import RandomDice
+from notone.players import resolve
+from notone.sandbox import Sandbox
+from notone.stats import DecisionStats
+from notone.types import Engine, GameType
+
+app = typer.Typer()
 
 
-def main():
+@app.callback(invoke_without_command=True)
+def main(
+    ctx: typer.Context,
+    seed: Optional[int] = typer.Option(None, help="Seed for reproducible runs."),
+    parallel: bool = typer.Option(
+        False, help="Play each tournament round's matchups in parallel."
+    ),
+    results: Optional[Path] = typer.Option(
+        None, help="A SQLite database to record every game's result in."
+    ),
+    buffered: bool = typer.Option(
+        False, help="Print from a background thread so the games never wait."
+    ),
+    interactive: bool = typer.Option(True, help="Pause between tournament rounds."),
+    runs: int = typer.Option(1, help="How many games (or tournaments) to play."),
+    summary: bool = typer.Option(
+        False, help="Show live totals instead of narrating every roll."
+    ),
+    profile: bool = typer.Option(
+        False, help="Time every player's decisions and report the slowest."
+    ),
+    time_limit: Optional[float] = typer.Option(
+        None,
+        help="Seconds a player may take per decision before forfeiting the game.",
+    ),
+    game_time_limit: Optional[float] = typer.Option(
+        None, help="Seconds a player may spend deciding per game."
+    ),
+    player: Optional[List[str]] = typer.Option(
+        None,
+        "--player",
+        "-p",
+        help="A player to play: a name, module path, glob like 'p1*', or spec file.",
+    ),
+    config: Optional[Path] = typer.Option(
+        None, help="A JSON or TOML file listing the players to play."
+    ),
+    free_for_all: bool = typer.Option(
+        False, help="Play every player in one game instead of a tournament."
+    ),
+):
+    """Plays a game, or a tournament if more than two players are loaded."""
+    if ctx.invoked_subcommand is not None:
+        return
+    store = None
+    sandbox = None
     try:
-        opponents = players.load()
-        if len(opponents) > 2:
-            console.connect_output("tournament")
-            tournament.play(opponents)
+        if results:
+            from notone.results import ResultsStore
+
+            store = ResultsStore(results)
+            store.connect()
+        patterns = list(player or [])
+        if config:
+            patterns += registry.read_config(config)
+        opponents = players.load(patterns)
+        is_tournament = len(opponents) > 2 and not free_for_all
+        asynchronous = any(game.decides_async(player) for player in opponents)
+        if asynchronous and (profile or game_time_limit is not None):
+            raise ValueError(
+                "Players who decide asynchronously, like external players, "
+                "can't be profiled or given a --game-time-limit; "
+                "--time-limit still applies."
+            )
+        engine: Engine = "mutable" if summary else "frozen"
+        if summary:
+            unit: GameType = "tournament" if is_tournament else "game"
+            console.connect_summary(total=runs, unit=unit)
+        elif is_tournament:
+            console.connect_output("tournament", buffered, interactive)
         else:
-            console.connect_output("game")
-            game.play(opponents)
+            console.connect_output("game", buffered)
+
+        dice = dice_sources.default if seed is None else RandomDice(seed)
+        stats = DecisionStats() if profile else None
+        timeout = None
+        if asynchronous:
+            # play_async() enforces the per-decision limit itself.
+            timeout = time_limit
+        elif time_limit is not None or game_time_limit is not None:
+            sandbox = Sandbox(per_call=time_limit, per_game=game_time_limit)
+        for run in range(runs):
+            if is_tournament:
+                tournament.play(
+                    opponents,
+                    seed=None if seed is None else seed + run,
+                    parallel=parallel,
+                    engine=engine,
+                    stats=stats,
+                    sandbox=sandbox,
+                    timeout=timeout,
+                )
+            elif asynchronous:
+                asyncio.run(game.play_async(opponents, dice=dice, timeout=timeout))
+            else:
+                game.play(
+                    opponents, engine=engine, dice=dice, stats=stats, sandbox=sandbox
+                )
+        if stats:
+            console.flush()
+            console.show_decision_stats(stats)
+    except Exception as e:
+        console.error(e)
+        raise typer.Exit(code=1) from e
+    finally:
+        console.close()
+        if sandbox:
+            sandbox.close()
+        if store:
+            store.close()
+
+
+@app.command("players")
+def list_players(
+    patterns: Optional[List[str]] = typer.Argument(
+        None, help="Globs like 'p1*' to narrow the list."
+    ),
+):
+    """Lists the available players, without importing any of them."""
+    try:
+        chosen = registry.select(patterns) if patterns else registry.discover().values()
+    except Exception as e:
+        console.error(e)
+        raise typer.Exit(code=1) from e
+    for name in chosen:
+        console.echo(name)
+
+
+@app.command()
+def montecarlo(
+    players: List[str] = typer.Argument(
+        ..., help="Player names (e.g. aggro_aiden) or module paths."
+    ),
+    games: int = typer.Option(1_000_000, help="The number of games to play."),
+    seed: Optional[int] = typer.Option(None, help="Seed for reproducible runs."),
+    workers: Optional[int] = typer.Option(
+        None, help="Worker processes; defaults to one per CPU."
+    ),
+):
+    """Estimates head-to-head win rates over many games."""
+    try:
+        from notone import montecarlo
+
+        result = montecarlo.run(players, games, seed=seed, workers=workers)
+    except Exception as e:
+        console.error(e)
+        raise typer.Exit(code=1) from e
+    console.show_matchup(result)
+
+
+@app.command()
+def odds(
+    players: List[str] = typer.Argument(
+        ..., help="Two player names (e.g. aggro_aiden) or module paths."
+    ),
+    rounds: int = typer.Option(10, help="The number of rounds per game."),
+):
+    """Works out exact head-to-head odds for players with a Threshold policy."""
+    try:
+        from notone import exact
+
+        result = exact.odds([resolve(player) for player in players], rounds)
+    except Exception as e:
+        console.error(e)
+        raise typer.Exit(code=1) from e
+    console.show_odds(result)
+
+
+@app.command()
+def league(
+    players: List[str] = typer.Argument(
+        ..., help="Player names (e.g. aggro_aiden) or module paths."
+    ),
+    games: int = typer.Option(1_000, help="The number of games per pairing."),
+    seed: int = typer.Option(0, help="Seed for reproducible runs."),
+    table: Optional[Path] = typer.Option(
+        None,
+        help="A league file to build on and update; only new pairings are played.",
+    ),
+    workers: Optional[int] = typer.Option(
+        None, help="Worker processes; defaults to one per CPU."
+    ),
+):
+    """Plays a round-robin league and rates every player."""
+    try:
+        from notone import league
+
+        previous = league.League.load(table) if table and table.exists() else None
+        results = league.play(
+            players, games, seed=seed, previous=previous, workers=workers
+        )
+        if table:
+            results.save(table)
+        ratings = league.elo(league.bradley_terry(results))
     except Exception as e:
         console.error(e)
         raise typer.Exit(code=1) from e
+    console.show_league(results, ratings)
 
 
 if __name__ == "__main__":
-    typer.run(main)
+    app()
@@ -0,0 +1,144 @@
+"""Estimates head-to-head win rates by playing lots of games across multiple
+processes.
+
+Games are split into fixed-size shards and every shard gets its own random
+number stream spawned from a single master seed, so results only depend on the
+seed and the number of games—not on how many workers played them.
+"""
+from __future__ import annotations
+
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from typing import Iterable, Optional
+
+import numpy as np
+
+from notone import batch
+from notone.players import resolve
+
+SHARD_SIZE = 50_000
+
+
+@dataclass(frozen=True)
+class MatchupResult:
+    players: tuple[str, ...]
+    games: int
+    wins: np.ndarray
+    ties: int
+    # How many games ended with each final score, one row per player.
+    score_counts: np.ndarray
+    # The master seed, which replays the whole matchup; None for a single shard.
+    seed: Optional[int] = None
+
+    @property
+    def win_rates(self) -> np.ndarray:
+        return self.wins / self.games if self.games else self.wins * 0.0
+
+    @property
+    def tie_rate(self) -> float:
+        return self.ties / self.games if self.games else 0.0
+
+    @property
+    def mean_scores(self) -> np.ndarray:
+        points = np.arange(self.score_counts.shape[1])
+        return (self.score_counts * points).sum(axis=1) / max(self.games, 1)
+
+
+def play_shard(
+    players: tuple[str, ...], n_games: int, rounds: int, seed: np.random.SeedSequence
+) -> MatchupResult:
+    """Plays one shard of games. This runs in a worker process, so players are
+    passed by module name and imported here.
+    """
+    modules = [resolve(player) for player in players]
+    result = batch.simulate(modules, n_games, rounds=rounds, seed=seed)
+    width = int(result.scores.max(initial=0)) + 1
+    score_counts = np.stack(
+        [np.bincount(result.scores[:, i], minlength=width) for i in range(len(players))]
+    )
+    return MatchupResult(
+        players=players,
+        games=result.games,
+        wins=result.wins[: len(players)],
+        ties=result.ties,
+        score_counts=score_counts,
+    )
+
+
+def merge(results: Iterable[MatchupResult]) -> MatchupResult:
+    """Combines the results of several shards of the same matchup.
+
+    Args:
+        results (Iterable[MatchupResult]): The results to combine.
+
+    Returns:
+        MatchupResult: The combined result.
+    """
+    results = list(results)
+    width = max(result.score_counts.shape[1] for result in results)
+    score_counts = sum(
+        np.pad(result.score_counts, ((0, 0), (0, width - result.score_counts.shape[1])))
+        for result in results
+    )
+    return MatchupResult(
+        players=results[0].players,
+        games=sum(result.games for result in results),
+        wins=sum(result.wins for result in results),  # type: ignore
+        ties=sum(result.ties for result in results),
+        score_counts=score_counts,  # type: ignore
+    )
+
+
+def shard_sizes(n_games: int, shard_size: int) -> list[int]:
+    full, remainder = divmod(n_games, shard_size)
+    return [shard_size] * full + ([remainder] if remainder else [])
+
+
+def run(
+    players: list[str],
+    n_games: int,
+    rounds=10,
+    seed: Optional[int] = None,
+    workers: Optional[int] = None,
+    shard_size: int = SHARD_SIZE,
+) -> MatchupResult:
+    """Plays a matchup many times over, spread across a pool of processes.
+
+    Args:
+        players (list[str]): The players' short names or module paths, in turn
+        order for odd rounds.
+        n_games (int): The number of games to play.
+        rounds (int, optional): The number of rounds per game. Defaults to 10.
+        seed (Optional[int], optional): The master seed; the same seed always
+        produces the same result. Defaults to None, which draws a fresh one
+        and reports it in the result.
+        workers (Optional[int], optional): The number of worker processes; 1
+        plays every shard in this process. Defaults to None, one per CPU.
+        shard_size (int, optional): The number of games per shard. Defaults to
+        SHARD_SIZE.
+
+    Returns:
+        MatchupResult: The combined result of every game.
+    """
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    names = tuple(players)
+    sizes = shard_sizes(n_games, shard_size)
+    if not sizes:
+        return MatchupResult(
+            players=names,
+            games=0,
+            wins=np.zeros(len(names), dtype=np.int64),
+            ties=0,
+            score_counts=np.zeros((len(names), 1), dtype=np.int64),
+            seed=seed,
+        )
+    seeds = np.random.SeedSequence(seed).spawn(len(sizes))
+    args = ([names] * len(sizes), sizes, [rounds] * len(sizes), seeds)
+
+    if workers == 1 or len(sizes) == 1:
+        result = merge(map(play_shard, *args))
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            result = merge(pool.map(play_shard, *args))
+    return replace(result, seed=seed)
@@ -1,11 +1,23 @@
-from importlib import import_module as add
+from importlib import import_module
+from typing import Optional, Sequence
 
 from notone.types import Player
 
 """Update the list below to change which players will play the game."""
 
 
-def load() -> list[Player]:
+def add(name: str) -> Player:
+    """Adds a player by module path, or by the path of a strategy spec file (see
+    notone.strategy)."""
+    return resolve(name)
+
+
+def load(patterns: Optional[Sequence[str]] = None) -> list[Player]:
+    if patterns:
+        # Only the chosen players are imported; see notone.registry.
+        from notone import registry
+
+        return [resolve(name) for name in registry.select(patterns)]
     return [
         add("notone.players.aggro_aiden"),
         add("notone.players.cautious_carter"),
@@ -26,3 +38,45 @@ def load() -> list[Player]:
         # add("notone.players.p15"),
         # add("notone.players.p16"),
     ]
+
+
+def identify(player: Optional[Player]) -> Optional[str]:
+    """Names a player by their module, falling back to their display name."""
+    if player is None:
+        return None
+    return getattr(player, "__name__", None) or str(player.name())
+
+
+def module_name(name: str) -> str:
+    """Turns a short player name like "aggro_aiden" into its module path.
+
+    Args:
+        name (str): A short player name or a full module path.
+
+    Returns:
+        str: The module path for the player.
+    """
+    return name if "." in name else f"notone.players.{name}"
+
+
+def resolve(name: str) -> Player:
+    """Loads a player by short name, module path, strategy spec file, or
+    external program.
+
+    Args:
+        name (str): A short player name, a full module path, the path of a
+        .json or .toml strategy spec, or "external:" followed by the command
+        that runs an external player (see notone.external).
+
+    Returns:
+        Player: The player.
+    """
+    if name.startswith("external:"):
+        from notone import external
+
+        return external.load(name[len(external.PREFIX) :])
+    if name.endswith((".json", ".toml")):
+        from notone import strategy
+
+        return strategy.load(name)
+    return import_module(module_name(name))
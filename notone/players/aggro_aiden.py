@@ -1,7 +1,7 @@
 """Aggro Aiden takes an aggressive-but-naive approach, rolling until their
 turn score is over 40."""
 
-from notone.types import GameState
+from notone.types import Threshold
 
 
 def name() -> str:
@@ -16,5 +16,8 @@ def victory_cry() -> str:
     return "I WILL DESTROY ALL WHO DARE OPPOSE ME!!!"
 
 
-def roll_again(state: GameState) -> bool:
-    return state.turn_score < 40
+policy = Threshold("turn_score", 40)
+roll_again = policy.roll_again
+# The batch engine passes NumPy arrays in place of the scalar fields, and the
+# policy's comparison works element-wise on them.
+roll_again_batch = roll_again
@@ -1,7 +1,7 @@
 """Cautious Carter takes an cautious-but-naive approach, only rolling 3
 times."""
 
-from notone.types import GameState
+from notone.types import Threshold
 
 
 def name() -> str:
@@ -16,5 +16,8 @@ def victory_cry() -> str:
     return "Oh I won? That's good, right?"
 
 
-def roll_again(state: GameState) -> bool:
-    return state.turn_rolls < 1
+policy = Threshold("turn_rolls", 1)
+roll_again = policy.roll_again
+# The batch engine passes NumPy arrays in place of the scalar fields, and the
+# policy's comparison works element-wise on them.
+roll_again_batch = roll_again
@@ -0,0 +1,25 @@
+"""Optimal Olive doesn't guess: she plays the policy that notone.solver has
+proven wins the most games. The policy is solved once and cached on disk."""
+
+from notone import solver
+from notone.types import GameState
+
+
+def name() -> str:
+    return "Optimal Olive"
+
+
+def emoji() -> str:
+    return "🫒"
+
+
+def victory_cry() -> str:
+    return "I'd say it was luck, but I did the math."
+
+
+def roll_again(state: GameState) -> bool:
+    return solver.policy().roll_again(state)
+
+
+def roll_again_batch(state):
+    return solver.policy().roll_again_batch(state)
@@ -1,4 +1,4 @@
-from notone.types import GameState
+from notone.types import Threshold
 
 
 def name() -> str:
@@ -13,5 +13,5 @@ def victory_cry() -> str:
     return f"{name()} reigns supreme."
 
 
-def roll_again(state: GameState) -> bool:
-    return state.turn_rolls < 4
+policy = Threshold("turn_rolls", 4)
+roll_again = policy.roll_again
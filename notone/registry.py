@@ -0,0 +1,129 @@
+"""Finds players without importing them, so picking a field out of hundreds of
+candidates only imports the ones that actually play.
+
+Players are discovered from the modules in notone/players and from any
+installed package that registers them under the "notone.players" entry point
+group, e.g. in its pyproject.toml:
+
+    [tool.poetry.plugins."notone.players"]
+    steady_stella = "my_players.steady_stella"
+
+A field is chosen with patterns: short names or module paths, shell-style
+globs over the discovered players (like "p1*"), or paths and globs of strategy
+spec files (like "strategies/*.toml"). External players (see notone.external)
+are given as "external:" and their command. A config file lists patterns under
+`players`:
+
+    players = ["aggro_aiden", "p1*", "strategies/*.toml"]
+"""
+from __future__ import annotations
+
+import fnmatch
+import glob
+import pkgutil
+import re
+from importlib.metadata import entry_points
+from pathlib import Path
+from typing import Sequence, Union
+
+from notone import players
+from notone.players import module_name
+
+GROUP = "notone.players"
+# Player modules that aren't players.
+SKIP = {"template"}
+SPEC_SUFFIXES = (".json", ".toml")
+EXTERNAL = "external:"
+
+
+def natural(name: str) -> list:
+    """Sorts p2 before p10."""
+    return [int(part) if part.isdigit() else part for part in re.split(r"(\d+)", name)]
+
+
+def discover() -> dict[str, str]:
+    """Finds every available player, without importing any of them.
+
+    Returns:
+        dict[str, str]: Each player's module path, by short name, sorted by
+        name. Built-in players come first.
+    """
+    found = {
+        module.name: f"{players.__name__}.{module.name}"
+        for module in pkgutil.iter_modules(players.__path__)
+        if not module.name.startswith("_") and module.name not in SKIP
+    }
+    registered = entry_points()
+    if hasattr(registered, "select"):
+        plugins = registered.select(group=GROUP)
+    else:
+        # Python 3.9 returns a dict of groups.
+        plugins = registered.get(GROUP, [])  # type: ignore
+    for plugin in sorted(plugins, key=lambda plugin: natural(plugin.name)):
+        found.setdefault(plugin.name, plugin.value)
+    return dict(sorted(found.items(), key=lambda item: natural(item[0])))
+
+
+def select(patterns: Sequence[str]) -> list[str]:
+    """Picks out the players matching a list of patterns, without importing
+    them.
+
+    Args:
+        patterns (Sequence[str]): Short names, module paths, globs over the
+        discovered players, paths and globs of strategy spec files, or external
+        players' commands.
+
+    Raises:
+        ValueError: If a glob matches no players.
+
+    Returns:
+        list[str]: The module paths and spec paths of the matching players,
+        each once, in the order the patterns match them.
+    """
+    available = None
+    chosen: list[str] = []
+    for pattern in patterns:
+        if pattern.startswith(EXTERNAL):
+            matches = [pattern]
+        elif pattern.endswith(SPEC_SUFFIXES):
+            matches = sorted(glob.glob(pattern), key=natural) or [pattern]
+        elif glob.has_magic(pattern):
+            available = available or discover()
+            matches = [
+                path
+                for name, path in available.items()
+                if fnmatch.fnmatchcase(name, pattern)
+                or fnmatch.fnmatchcase(path, pattern)
+            ]
+            if not matches:
+                raise ValueError(f"No players match {pattern!r}.")
+        else:
+            # Exact names are looked up too, so they find plugins; anything
+            # unregistered is taken as a module path.
+            available = available or discover()
+            matches = [available.get(pattern) or module_name(pattern)]
+        chosen.extend(match for match in matches if match not in chosen)
+    return chosen
+
+
+def read_config(path: Union[str, Path]) -> list[str]:
+    """Reads the player patterns from a JSON or TOML config file.
+
+    Args:
+        path (Union[str, Path]): The config file.
+
+    Raises:
+        ValueError: If the file doesn't list players.
+
+    Returns:
+        list[str]: The patterns, in order.
+    """
+    from notone import strategy
+
+    config = strategy.read(path)
+    patterns = config.get("players")
+    if not isinstance(patterns, list) or not all(
+        isinstance(pattern, str) for pattern in patterns
+    ):
+        raise ValueError(f"{path} needs a list of players.")
+    return patterns
@@ -0,0 +1,206 @@
+"""Keeps the results of every game and tournament in a SQLite database, so they
+can be analyzed later without playing them all again.
+
+A ResultsStore listens for the game_ended, tournament_started and
+tournament_ended signals. Handlers only put a row on a queue; a background
+thread does the writing, in batches, so recording millions of games barely
+slows the games down. If the writer fails, the next row queued, or close(),
+raises its error rather than waiting on it.
+"""
+from __future__ import annotations
+
+import json
+import queue
+import sqlite3
+import threading
+import uuid
+from contextlib import closing
+from pathlib import Path
+from typing import Iterator, Optional, Union
+
+from notone import signals
+from notone.players import identify
+from notone.types import GameState, Player, TournamentState
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    tournament TEXT,
+    players TEXT NOT NULL,
+    scores TEXT NOT NULL,
+    rolls TEXT NOT NULL,
+    rounds INTEGER NOT NULL,
+    winner INTEGER,
+    forfeited INTEGER
+);
+CREATE TABLE IF NOT EXISTS tournaments (
+    id TEXT PRIMARY KEY,
+    players TEXT NOT NULL,
+    rounds INTEGER NOT NULL,
+    champion INTEGER
+);
+"""
+
+INSERT_GAME = (
+    "INSERT INTO games (tournament, players, scores, rolls, rounds, winner, "
+    "forfeited) VALUES (?, ?, ?, ?, ?, ?, ?)"
+)
+INSERT_TOURNAMENT = (
+    "INSERT INTO tournaments (id, players, rounds, champion) VALUES (?, ?, ?, ?)"
+)
+
+# Tells the writer thread there's nothing more to write.
+DONE = None
+
+
+class ResultsStore:
+    def __init__(
+        self, path: Union[str, Path], batch_size: int = 1_000, buffer: int = 100_000
+    ):
+        """Opens (or creates) a results database and starts the writer thread.
+
+        Args:
+            path (Union[str, Path]): The SQLite database file.
+            batch_size (int, optional): The most rows written per transaction.
+            Defaults to 1,000.
+            buffer (int, optional): The most rows waiting to be written before
+            the games have to wait for the writer. Defaults to 100,000.
+        """
+        self.path = Path(path)
+        self.batch_size = batch_size
+        self.pending: queue.Queue = queue.Queue(maxsize=buffer)
+        self.tournament: Optional[str] = None
+        self.writer = threading.Thread(target=self.write, daemon=True)
+        # Why the writer thread stopped, if it failed.
+        self.error: Optional[Exception] = None
+        with closing(sqlite3.connect(self.path)) as db:
+            db.executescript(SCHEMA)
+            columns = {row[1] for row in db.execute("PRAGMA table_info(games)")}
+            if "forfeited" not in columns:
+                # Databases from before forfeits were recorded.
+                db.execute("ALTER TABLE games ADD COLUMN forfeited INTEGER")
+        self.writer.start()
+
+    def __enter__(self) -> ResultsStore:
+        self.connect()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def connect(self):
+        signals.game_ended.connect(self.record_game)
+        signals.tournament_started.connect(self.start_tournament)
+        signals.tournament_ended.connect(self.record_tournament)
+
+    def disconnect(self):
+        signals.game_ended.disconnect(self.record_game)
+        signals.tournament_started.disconnect(self.start_tournament)
+        signals.tournament_ended.disconnect(self.record_tournament)
+
+    def close(self):
+        """Stops listening, then waits for every buffered row to be written.
+
+        Raises:
+            Exception: Whatever stopped the writer thread, if it failed.
+        """
+        self.disconnect()
+        if self.writer.is_alive():
+            self.put(DONE)
+            self.writer.join()
+        if self.error is not None:
+            raise self.error
+
+    def put(self, item):
+        """Queues a row for the writer, waiting while the buffer is full.
+
+        Raises:
+            Exception: Whatever stopped the writer thread, if it failed, rather
+            than waiting for it forever.
+        """
+        while True:
+            if self.error is not None:
+                raise self.error
+            try:
+                self.pending.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                pass
+
+    def record_game(self, state: GameState, players: list[Player]):
+        row = (
+            self.tournament,
+            json.dumps([identify(player) for player in players]),
+            json.dumps(state.scores),
+            json.dumps(state.rolls),
+            state.round,
+            state.winner,
+            state.forfeited,
+        )
+        self.put((INSERT_GAME, row))
+
+    def start_tournament(self, state: TournamentState):
+        self.tournament = uuid.uuid4().hex
+
+    def record_tournament(self, state: TournamentState, players: list[Player]):
+        row = (
+            self.tournament or uuid.uuid4().hex,
+            json.dumps([identify(player) for player in players]),
+            state.round,
+            state.champion,
+        )
+        self.put((INSERT_TOURNAMENT, row))
+        self.tournament = None
+
+    def write(self):
+        """Runs on the writer thread: waits for rows, then writes everything
+        that's queued up in as few transactions as possible."""
+        db = sqlite3.connect(self.path)
+        done = False
+        try:
+            while not done:
+                batch = [self.pending.get()]
+                while len(batch) < self.batch_size:
+                    try:
+                        batch.append(self.pending.get_nowait())
+                    except queue.Empty:
+                        break
+                if DONE in batch:
+                    done = True
+                    batch = [item for item in batch if item is not DONE]
+                with db:
+                    for statement in (INSERT_GAME, INSERT_TOURNAMENT):
+                        rows = [row for sql, row in batch if sql == statement]
+                        if rows:
+                            db.executemany(statement, rows)
+        except Exception as e:
+            # Raised on the game thread by the next put() or close().
+            self.error = e
+        finally:
+            db.close()
+
+
+def games(path: Union[str, Path]) -> Iterator[tuple[list[Optional[str]], GameState]]:
+    """Reads back every recorded game.
+
+    Args:
+        path (Union[str, Path]): The SQLite database file.
+
+    Yields:
+        tuple[list[Optional[str]], GameState]: The players and final state of
+        each game, in the order they were recorded.
+    """
+    with closing(sqlite3.connect(path)) as db:
+        rows = db.execute(
+            "SELECT players, scores, rolls, rounds, winner, forfeited FROM games "
+            "ORDER BY id"
+        )
+        for players, scores, rolls, rounds, winner, forfeited in rows:
+            state = GameState(
+                scores=tuple(json.loads(scores)),  # type: ignore
+                rolls=tuple(json.loads(rolls)),  # type: ignore
+                round=rounds,
+                winner=winner,
+                forfeited=forfeited,
+            )
+            yield json.loads(players), state
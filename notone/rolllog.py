@@ -0,0 +1,281 @@
+"""A compact binary log of every roll, so any game can be replayed exactly.
+
+The file starts with a short header, followed by one record per game:
+
+- A 4-byte little-endian length of the rest of the record.
+- The number of rounds and the number of players, a byte each.
+- Each player's name: a byte for its length, then the UTF-8 text.
+- One byte per roll: the two dice packed into a 6-bit code, (d1 - 1) * 6 +
+  (d2 - 1). An END_TURN byte marks the end of every turn, whether the player
+  held or failed.
+
+So a game costs a byte per roll and per turn, plus the players' names and a few
+bytes of framing. RollLog memory-maps the file and reads games lazily, and
+replay() plays a logged game back through game.play(), which sends every signal
+just as the original game did.
+
+RollLogWriter only listens for game_started, turn_completed and game_ended, so
+the mutable engines can skip the per-roll signals while it writes. It buffers
+each game's turns in a context variable, so games played concurrently, on their
+own asyncio tasks or threads, are logged separately. It refuses
+games with turns the sampled engine drew whole, since they have no dice, and
+skips forfeited games, which the dice alone can't reproduce.
+"""
+from __future__ import annotations
+
+import mmap
+import struct
+from array import array
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from types import ModuleType
+from typing import BinaryIO, Iterator, Optional, Union
+
+from notone import dice, game, signals
+from notone.players import identify
+from notone.types import Engine, GameState, Player
+
+MAGIC = b"NOT1LOG"
+VERSION = 1
+HEADER = MAGIC + bytes([VERSION])
+END_TURN = 0x3F
+LENGTH = struct.Struct("<I")
+
+
+def encode(d1: int, d2: int) -> int:
+    return (d1 - 1) * 6 + (d2 - 1)
+
+
+def decode(code: int) -> tuple[int, int]:
+    return code // 6 + 1, code % 6 + 1
+
+
+@dataclass(frozen=True)
+class LoggedGame:
+    players: tuple[str, ...]
+    rounds: int
+    codes: bytes
+
+    def dice(self) -> list[int]:
+        """Every die rolled, in order."""
+        return [die for code in self.codes if code != END_TURN for die in decode(code)]
+
+    def decisions(self) -> list[bool]:
+        """Every answer the players gave to roll_again(), in order. A turn that
+        ends in a failed roll doesn't ask the player again."""
+        answers: list[bool] = []
+        turn_rolls = 0
+        failed = False
+        for code in self.codes:
+            if code == END_TURN:
+                if not failed:
+                    answers.append(False)
+                turn_rolls = 0
+                failed = False
+                continue
+            answers.append(True)
+            turn_rolls += 1
+            d1, d2 = decode(code)
+            failed = turn_rolls > 1 and (d1 == 1 or d2 == 1)
+        return answers
+
+    def to_bytes(self) -> bytes:
+        body = bytearray([self.rounds, len(self.players)])
+        for player in self.players:
+            name = player.encode()[:255]
+            body += bytes([len(name)]) + name
+        body += self.codes
+        return LENGTH.pack(len(body)) + bytes(body)
+
+    @classmethod
+    def from_bytes(cls, body: bytes) -> LoggedGame:
+        rounds, num_players = body[0], body[1]
+        position = 2
+        players = []
+        for _ in range(num_players):
+            length = body[position]
+            players.append(body[position + 1 : position + 1 + length].decode())
+            position += 1 + length
+        return cls(players=tuple(players), rounds=rounds, codes=body[position:])
+
+
+class RollLogWriter:
+    def __init__(self, path: Union[str, Path], buffer_size: int = 1 << 20):
+        """Opens a roll log for appending, writing the header if it's new.
+
+        Args:
+            path (Union[str, Path]): The log file.
+            buffer_size (int, optional): How many bytes to buffer before
+            writing to disk. Defaults to 1 MiB.
+        """
+        self.path = Path(path)
+        new = not self.path.exists() or self.path.stat().st_size == 0
+        self.file: BinaryIO = open(self.path, "ab", buffering=buffer_size)
+        if new:
+            self.file.write(HEADER)
+        # The current game's turns, or None if it's played in another process.
+        self.codes: ContextVar[Optional[bytearray]] = ContextVar("codes", default=None)
+
+    def __enter__(self) -> RollLogWriter:
+        self.connect()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def connect(self):
+        signals.game_started.connect(self.handle_game_started)
+        signals.turn_completed.connect(self.handle_turn_completed)
+        signals.game_ended.connect(self.handle_game_ended)
+
+    def disconnect(self):
+        signals.game_started.disconnect(self.handle_game_started)
+        signals.turn_completed.disconnect(self.handle_turn_completed)
+        signals.game_ended.disconnect(self.handle_game_ended)
+
+    def close(self):
+        self.disconnect()
+        self.file.close()
+
+    def handle_game_started(self, state: GameState):
+        self.codes.set(bytearray())
+
+    def handle_turn_completed(self, state: GameState, player: Player, rolls: array):
+        codes = self.codes.get()
+        if codes is None:
+            return
+        codes.extend(encode(d1, d2) for d1, d2 in zip(rolls[::2], rolls[1::2]))
+        codes.append(END_TURN)
+
+    def handle_game_ended(self, state: GameState, players: list[Player]):
+        """Writes the game's record.
+
+        Raises:
+            ValueError: If some of the game's turns weren't rolled die by die,
+            like those the sampled engine draws whole, so it couldn't be
+            replayed.
+        """
+        codes = self.codes.get()
+        self.codes.set(None)
+        if codes is None:
+            # Parallel tournaments only send game_ended, so there's nothing
+            # to replay.
+            return
+        if state.forfeited is not None:
+            # The game stopped partway through a turn, for reasons the dice
+            # can't reproduce, so there's nothing to replay either.
+            return
+        turns, expected = codes.count(END_TURN), state.round * len(players)
+        if turns != expected:
+            raise ValueError(
+                f"Only {turns} of the game's {expected} turns were rolled die by "
+                "die, so it can't be logged; the sampled engine draws whole turns."
+            )
+        logged = LoggedGame(
+            players=tuple(identify(player) or "" for player in players),
+            rounds=state.round,
+            codes=bytes(codes),
+        )
+        self.file.write(logged.to_bytes())
+
+
+class RollLog:
+    def __init__(self, path: Union[str, Path]):
+        """Memory-maps a roll log for reading.
+
+        Args:
+            path (Union[str, Path]): The log file.
+
+        Raises:
+            ValueError: If the file isn't a roll log.
+        """
+        self.file = open(path, "rb")
+        self.data = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        if self.data[: len(HEADER)] != HEADER:
+            self.close()
+            raise ValueError(f"{path} isn't a Not One roll log.")
+        self._offsets: Optional[list[int]] = None
+
+    def __enter__(self) -> RollLog:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        if not self.data.closed:
+            self.data.close()
+        self.file.close()
+
+    def scan(self) -> Iterator[tuple[int, int]]:
+        """Walks the length prefixes, yielding where each game's record starts
+        and ends."""
+        position = len(HEADER)
+        while position + LENGTH.size <= len(self.data):
+            (length,) = LENGTH.unpack_from(self.data, position)
+            start = position + LENGTH.size
+            yield start, start + length
+            position = start + length
+
+    def offsets(self) -> list[int]:
+        if self._offsets is None:
+            self._offsets = [start - LENGTH.size for start, _ in self.scan()]
+        return self._offsets
+
+    def __len__(self) -> int:
+        return len(self.offsets())
+
+    def __getitem__(self, index: int) -> LoggedGame:
+        offset = self.offsets()[index]
+        (length,) = LENGTH.unpack_from(self.data, offset)
+        start = offset + LENGTH.size
+        return LoggedGame.from_bytes(self.data[start : start + length])
+
+    def __iter__(self) -> Iterator[LoggedGame]:
+        for start, end in self.scan():
+            yield LoggedGame.from_bytes(self.data[start:end])
+
+
+def stand_in(name: str, answers: Iterator[bool], player: Optional[Player] = None):
+    """Builds a player that gives logged answers, borrowing a real player's
+    personality if there is one."""
+    scripted = ModuleType(name)
+    scripted.name = player.name if player else (lambda: name)  # type: ignore
+    scripted.emoji = player.emoji if player else (lambda: "📼")  # type: ignore
+    scripted.victory_cry = (  # type: ignore
+        player.victory_cry if player else (lambda: "")
+    )
+    scripted.roll_again = lambda state: next(answers)  # type: ignore
+    return scripted
+
+
+def replay(
+    logged: LoggedGame,
+    players: Optional[list[Player]] = None,
+    engine: Engine = "mutable",
+) -> GameState:
+    """Plays a logged game again, sending the same signals as the original.
+
+    Args:
+        logged (LoggedGame): The game to replay.
+        players (Optional[list[Player]], optional): The real players, for
+        their names, emoji and victory cries; their roll_again() is never
+        called. Defaults to None, which uses stand-ins.
+        engine (Engine, optional): The engine to replay with. Defaults to
+        "mutable".
+
+    Returns:
+        GameState: The final game state, identical to the original's.
+    """
+    answers = iter(logged.decisions())
+    stand_ins = [
+        stand_in(name, answers, players[i] if players else None)
+        for i, name in enumerate(logged.players)
+    ]
+    return game.play(
+        stand_ins,
+        rounds=logged.rounds,
+        engine=engine,
+        dice=dice.ReplayDice(logged.dice()),
+    )
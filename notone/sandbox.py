@@ -0,0 +1,204 @@
+"""Runs players' decisions in worker processes under a time budget, so one
+stuck or crashing player can't stall a long tournament.
+
+A Sandbox keeps a worker process per player module. Every roll_again() call is
+sent to the worker, and the engine waits no longer than the per-call limit, or
+whatever's left of the player's budget for the game. A player who runs out of
+time, raises an exception or dies forfeits the game; their worker is killed and
+a fresh one starts for the next game.
+
+Players must be importable modules, since the workers import them by name.
+"""
+from __future__ import annotations
+
+import multiprocessing
+import time
+from multiprocessing.connection import Connection
+from typing import Callable, Optional
+
+from notone.players import identify, resolve
+from notone.types import GameState, Player
+
+Decide = Callable[[GameState], bool]
+
+# Tells a worker to exit.
+DONE = None
+
+
+class Forfeit(Exception):
+    def __init__(self, player: int, reason: str):
+        """Raised when a player loses the game by breaking the sandbox's rules.
+
+        Args:
+            player (int): The index of the player who forfeits.
+            reason (str): What they did wrong.
+        """
+        super().__init__(f"Player {player} forfeits: {reason}")
+        self.player = player
+        self.reason = reason
+
+
+def serve(name: str, connection: Connection):
+    """Runs in a worker process: imports the player, then answers decisions
+    until told to stop."""
+    try:
+        player = resolve(name)
+    except Exception as e:
+        connection.send((False, f"couldn't be imported ({e!r})"))
+        return
+    connection.send((True, None))
+    while True:
+        state = connection.recv()
+        if state is DONE:
+            return
+        try:
+            connection.send((True, bool(player.roll_again(state))))
+        except Exception as e:
+            connection.send((False, f"raised {e!r}"))
+
+
+class Worker:
+    def __init__(self, name: str):
+        self.connection, child = multiprocessing.Pipe()
+        self.process = multiprocessing.Process(
+            target=serve, args=(name, child), daemon=True
+        )
+        self.process.start()
+        child.close()
+        self.ready = False
+
+    def start(self, timeout: float) -> Optional[str]:
+        """Waits for the player to be imported.
+
+        Returns:
+            Optional[str]: Why the worker failed to start, if it did.
+        """
+        if self.ready:
+            return None
+        reply = self.receive(timeout)
+        if reply is None:
+            return f"took longer than {timeout:g}s to start"
+        ok, error = reply
+        self.ready = ok
+        return None if ok else error
+
+    def receive(self, timeout: Optional[float]):
+        if timeout is not None:
+            timeout = max(timeout, 0)
+        try:
+            if not self.connection.poll(timeout):
+                return None
+            return self.connection.recv()
+        except (EOFError, OSError):
+            return (False, "died")
+
+    def kill(self):
+        self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def close(self, timeout: float = 1.0):
+        try:
+            self.connection.send(DONE)
+        except (BrokenPipeError, OSError):
+            pass
+        self.process.join(timeout)
+        if self.process.is_alive():
+            self.kill()
+        else:
+            self.connection.close()
+
+
+class Sandbox:
+    def __init__(
+        self,
+        per_call: Optional[float] = 1.0,
+        per_game: Optional[float] = None,
+        startup: float = 10.0,
+    ):
+        """Sets the time limits; workers start when their player first plays.
+
+        Args:
+            per_call (Optional[float], optional): The most seconds a single
+            roll_again() call may take, or None for no limit. Defaults to 1.
+            per_game (Optional[float], optional): The most seconds a player may
+            spend deciding over a whole game. Defaults to None, no limit.
+            startup (float, optional): The most seconds a worker may take to
+            import its player, which doesn't count against either limit.
+            Defaults to 10.
+        """
+        self.per_call = per_call
+        self.per_game = per_game
+        self.startup = startup
+        self.workers: dict[str, Worker] = {}
+
+    def __enter__(self) -> Sandbox:
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        for worker in self.workers.values():
+            worker.close()
+        self.workers.clear()
+
+    def worker(self, name: str) -> Worker:
+        worker = self.workers.get(name)
+        if worker is None or not worker.process.is_alive():
+            worker = self.workers[name] = Worker(name)
+        return worker
+
+    def retire(self, name: str):
+        worker = self.workers.pop(name, None)
+        if worker is not None:
+            worker.kill()
+
+    def deciders(self, players: list[Player]) -> list[Decide]:
+        """Starts a game's budget, returning a sandboxed roll_again() for each
+        player.
+
+        Args:
+            players (list[Player]): The players, in seat order.
+
+        Returns:
+            list[Decide]: Drop-in replacements for the players' roll_again(),
+            which raise Forfeit when a player breaks the rules.
+        """
+        spent = [0.0] * len(players)
+        return [
+            self.decider(identify(player) or "", active, spent)
+            for active, player in enumerate(players)
+        ]
+
+    def decider(self, name: str, active: int, spent: list[float]) -> Decide:
+        def decide(state: GameState) -> bool:
+            worker = self.worker(name)
+            error = worker.start(self.startup)
+            if error:
+                self.retire(name)
+                raise Forfeit(active, error)
+
+            timeout = self.per_call
+            if self.per_game is not None:
+                remaining = self.per_game - spent[active]
+                timeout = remaining if timeout is None else min(timeout, remaining)
+            start = time.perf_counter()
+            worker.connection.send(state)
+            reply = worker.receive(timeout)
+            spent[active] += time.perf_counter() - start
+
+            if reply is None:
+                self.retire(name)
+                if self.per_game is not None and spent[active] >= self.per_game:
+                    raise Forfeit(
+                        active, f"used up their {self.per_game:g}s for the game"
+                    )
+                raise Forfeit(active, f"took longer than {self.per_call:g}s to decide")
+            ok, decision = reply
+            if not ok:
+                self.retire(name)
+                raise Forfeit(active, decision)
+            return decision
+
+        return decide
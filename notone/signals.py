@@ -1,4 +1,21 @@
-from blinker import signal
+"""The Not One signals, and the dispatch layer the mutable engines send them
+through.
+
+blinker finds, dereferences and calls every receiver on each send, even when
+there's nothing to call. A Dispatch instead builds a table of each signal's
+receivers once, when a game starts, leaving out do_nothing placeholders, so the
+engine can check has_receivers() with a dict lookup before it builds a payload,
+and call whoever's left directly. Receivers connected mid-game start hearing
+from the next game.
+"""
+from __future__ import annotations
+
+from dataclasses import fields
+from typing import Callable, Sequence
+
+from blinker import ANY, Signal, signal
+
+from notone.types import MutableGameState, SignalHandler, do_nothing
 
 game_started = signal("game_started")
 game_ended = signal("game_ended")
@@ -13,8 +30,95 @@ rolled = signal("rolled")
 roll_succeeded = signal("roll_succeeded")
 roll_failed = signal("roll_failed")
 
+# Sent after turn_ended with the turn's dice, as an array("B") holding two
+# values per roll, for receivers that only care about whole turns. Turns the
+# sampled engine draws whole have no dice, and don't send it.
+turn_completed = signal("turn_completed")
+
 tournament_started = signal("tournament_started")
 tournament_ended = signal("tournament_ended")
 
 tournament_round_started = signal("tournament_round_started")
 tournament_round_ended = signal("tournament_round_ended")
+
+namespace = (
+    game_started,
+    game_ended,
+    round_started,
+    round_ended,
+    turn_started,
+    turn_ended,
+    rolled,
+    roll_succeeded,
+    roll_failed,
+    turn_completed,
+    tournament_started,
+    tournament_ended,
+    tournament_round_started,
+    tournament_round_ended,
+)
+
+by_name: dict[str, Signal] = {
+    watched_signal.name: watched_signal for watched_signal in namespace
+}
+
+
+def has_receivers() -> bool:
+    """Checks whether anything besides do_nothing is connected to any of the Not
+    One signals."""
+    return bool(Dispatch().table)
+
+
+per_roll = (rolled, roll_succeeded, roll_failed)
+
+
+def connect(handler: SignalHandler):
+    """Connects each of a SignalHandler's handlers to the signal of the same
+    name, skipping those left as do_nothing."""
+    for field in fields(handler):
+        receiver = getattr(handler, field.name)
+        if receiver is not do_nothing:
+            by_name[field.name].connect(receiver)
+
+
+def disconnect(handler: SignalHandler):
+    """Undoes connect()."""
+    for field in fields(handler):
+        by_name[field.name].disconnect(getattr(handler, field.name))
+
+
+class Dispatch:
+    def __init__(self, watched: Sequence[Signal] = namespace):
+        """Builds the table of who's listening to each signal.
+
+        Args:
+            watched (Sequence[Signal], optional): The signals to dispatch.
+            Defaults to every Not One signal.
+        """
+        self.table: dict[Signal, tuple[Callable, ...]] = {}
+        for watched_signal in watched:
+            receivers = tuple(
+                receiver
+                for receiver in watched_signal.receivers_for(ANY)
+                if receiver is not do_nothing
+            )
+            if receivers:
+                self.table[watched_signal] = receivers
+
+    def has_receivers(self, *watched: Signal) -> bool:
+        """Checks whether anything listens to any of the given signals."""
+        return any(watched_signal in self.table for watched_signal in watched)
+
+    def send(self, sent: Signal, state: MutableGameState, **kwargs):
+        """Sends a signal from a mutable engine, snapshotting the game state
+        only if someone is actually listening.
+
+        Args:
+            sent (Signal): The signal to send.
+            state (MutableGameState): The engine's current game state.
+        """
+        receivers = self.table.get(sent)
+        if receivers:
+            snapshot = state.snapshot()
+            for receiver in receivers:
+                receiver(snapshot, **kwargs)
@@ -0,0 +1,233 @@
+"""Solves two-player Not One exactly, finding the roll/hold policy that
+maximizes the chance of winning.
+
+Only the difference between the two total scores decides the winner, so the
+state space is the turn (round and turn order), the active player's lead, their
+turn score, and whether they've rolled yet this turn (the first roll can't
+fail). Each turn only depends on the turns after it and turn scores only go
+up, so backward induction from the final turn visits every state exactly once
+and gives the exact optimal values, with no iterating to convergence.
+
+Ties count as half a win. Leads are clipped to ±MAX_LEAD and turns are held at
+MAX_TURN_SCORE; both are far enough out that the outcome is settled.
+"""
+from __future__ import annotations
+
+import functools
+from dataclasses import dataclass
+
+import numpy as np
+
+from notone import cache, game
+from notone.types import GameState
+
+MAX_LEAD = 400
+MAX_TURN_SCORE = 250
+VERSION = 1
+
+# Chances of each two-dice total when ones are allowed (the first roll of a
+# turn) and when they aren't (every roll after, where a one fails the turn).
+OPENING_TOTALS = (
+    np.bincount([a + b for a in range(1, 7) for b in range(1, 7)], minlength=13) / 36
+)
+SAFE_TOTALS = (
+    np.bincount([a + b for a in range(2, 7) for b in range(2, 7)], minlength=13) / 36
+)
+FAIL_CHANCE = 11 / 36
+
+
+@dataclass(frozen=True)
+class Policy:
+    # Whether to make the first roll of a turn: [turn, lead].
+    opening: np.ndarray
+    # Whether to roll again after the first roll: [turn, turn score, lead].
+    table: np.ndarray
+    rounds: int
+
+    @property
+    def max_lead(self) -> int:
+        return self.table.shape[2] // 2
+
+    @property
+    def max_turn_score(self) -> int:
+        return self.table.shape[1] - 1
+
+    def roll_again(self, state: GameState) -> bool:
+        if len(state.scores) != 2:
+            raise ValueError(two_players_only(len(state.scores)))
+        if not 1 <= state.round <= self.rounds:
+            return False
+        turn = turn_index(state.round, state.active)
+        lead = state.scores[state.active] - state.scores[1 - state.active]
+        lead = min(max(lead, -self.max_lead), self.max_lead) + self.max_lead
+        if state.turn_rolls == 0:
+            return bool(self.opening[turn, lead])
+        if state.turn_score > self.max_turn_score:
+            return False
+        return bool(self.table[turn, state.turn_score, lead])
+
+    def roll_again_batch(self, state) -> np.ndarray:
+        """Looks up decisions for a notone.batch.BatchState."""
+        if state.scores.shape[1] != 2:
+            raise ValueError(two_players_only(state.scores.shape[1]))
+        if not 1 <= state.round <= self.rounds:
+            return np.zeros(len(state), dtype=bool)
+        turn = turn_index(state.round, state.active)
+        lead = state.scores[:, state.active] - state.scores[:, 1 - state.active]
+        lead = np.clip(lead, -self.max_lead, self.max_lead) + self.max_lead
+        turn_score = np.minimum(state.turn_score, self.max_turn_score)
+        decisions = self.table[turn, turn_score, lead]
+        decisions &= state.turn_score <= self.max_turn_score
+        opening = state.turn_rolls == 0
+        decisions[opening] = self.opening[turn, lead[opening]]
+        return decisions
+
+
+def two_players_only(players: int) -> str:
+    return f"The optimal policy is solved for two players, not {players}."
+
+
+def turn_index(round: int, active: int) -> int:
+    """Numbers every turn in the game, starting from 0.
+
+    Args:
+        round (int): The round, starting from 1.
+        active (int): The player taking the turn.
+
+    Returns:
+        int: The turn's position in the game.
+    """
+    first = next(game.turn_order(2, round))
+    return 2 * (round - 1) + (0 if active == first else 1)
+
+
+def movers(rounds: int) -> list[int]:
+    """Lists which player takes each turn of the game."""
+    return [
+        active for round in range(1, rounds + 1) for active in game.turn_order(2, round)
+    ]
+
+
+def shift(values: np.ndarray, amount: int) -> np.ndarray:
+    """Reads values[lead + amount] for every lead, clipping at the edges."""
+    indices = np.clip(np.arange(len(values)) + amount, 0, len(values) - 1)
+    return values[indices]
+
+
+def solve_turn(
+    after: np.ndarray, max_turn_score: int
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Solves a single turn.
+
+    Args:
+        after (np.ndarray): The active player's chance of winning once the turn
+        is over, indexed by their lead.
+        max_turn_score (int): The turn score at which to stop rolling.
+
+    Returns:
+        tuple[np.ndarray, np.ndarray, np.ndarray]: The chance of winning at the
+        start of the turn, the opening decisions and the roll again decisions.
+    """
+    leads = len(after)
+    best = np.empty((max_turn_score + 13, leads))
+    table = np.zeros((max_turn_score + 1, leads), dtype=bool)
+    for turn_score in range(max_turn_score + 12, max_turn_score, -1):
+        best[turn_score] = shift(after, turn_score)
+
+    failed = FAIL_CHANCE * after
+    for turn_score in range(max_turn_score, -1, -1):
+        hold = shift(after, turn_score)
+        roll = failed + SAFE_TOTALS[4:] @ best[turn_score + 4 : turn_score + 13]
+        table[turn_score] = roll > hold
+        best[turn_score] = np.maximum(hold, roll)
+
+    hold = after
+    roll = OPENING_TOTALS[2:] @ best[2:13]
+    return np.maximum(hold, roll), roll > hold, table
+
+
+def solve(
+    rounds: int = 10, max_lead: int = MAX_LEAD, max_turn_score: int = MAX_TURN_SCORE
+) -> Policy:
+    """Works backward from the end of the game to find the optimal policy.
+
+    Args:
+        rounds (int, optional): The number of rounds in the game. Defaults to
+        10.
+        max_lead (int, optional): The largest lead tracked. Defaults to
+        MAX_LEAD.
+        max_turn_score (int, optional): The turn score at which to stop
+        rolling. Defaults to MAX_TURN_SCORE.
+
+    Returns:
+        Policy: The optimal policy.
+    """
+    leads = np.arange(-max_lead, max_lead + 1)
+    final = np.where(leads > 0, 1.0, np.where(leads == 0, 0.5, 0.0))
+    order = movers(rounds)
+    turns = len(order)
+    opening = np.zeros((turns, len(leads)), dtype=bool)
+    table = np.zeros((turns, max_turn_score + 1, len(leads)), dtype=bool)
+
+    value = final
+    for turn in range(turns - 1, -1, -1):
+        if turn == turns - 1:
+            after = final
+        elif order[turn + 1] == order[turn]:
+            after = value
+        else:
+            # The opponent moves next, so our chances are whatever theirs
+            # aren't, with the lead flipped around.
+            after = 1.0 - value[::-1]
+        value, opening[turn], table[turn] = solve_turn(after, max_turn_score)
+
+    return Policy(opening=opening, table=table, rounds=rounds)
+
+
+def save(policy: Policy, path) -> None:
+    """Writes a policy to a path or file, packed at one bit per decision."""
+    np.savez_compressed(
+        path,
+        opening=np.packbits(policy.opening),
+        opening_shape=policy.opening.shape,
+        table=np.packbits(policy.table),
+        table_shape=policy.table.shape,
+        rounds=policy.rounds,
+    )
+
+
+def load(path) -> Policy:
+    """Reads a policy written by save()."""
+    with np.load(path) as data:
+
+        def unpack(name: str) -> np.ndarray:
+            shape = tuple(data[f"{name}_shape"])
+            bits = np.unpackbits(data[name], count=int(np.prod(shape)))
+            return bits.reshape(shape).astype(bool)
+
+        return Policy(
+            opening=unpack("opening"), table=unpack("table"), rounds=int(data["rounds"])
+        )
+
+
+@functools.lru_cache(maxsize=None)
+def policy(rounds: int = 10) -> Policy:
+    """Loads the optimal policy, solving and caching it on disk the first time.
+
+    Args:
+        rounds (int, optional): The number of rounds in the game. Defaults to
+        10.
+
+    Returns:
+        Policy: The optimal policy.
+    """
+    path = (
+        cache.directory()
+        / f"solver-v{VERSION}-r{rounds}-l{MAX_LEAD}-t{MAX_TURN_SCORE}.npz"
+    )
+    if path.exists():
+        return load(path)
+    solved = solve(rounds)
+    with cache.atomic(path) as file:
+        save(solved, file)
+    return solved
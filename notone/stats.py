@@ -0,0 +1,98 @@
+"""Measures how long each player takes to decide whether to roll again, so a
+slow player can't hide in a big tournament.
+
+Pass a DecisionStats to game.play() or tournament.play() to time every
+roll_again() call. Without one, the engines call players directly and pay
+nothing for it.
+"""
+from __future__ import annotations
+
+import math
+import time
+from array import array
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from notone.players import identify
+from notone.types import GameState, Player
+
+Decide = Callable[[GameState], bool]
+
+
+@dataclass(frozen=True)
+class Latency:
+    """A player's decision count and times, in seconds."""
+
+    calls: int
+    total: float
+    mean: float
+    p50: float
+    p90: float
+    p99: float
+    max: float
+
+
+def percentile(ordered: list[int], fraction: float) -> int:
+    """Picks the nearest-rank percentile from sorted samples."""
+    # The smallest rank covering the fraction; rounding first keeps float error
+    # like 0.07 * 100 == 7.000000000000001 from bumping it up a rank.
+    rank = math.ceil(round(fraction * len(ordered), 9))
+    return ordered[min(len(ordered) - 1, max(0, rank - 1))]
+
+
+class DecisionStats:
+    def __init__(self):
+        # Every call's duration in nanoseconds, by player.
+        self.samples: dict[str, array] = {}
+
+    def timed(self, player: Player, roll_again: Optional[Decide] = None) -> Decide:
+        """Wraps a player's roll_again() so that every call is timed.
+
+        Args:
+            player (Player): The player.
+            roll_again (Optional[Decide], optional): The decision to time, if
+            not the player's own roll_again(). Defaults to None.
+
+        Returns:
+            Decide: A drop-in replacement for the player's roll_again().
+        """
+        samples = self.samples.setdefault(identify(player) or "", array("q"))
+        roll_again = roll_again or player.roll_again
+        clock = time.perf_counter_ns
+        record = samples.append
+
+        def decide(state: GameState) -> bool:
+            start = clock()
+            decision = roll_again(state)
+            record(clock() - start)
+            return decision
+
+        return decide
+
+    def latency(self, player: str) -> Latency:
+        """Summarizes a player's decision times.
+
+        Args:
+            player (str): The player's module name, as reported by identify().
+
+        Returns:
+            Latency: The player's call count and timings.
+        """
+        ordered = sorted(self.samples.get(player, ()))
+        if not ordered:
+            return Latency(0, 0.0, 0.0, 0.0, 0.0, 0.0, 0.0)
+        total = sum(ordered)
+        return Latency(
+            calls=len(ordered),
+            total=total / 1e9,
+            mean=total / len(ordered) / 1e9,
+            p50=percentile(ordered, 0.5) / 1e9,
+            p90=percentile(ordered, 0.9) / 1e9,
+            p99=percentile(ordered, 0.99) / 1e9,
+            max=ordered[-1] / 1e9,
+        )
+
+    def report(self) -> dict[str, Latency]:
+        """Summarizes every player's decision times, slowest in total first."""
+        latencies = {player: self.latency(player) for player in self.samples}
+        return dict(sorted(latencies.items(), key=lambda item: -item[1].total))
@@ -0,0 +1,227 @@
+"""Players written as data instead of code.
+
+A strategy spec is a JSON or TOML file with the player's name, emoji and
+victory cry, and a list of rules. The first rule whose `when` conditions all
+hold decides; a rule without conditions always holds. A rule rolls again while
+every value in its `roll_while` is below its limit, or always (`true`) or never
+(`false`). If no rule holds, the player doesn't roll.
+
+    name = "Chasing Chase"
+    emoji = "🏃"
+    victory_cry = "Caught you!"
+
+    [[rules]]
+    when = { round = { min = 8 }, deficit = { min = 30 } }
+    roll_while = { turn_score = 50 }
+
+    [[rules]]
+    roll_while = { turn_score = 25 }
+
+Conditions compare a value to a number (`round = 10`) or a range (`{ min = 8,
+max = 10 }`, both inclusive). The values are round, turn_rolls, turn_score,
+score (the player's total), opponent_score (the best opponent's total) and
+deficit (how far the player trails the best opponent, negative when they
+lead).
+
+Specs compile to Python source for roll_again() and, when NumPy is installed,
+a vectorized roll_again_batch() for the batch engine. A spec with a single
+unconditional threshold also declares it as the player's policy, so it can use
+notone.exact and the "sampled" engine.
+"""
+from __future__ import annotations
+
+import json
+from pathlib import Path
+from types import ModuleType
+from typing import Any, Optional, Union
+
+from notone.types import Player, Threshold
+
+# How to read each value from a GameState, and from a notone.batch.BatchState,
+# where scores has a row per game.
+VALUES = {
+    "round": ("state.round", "state.round"),
+    "turn_rolls": ("state.turn_rolls", "state.turn_rolls"),
+    "turn_score": ("state.turn_score", "state.turn_score"),
+    "score": ("state.scores[state.active]", "state.scores[:, state.active]"),
+    "opponent_score": (
+        "max(state.scores[: state.active] + state.scores[state.active + 1 :])",
+        "np.delete(state.scores, state.active, axis=1).max(axis=1)",
+    ),
+    "deficit": (
+        "(max(state.scores[: state.active] + state.scores[state.active + 1 :])"
+        " - state.scores[state.active])",
+        "(np.delete(state.scores, state.active, axis=1).max(axis=1)"
+        " - state.scores[:, state.active])",
+    ),
+}
+SCALAR, BATCH = 0, 1
+SUFFIXES = (".json", ".toml")
+
+
+def read(path: Union[str, Path]) -> dict[str, Any]:
+    """Reads a spec file, as JSON or TOML depending on its suffix."""
+    path = Path(path)
+    if path.suffix == ".json":
+        return json.loads(path.read_text())
+    if path.suffix == ".toml":
+        try:
+            import tomllib  # type: ignore
+        except ImportError:
+            try:
+                import tomli as tomllib  # type: ignore
+            except ImportError:
+                raise ValueError(
+                    "Reading TOML strategies needs Python 3.11 or the tomli package."
+                ) from None
+        return tomllib.loads(path.read_text())
+    raise ValueError(f"{path} isn't a strategy spec; use {' or '.join(SUFFIXES)}.")
+
+
+def number(value: Any, where: str) -> int:
+    if isinstance(value, bool) or not isinstance(value, int):
+        raise ValueError(f"{where} must be a whole number, not {value!r}.")
+    return value
+
+
+def value(field: str, mode: int) -> str:
+    if field not in VALUES:
+        raise ValueError(f"Unknown value {field!r}; use {', '.join(VALUES)}.")
+    return VALUES[field][mode]
+
+
+def condition(when: dict[str, Any], mode: int) -> str:
+    """Renders a rule's conditions as a single expression."""
+    join = " and " if mode == SCALAR else " & "
+    tests = []
+    for field, test in when.items():
+        current = value(field, mode)
+        if isinstance(test, dict):
+            unknown = set(test) - {"min", "max"}
+            if unknown or not test:
+                raise ValueError(f"Conditions on {field} take a min and/or a max.")
+            if "min" in test:
+                tests.append(f"({current} >= {number(test['min'], field)})")
+            if "max" in test:
+                tests.append(f"({current} <= {number(test['max'], field)})")
+        else:
+            tests.append(f"({current} == {number(test, field)})")
+    return join.join(tests) or "True"
+
+
+def decision(roll_while: Any, mode: int) -> str:
+    """Renders a rule's decision as a single expression."""
+    if isinstance(roll_while, bool):
+        return str(roll_while)
+    if not isinstance(roll_while, dict) or not roll_while:
+        raise ValueError("roll_while must be true, false, or a table of limits.")
+    join = " and " if mode == SCALAR else " & "
+    return join.join(
+        f"({value(field, mode)} < {number(limit, field)})"
+        for field, limit in roll_while.items()
+    )
+
+
+def expression(rules: list[dict[str, Any]], mode: int) -> str:
+    """Renders every rule as one nested conditional expression."""
+    rendered = "False"
+    for rule in reversed(rules):
+        unknown = set(rule) - {"when", "roll_while"}
+        if unknown:
+            raise ValueError(f"Unknown rule keys: {', '.join(sorted(unknown))}.")
+        if "roll_while" not in rule:
+            raise ValueError("Every rule needs a roll_while.")
+        then = decision(rule["roll_while"], mode)
+        if not rule.get("when"):
+            rendered = then
+        elif mode == SCALAR:
+            when = condition(rule["when"], mode)
+            rendered = f"({then}) if ({when}) else ({rendered})"
+        else:
+            when = condition(rule["when"], mode)
+            rendered = f"np.where({when}, {then}, {rendered})"
+    return rendered
+
+
+def threshold(rules: list[dict[str, Any]]) -> Optional[Threshold]:
+    """Finds the Threshold a spec amounts to, if it's that simple."""
+    if len(rules) != 1 or rules[0].get("when"):
+        return None
+    roll_while = rules[0]["roll_while"]
+    if not isinstance(roll_while, dict) or len(roll_while) != 1:
+        return None
+    ((field, limit),) = roll_while.items()
+    if field not in ("turn_rolls", "turn_score"):
+        return None
+    return Threshold(field, limit)
+
+
+def build(spec: dict[str, Any], name: str) -> Player:
+    """Compiles a spec into a player module.
+
+    Args:
+        spec (dict[str, Any]): The parsed spec.
+        name (str): The module name to give the player, usually the spec's path
+        so worker processes can load it again.
+
+    Raises:
+        ValueError: If the spec is invalid.
+
+    Returns:
+        Player: A player module with name(), emoji(), victory_cry() and
+        roll_again(), plus roll_again_batch() when NumPy is installed and a
+        policy when the spec is a single threshold.
+    """
+    if "name" not in spec:
+        raise ValueError("A strategy needs a name.")
+    rules = spec.get("rules")
+    if not isinstance(rules, list) or not rules:
+        raise ValueError("A strategy needs at least one rule.")
+
+    player = ModuleType(name)
+    namespace: dict[str, Any] = {}
+    player.source = (  # type: ignore
+        f"def roll_again(state):\n    return bool({expression(rules, SCALAR)})\n"
+    )
+    exec(compile(player.source, name, "exec"), namespace)  # type: ignore
+    player.roll_again = namespace["roll_again"]  # type: ignore
+
+    try:
+        import numpy as np
+    except ImportError:
+        pass
+    else:
+        namespace["np"] = np
+        batch_source = (
+            f"def roll_again_batch(state):\n    return {expression(rules, BATCH)}\n"
+        )
+        exec(compile(batch_source, name, "exec"), namespace)
+        player.roll_again_batch = namespace["roll_again_batch"]  # type: ignore
+
+    policy = threshold(rules)
+    if policy is not None:
+        player.policy = policy  # type: ignore
+
+    display_name = str(spec["name"])
+    emoji = str(spec.get("emoji", "🤖"))
+    victory_cry = str(spec.get("victory_cry", f"{display_name} wins!"))
+    player.name = lambda: display_name  # type: ignore
+    player.emoji = lambda: emoji  # type: ignore
+    player.victory_cry = lambda: victory_cry  # type: ignore
+    player.spec = spec  # type: ignore
+    return player
+
+
+def load(path: Union[str, Path]) -> Player:
+    """Loads a player from a JSON or TOML spec file.
+
+    Args:
+        path (Union[str, Path]): The spec file.
+
+    Raises:
+        ValueError: If the file isn't a valid spec.
+
+    Returns:
+        Player: The compiled player.
+    """
+    return build(read(path), str(path))
@@ -1,9 +1,16 @@
+import asyncio
 import math
 import random
+from concurrent.futures import Executor, Future, ProcessPoolExecutor
 from typing import Iterator, Optional
 
+from notone import dice as dice_sources
 from notone import game, signals
-from notone.types import Player, TournamentState
+from notone.dice import Dice, GlobalDice, RandomDice
+from notone.players import resolve
+from notone.sandbox import Sandbox
+from notone.stats import DecisionStats
+from notone.types import Engine, GameState, Player, TournamentState
 
 
 def rounds_necessary_for_winner(num_players: int) -> int:
@@ -20,7 +27,9 @@ def rounds_necessary_for_winner(num_players: int) -> int:
     return math.ceil(math.log2(num_players))
 
 
-def seed_players(players: list[Player], rounds: int) -> list[Optional[Player]]:
+def seed_players(
+    players: list[Player], rounds: int, rng=random
+) -> list[Optional[Player]]:
     """
     Seeds all the players for a blind-seeded, single-elimination tournament.
     Each player's seed is represented by their index in the list, so players[0]
@@ -29,6 +38,8 @@ def seed_players(players: list[Player], rounds: int) -> list[Optional[Player]]:
     Args:
         players (list[Player]): A list of players to generate the bracket from.
         rounds (int): The number of rounds to be played.
+        rng (optional): The random number generator used for the shuffle.
+        Defaults to the global one.
 
     Returns:
         list[Optional[Player]]: A list of seeded players, with None occupying
@@ -37,7 +48,7 @@ def seed_players(players: list[Player], rounds: int) -> list[Optional[Player]]:
     """
     num_of_players = len(players)
     # Since this is a blind-seeded tournament, we'll give everyone a shuffle.
-    players = random.sample(players, num_of_players)
+    players = rng.sample(players, num_of_players)
     # Single elimination tournaments need the number of slots to be a power of 2
     # (2, 4, 8, 16, 32), so we may need to award some byes to get to the
     # required number.
@@ -73,6 +84,10 @@ def matchup_players(
 
 def play_matchup(
     matchup: tuple[Optional[Player], Optional[Player]],
+    dice: Dice = dice_sources.default,
+    engine: Engine = "frozen",
+    stats: Optional[DecisionStats] = None,
+    sandbox: Optional[Sandbox] = None,
 ) -> Player:
     """
     Plays a matchup/game between two players. If one of the playes is None, this
@@ -80,21 +95,121 @@ def play_matchup(
     through. In the case of a tie, we play another game until the tie is broken.
 
     Args:
-        matchup (tuple[Optional[Player], Optional[Player]]): _description_
+        matchup (tuple[Optional[Player], Optional[Player]]): The two players,
+        either of which may be None for a bye.
+        dice (Dice, optional): The source of rolls for every game in the
+        matchup. Defaults to the global random number generator.
+        engine (Engine, optional): The game engine to play with. Defaults to
+        "frozen".
+        stats (Optional[DecisionStats], optional): Times every roll_again()
+        call. Defaults to None.
+        sandbox (Optional[Sandbox], optional): Runs every roll_again() call
+        under a time budget. Defaults to None.
 
     Returns:
-        Optional[Player]: _description_
+        Player: The winner of the matchup.
     """
     p1, p2 = matchup
     if p1 is None:
         return p2  # type: ignore
     if p2 is None:
         return p1
-    winner: Optional[Player] = None
-    while winner is None:
-        game_state = game.play([p1, p2])
-        winner = p2 if game_state.winner else p1
-    return winner
+    while True:
+        game_state = game.play(
+            [p1, p2], engine=engine, dice=dice, stats=stats, sandbox=sandbox
+        )
+        if game_state.winner is not None:
+            return (p1, p2)[game_state.winner]
+
+
+async def play_matchup_async(
+    matchup: tuple[Optional[Player], Optional[Player]],
+    dice: Dice = dice_sources.default,
+    timeout: Optional[float] = None,
+) -> Player:
+    """
+    Plays a matchup like play_matchup(), but with game.play_async(), so it can
+    run alongside the round's other matchups.
+
+    Args:
+        matchup (tuple[Optional[Player], Optional[Player]]): The two players,
+        either of which may be None for a bye.
+        dice (Dice, optional): The source of rolls for every game in the
+        matchup. Defaults to the global random number generator.
+        timeout (Optional[float], optional): The most seconds to wait for any
+        one decision. Defaults to None, no limit.
+
+    Returns:
+        Player: The winner of the matchup.
+    """
+    p1, p2 = matchup
+    if p1 is None:
+        return p2  # type: ignore
+    if p2 is None:
+        return p1
+    while True:
+        game_state = await game.play_async([p1, p2], dice=dice, timeout=timeout)
+        if game_state.winner is not None:
+            return (p1, p2)[game_state.winner]
+
+
+def decide_matchup(players: tuple[str, str], dice: Dice) -> list[GameState]:
+    """
+    Plays a matchup, including any tie-break replays, without sending any
+    signals. This runs in a worker process, so players are passed by module
+    name and imported here.
+
+    Args:
+        players (tuple[str, str]): The module names of the two players.
+        dice (Dice): The source of rolls for every game in the matchup.
+
+    Returns:
+        list[GameState]: The final state of every game played, in order; the
+        last one decides the matchup, just as in play_matchup().
+    """
+    modules = [resolve(name) for name in players]
+    games: list[GameState] = []
+    while not games or games[-1].winner is None:
+        games += [game.simulate(modules, headless=True, dice=dice)]
+    return games
+
+
+def play_round_in_parallel(
+    pool: Executor,
+    matchups: list[tuple[Optional[Player], Optional[Player]]],
+    dice: list[Dice],
+) -> list[Player]:
+    """
+    Farms every matchup in a round out to a pool of processes, then replays
+    each game's game_ended signal in bracket order, just as the serial path
+    would send them.
+
+    Args:
+        pool (Executor): The process pool.
+        matchups (list[tuple[Optional[Player], Optional[Player]]]): The round's
+        matchups.
+        dice (list[Dice]): The source of rolls for each matchup.
+
+    Returns:
+        list[Player]: The winner of each matchup.
+    """
+    futures: list[Optional[Future]] = [
+        None
+        if p1 is None or p2 is None
+        else pool.submit(decide_matchup, (p1.__name__, p2.__name__), matchup_dice)
+        for (p1, p2), matchup_dice in zip(matchups, dice)
+    ]
+
+    winners: list[Player] = []
+    for (p1, p2), future in zip(matchups, futures):
+        if future is None:
+            winners += [play_matchup((p1, p2))]
+            continue
+        games: list[GameState] = future.result()
+        for game_state in games:
+            signals.game_ended.send(game_state, players=[p1, p2])
+        winners += [(p1, p2)[games[-1].winner]]  # type: ignore
+    return winners
 
 
 def crown_champion(
@@ -126,27 +241,174 @@ def crown_champion(
     return state.update(champion=initial_field.index(winners[0]))
 
 
-def play(players: list[Player], rounds: Optional[int] = None) -> TournamentState:
+def play(
+    players: list[Player],
+    rounds: Optional[int] = None,
+    seed: Optional[int] = None,
+    parallel: bool = False,
+    workers: Optional[int] = None,
+    dice: Optional[Dice] = None,
+    engine: Engine = "frozen",
+    stats: Optional[DecisionStats] = None,
+    sandbox: Optional[Sandbox] = None,
+    timeout: Optional[float] = None,
+) -> TournamentState:
+    """
+    Plays a blind-seeded, single-elimination tournament.
+
+    Args:
+        players (list[Player]): The field of players.
+        rounds (Optional[int], optional): The number of rounds to play.
+        Defaults to None, enough rounds to crown a champion.
+        seed (Optional[int], optional): Seeds the bracket and every matchup, so
+        the same seed always crowns the same champion, serial or parallel.
+        Defaults to None.
+        parallel (bool, optional): Whether to play each round's matchups on a
+        pool of processes. Players must then be importable modules, and only
+        the game_ended signal is sent for each game. Defaults to False.
+        workers (Optional[int], optional): The number of worker processes in
+        parallel mode. Defaults to None, one per CPU.
+        dice (Optional[Dice], optional): The source of rolls; each matchup
+        plays with its own source spawned from it. Defaults to None, which
+        uses the seed if given, or the global random number generator.
+        engine (Engine, optional): The game engine for serial matchups.
+        Defaults to "frozen".
+        stats (Optional[DecisionStats], optional): Times every roll_again()
+        call. Defaults to None.
+        sandbox (Optional[Sandbox], optional): Runs every roll_again() call
+        under a time budget; a player who breaks it forfeits the game.
+        Defaults to None.
+        timeout (Optional[float], optional): The most seconds to wait for any
+        asynchronous decision before the player forfeits the game. Defaults to
+        None, no limit.
+
+    If any player decides asynchronously, the tournament is played with
+    play_async() on a new event loop.
+
+    Raises:
+        ValueError: If stats or a sandbox are asked for in parallel mode, where
+        the players decide in other processes, or alongside asynchronous
+        players, or a timeout is asked for without any.
+
+    Returns:
+        TournamentState: The final tournament state.
+    """
+    if parallel and stats is not None:
+        raise ValueError("Decision stats can't be collected in parallel mode.")
+    if parallel and sandbox is not None:
+        raise ValueError("Players can't be sandboxed in parallel mode.")
+    if any(game.decides_async(player) for player in players):
+        if parallel or stats is not None or sandbox is not None:
+            raise ValueError(
+                "Players who decide asynchronously can't play in parallel, "
+                "with stats, or in a sandbox."
+            )
+        return asyncio.run(play_async(players, rounds, seed, dice, timeout))
+    if timeout is not None:
+        raise ValueError(
+            "A timeout only applies to players who decide asynchronously; "
+            "use a sandbox."
+        )
     rounds = rounds or rounds_necessary_for_winner(len(players))
-    active_players: list[Optional[Player]] = seed_players(players, rounds)
+    if dice is None:
+        dice = dice_sources.default if seed is None else RandomDice(seed)
+    if parallel and isinstance(dice, GlobalDice):
+        # Forked workers share the parent's random state, so every matchup
+        # needs its own stream to avoid replaying the same dice.
+        dice = RandomDice(random.getrandbits(64))
+    rng = random if seed is None else random.Random(seed)
+    active_players: list[Optional[Player]] = seed_players(players, rounds, rng)
+    pool = ProcessPoolExecutor(max_workers=workers) if parallel else None
 
     state = TournamentState()
     signals.tournament_started.send(state)
 
     # Play the games
     round = 1
-    while round <= rounds:
+    try:
+        while round <= rounds:
+            state = state.update(round=round)
+            signals.tournament_round_started.send(state, players=active_players)
+
+            matchups = list(matchup_players(active_players))
+            round_dice = [dice.spawn(f"{round}:{i}") for i in range(len(matchups))]
+            if pool is None:
+                round_winners = [
+                    play_matchup(matchup, matchup_dice, engine, stats, sandbox)
+                    for matchup, matchup_dice in zip(matchups, round_dice)
+                ]
+            else:
+                round_winners = play_round_in_parallel(pool, matchups, round_dice)
+
+            active_players = round_winners.copy()  # type: ignore
+            signals.tournament_round_ended.send(state, players=active_players)
+            round += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+
+    state = crown_champion(state, winners=active_players, initial_field=players)
+    signals.tournament_ended.send(state, players=players)
+    return state
+
+
+async def play_async(
+    players: list[Player],
+    rounds: Optional[int] = None,
+    seed: Optional[int] = None,
+    dice: Optional[Dice] = None,
+    timeout: Optional[float] = None,
+) -> TournamentState:
+    """
+    Plays a blind-seeded, single-elimination tournament on the running event
+    loop, with every matchup in a round played as a concurrent task. Players
+    may decide asynchronously (see game.play_async()). Signals from concurrent
+    games interleave.
+
+    Args:
+        players (list[Player]): The field of players.
+        rounds (Optional[int], optional): The number of rounds to play.
+        Defaults to None, enough rounds to crown a champion.
+        seed (Optional[int], optional): Seeds the bracket and every matchup, so
+        the same seed crowns the same champion as play(). Defaults to None.
+        dice (Optional[Dice], optional): The source of rolls; each matchup
+        plays with its own source spawned from it. Defaults to None, which
+        uses the seed if given, or a stream drawn from the global random
+        number generator.
+        timeout (Optional[float], optional): The most seconds to wait for any
+        one decision; a player who takes longer forfeits the game. Defaults to
+        None, no limit.
+
+    Returns:
+        TournamentState: The final tournament state.
+    """
+    rounds = rounds or rounds_necessary_for_winner(len(players))
+    if dice is None:
+        dice = dice_sources.default if seed is None else RandomDice(seed)
+    if isinstance(dice, GlobalDice):
+        # Concurrent matchups would otherwise take turns with one stream, in
+        # whatever order they happen to be scheduled.
+        dice = RandomDice(random.getrandbits(64))
+    rng = random if seed is None else random.Random(seed)
+    active_players: list[Optional[Player]] = seed_players(players, rounds, rng)
+
+    state = TournamentState()
+    signals.tournament_started.send(state)
+
+    for round in range(1, rounds + 1):
         state = state.update(round=round)
         signals.tournament_round_started.send(state, players=active_players)
 
-        round_winners: list[Player] = []
-        for matchup in matchup_players(active_players):
-            winner = play_matchup(matchup)
-            round_winners += [winner]
+        matchups = list(matchup_players(active_players))
+        round_winners = await asyncio.gather(
+            *(
+                play_matchup_async(matchup, dice.spawn(f"{round}:{i}"), timeout)
+                for i, matchup in enumerate(matchups)
+            )
+        )
 
-        active_players = round_winners.copy()  # type: ignore
+        active_players = list(round_winners)
         signals.tournament_round_ended.send(state, players=active_players)
-        round += 1
 
     state = crown_champion(state, winners=active_players, initial_field=players)
     signals.tournament_ended.send(state, players=players)
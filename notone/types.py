@@ -1,24 +1,136 @@
 from __future__ import annotations
+from array import array
 from dataclasses import asdict, dataclass
 from types import ModuleType
 from typing import Callable, Literal, Optional
 
 ResetableAttribute = Literal["turn_rolls", "turn_score"]
 IncrementableAttribute = Literal["round", "turn_rolls", "turn_score"]
+TurnAttribute = Literal["turn_rolls", "turn_score"]
 GameType = Literal["game", "tournament"]
+Engine = Literal["frozen", "mutable", "sampled"]
 Player = ModuleType
 
 
 @dataclass(frozen=True)
 class GameState:
     active: int = 0
-    rolls: tuple[int, int] = (0, 0)
+    # One entry per player.
+    rolls: tuple[int, ...] = (0, 0)
     round: int = 0
-    scores: tuple[int, int] = (0, 0)
+    # One entry per player.
+    scores: tuple[int, ...] = (0, 0)
     turn_rolls: int = 0
     turn_score: int = 0
     roll: tuple[int, int] = (0, 0)
     winner: Optional[int] = None
+    forfeited: Optional[int] = None
+
+
+class MutableGameState:
+    """A mutable, slot-based mirror of GameState used by the "mutable" engine.
+
+    The engine updates this in place and only materializes a frozen GameState
+    via snapshot() when something outside the engine (a player or a signal
+    receiver) needs to see it. Snapshots are cached until the next mutation.
+    Scores and rolls are compact integer arrays, updated in place at the end of
+    every turn, however many players there are.
+    """
+
+    __slots__ = (
+        "active",
+        "rolls",
+        "round",
+        "scores",
+        "turn_rolls",
+        "turn_score",
+        "roll",
+        "winner",
+        "forfeited",
+        "_snapshot",
+    )
+
+    def __init__(self, state: GameState = GameState()):
+        self.active = state.active
+        self.rolls = array("q", state.rolls)
+        self.round = state.round
+        self.scores = array("q", state.scores)
+        self.turn_rolls = state.turn_rolls
+        self.turn_score = state.turn_score
+        self.roll = state.roll
+        self.winner = state.winner
+        self.forfeited = state.forfeited
+        self._snapshot: Optional[GameState] = state
+
+    def snapshot(self) -> GameState:
+        if self._snapshot is None:
+            self._snapshot = GameState(
+                active=self.active,
+                rolls=tuple(self.rolls),  # type: ignore
+                round=self.round,
+                scores=tuple(self.scores),  # type: ignore
+                turn_rolls=self.turn_rolls,
+                turn_score=self.turn_score,
+                roll=self.roll,
+                winner=self.winner,
+                forfeited=self.forfeited,
+            )
+        return self._snapshot
+
+    def start_round(self, round: int):
+        self.round = round
+        self._snapshot = None
+
+    def start_turn(self, active: int):
+        self.active = active
+        self.turn_rolls = 0
+        self.turn_score = 0
+        self._snapshot = None
+
+    def record_roll(self, d1: int, d2: int):
+        self.turn_rolls += 1
+        self.roll = (d1, d2)
+        self._snapshot = None
+
+    def record_turn(self, turn_score: int, turn_rolls: int):
+        self.turn_score = turn_score
+        self.turn_rolls = turn_rolls
+        self._snapshot = None
+
+    def add_turn_score(self, amount: int):
+        self.turn_score += amount
+        self._snapshot = None
+
+    def reset_turn_score(self):
+        self.turn_score = 0
+        self._snapshot = None
+
+    def end_turn(self, active: int):
+        self.scores[active] += self.turn_score
+        self.rolls[active] += self.turn_rolls
+        self._snapshot = None
+
+    def set_winner(self, winner: Optional[int]):
+        self.winner = winner
+        self._snapshot = None
+
+    def forfeit(self, active: int, winner: Optional[int]):
+        self.forfeited = active
+        self.winner = winner
+        self._snapshot = None
+
+
+@dataclass(frozen=True)
+class Threshold:
+    """A policy that rolls again while a turn attribute is below a limit, like
+    "roll until I've scored 40 this turn". Players can declare theirs as a
+    module-level `policy`, so their odds can be worked out exactly."""
+
+    attribute: TurnAttribute
+    limit: int
+
+    def roll_again(self, state: GameState) -> bool:
+        return getattr(state, self.attribute) < self.limit
 
 
 @dataclass(frozen=True)
@@ -0,0 +1,18 @@
+"""Crashing Cass has a bug in their strategy."""
+from notone.types import GameState
+
+
+def name() -> str:
+    return "Crashing Cass"
+
+
+def emoji() -> str:
+    return "💥"
+
+
+def victory_cry() -> str:
+    return "It works on my machine!"
+
+
+def roll_again(state: GameState) -> bool:
+    return 1 / 0 > state.turn_score
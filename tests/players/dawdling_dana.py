@@ -0,0 +1,21 @@
+"""Dawdling Dana thinks a little too long about every roll."""
+import time
+
+from notone.types import GameState
+
+
+def name() -> str:
+    return "Dawdling Dana"
+
+
+def emoji() -> str:
+    return "🐢"
+
+
+def victory_cry() -> str:
+    return "Slow and steady!"
+
+
+def roll_again(state: GameState) -> bool:
+    time.sleep(0.02)
+    return state.turn_rolls < 3
@@ -0,0 +1,18 @@
+"""External Eve is a separate program (see notone.external) who rolls while
+their turn score is under 20. Pass "crash" to make her exit after answering
+once, "shy" to make her skip her introduction, or "hang" to make her stop
+answering after her first message."""
+import json
+import sys
+import time
+
+if __name__ == "__main__":
+    if "shy" not in sys.argv:
+        print(json.dumps({"name": "External Eve", "emoji": "🛰️"}), flush=True)
+    for line in sys.stdin:
+        states = json.loads(line)
+        print(json.dumps([state["turn_score"] < 20 for state in states]), flush=True)
+        if "crash" in sys.argv:
+            break
+        if "hang" in sys.argv:
+            time.sleep(60)
@@ -0,0 +1,21 @@
+"""Stalling Stan never makes up their mind."""
+import time
+
+from notone.types import GameState
+
+
+def name() -> str:
+    return "Stalling Stan"
+
+
+def emoji() -> str:
+    return "🐌"
+
+
+def victory_cry() -> str:
+    return "Worth the wait."
+
+
+def roll_again(state: GameState) -> bool:
+    time.sleep(60)
+    return False
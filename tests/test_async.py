@@ -0,0 +1,138 @@
+import asyncio
+import time
+from types import ModuleType
+
+import pytest
+
+from notone import game, tournament
+from notone.dice import RandomDice
+from notone.players import aggro_aiden, cautious_carter
+
+DELAY = 0.01
+
+
+async def serve(reader, writer):
+    """A stand-in for a model server: answers each "turn_score" line with
+    whether to roll again, after a short think."""
+    while line := await reader.readline():
+        await asyncio.sleep(DELAY)
+        writer.write(b"1\n" if int(line) < 20 else b"0\n")
+        await writer.drain()
+    writer.close()
+
+
+def remote_player(port: int) -> ModuleType:
+    player = ModuleType("remote_rita")
+
+    async def roll_again(state):
+        reader, writer = await asyncio.open_connection("127.0.0.1", port)
+        writer.write(f"{state.turn_score}\n".encode())
+        await writer.drain()
+        answer = await reader.readline()
+        writer.close()
+        await writer.wait_closed()
+        return answer == b"1\n"
+
+    player.roll_again = roll_again  # type: ignore
+    return player
+
+
+def with_server(test):
+    async def run():
+        server = await asyncio.start_server(serve, "127.0.0.1", 0)
+        port = server.sockets[0].getsockname()[1]
+        async with server:
+            return await test(remote_player(port))
+
+    return asyncio.run(run())
+
+
+def test_async_games_overlap():
+    async def test(remote):
+        start = time.perf_counter()
+        one = await game.play_async([remote, cautious_carter], dice=RandomDice(0))
+        alone = time.perf_counter() - start
+
+        start = time.perf_counter()
+        games = await asyncio.gather(
+            *(
+                game.play_async([remote, cautious_carter], dice=RandomDice(0))
+                for _ in range(20)
+            )
+        )
+        together = time.perf_counter() - start
+        return one, alone, games, together
+
+    one, alone, games, together = with_server(test)
+    assert all(state == one for state in games)
+    assert together < alone * 5
+
+
+def test_async_engine_matches_mutable_engine():
+    players = [aggro_aiden, cautious_carter]
+    played = asyncio.run(game.play_async(players, dice=RandomDice(3)))
+    assert played == game.play(players, engine="mutable", dice=RandomDice(3))
+
+
+def test_slow_async_player_forfeits():
+    async def test(remote):
+        return await game.play_async(
+            [cautious_carter, remote], dice=RandomDice(1), timeout=DELAY / 10
+        )
+
+    state = with_server(test)
+    assert state.forfeited == 1
+    assert state.winner == 0
+
+
+def test_sync_engines_reject_async_players():
+    async_player = ModuleType("async_alex")
+
+    async def roll_again(state):
+        return False
+
+    async_player.roll_again = roll_again  # type: ignore
+    with pytest.raises(ValueError, match="play_async"):
+        game.play([async_player, cautious_carter])
+
+
+def test_async_tournament_crowns_champion():
+    async def test(remote):
+        field = [remote, aggro_aiden, cautious_carter]
+        return await tournament.play_async(field, seed=5)
+
+    state = with_server(test)
+    assert state.champion is not None
+
+
+def test_slow_async_player_forfeits_tournament_games():
+    def test(remote):
+        # Without a timeout, remote wins this tournament.
+        field = [remote, aggro_aiden, cautious_carter]
+        return asyncio.to_thread(tournament.play, field, seed=1, timeout=DELAY / 10)
+
+    state = with_server(test)
+    assert state.champion != 0
+
+
+def test_tournament_timeout_needs_async_players():
+    with pytest.raises(ValueError, match="sandbox"):
+        tournament.play([aggro_aiden, cautious_carter], seed=5, timeout=1.0)
+
+
+def test_tournament_runs_async_players_on_an_event_loop():
+    async_player = ModuleType("async_alex")
+
+    async def roll_again(state):
+        await asyncio.sleep(0)
+        return state.turn_rolls < 2
+
+    async_player.roll_again = roll_again  # type: ignore
+    state = tournament.play([async_player, aggro_aiden, cautious_carter], seed=5)
+    assert state.champion is not None
+
+
+def test_async_tournament_matches_sync_tournament():
+    field = [aggro_aiden, cautious_carter]
+    played = asyncio.run(tournament.play_async(field, seed=8))
+    assert played == tournament.play(field, seed=8)
@@ -0,0 +1,65 @@
+from types import ModuleType
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from notone import batch  # noqa: E402
+from notone.players import aggro_aiden, cautious_carter  # noqa: E402
+
+
+def test_simulate_plays_every_game():
+    result = batch.simulate([aggro_aiden, cautious_carter], n_games=100, seed=1)
+    assert result.games == 100
+    assert result.scores.shape == (100, 2)
+    assert result.wins.sum() + result.ties == 100
+
+
+def test_simulate_is_reproducible_for_a_seed():
+    first = batch.simulate([aggro_aiden, cautious_carter], n_games=50, seed=7)
+    second = batch.simulate([aggro_aiden, cautious_carter], n_games=50, seed=7)
+    assert np.array_equal(first.scores, second.scores)
+    assert np.array_equal(first.rolls, second.rolls)
+
+
+def test_simulate_respects_the_rounds():
+    result = batch.simulate([cautious_carter, cautious_carter], n_games=10, rounds=3)
+    # Cautious Carter rolls exactly once per turn.
+    assert (result.rolls == 3).all()
+
+
+def test_zero_rounds_are_all_ties():
+    result = batch.simulate([aggro_aiden, cautious_carter], n_games=10, rounds=0)
+    assert result.ties == 10
+
+
+def test_falls_back_to_per_game_decisions(mocker):
+    player = mocker.Mock(spec=["roll_again"])
+    player.roll_again.side_effect = lambda state: state.turn_rolls < 2
+    result = batch.simulate([player, cautious_carter], n_games=5, rounds=1)
+    assert player.roll_again.call_count >= 5
+    assert (result.rolls[:, 0] >= 1).all()
+
+
+def test_vectorized_and_per_game_decisions_match(mocker):
+    per_game = mocker.Mock(spec=["roll_again"])
+    per_game.roll_again.side_effect = aggro_aiden.roll_again
+    vectorized = batch.simulate([aggro_aiden, cautious_carter], n_games=20, seed=3)
+    fallback = batch.simulate([per_game, cautious_carter], n_games=20, seed=3)
+    assert np.array_equal(vectorized.scores, fallback.scores)
+
+
+def test_rejects_async_players_without_batch_decisions():
+    async_player = ModuleType("async_alex")
+
+    async def roll_again(state):
+        return False
+
+    async_player.roll_again = roll_again  # type: ignore
+    with pytest.raises(ValueError, match="asynchronously"):
+        batch.simulate([async_player, cautious_carter], n_games=5)
+
+
+def test_winners_handles_ties():
+    scores = np.array([[10, 5], [5, 10], [7, 7]])
+    assert list(batch.winners(scores)) == [0, 1, -1]
@@ -0,0 +1,90 @@
+from types import ModuleType
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from notone import batch, compiler, strategy  # noqa: E402
+from notone.players import aggro_aiden, cautious_carter, p1  # noqa: E402
+from notone.types import GameState  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def cache_dir(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOTONE_CACHE_DIR", str(tmp_path))
+    return tmp_path
+
+
+def test_accessed_fields_finds_what_the_player_reads():
+    assert compiler.accessed_fields(aggro_aiden) == {"turn_score"}
+    assert compiler.accessed_fields(p1) == {"turn_rolls"}
+
+
+def test_compiled_player_matches_original():
+    compiled = compiler.compile(aggro_aiden)
+    assert compiled.axes == ("turn_score",)
+    for state in compiler.sample_states(200):
+        assert compiled.roll_again(state) == aggro_aiden.roll_again(state)
+
+
+def test_compiled_player_keeps_its_personality():
+    compiled = compiler.compile(p1)
+    assert compiled.name() == p1.name()
+    assert compiled.emoji() == p1.emoji()
+    assert compiled.victory_cry() == p1.victory_cry()
+
+
+def test_compiled_player_falls_back_outside_the_table(mocker):
+    compiled = compiler.compile(aggro_aiden)
+    fallback = mocker.spy(aggro_aiden, "roll_again")
+    compiled.roll_again(GameState(turn_score=10_000))
+    assert fallback.called
+
+
+def test_compiled_tables_are_cached_on_disk(cache_dir):
+    compiler.compile(cautious_carter)
+    assert list(cache_dir.glob("compiled-*.npz"))
+    assert compiler.compile(cautious_carter).table.any()
+
+
+def test_players_reading_scores_cannot_be_compiled():
+    player = ModuleType("leader")
+    player.roll_again = lambda state: state.scores[0] < 100  # type: ignore
+    with pytest.raises(ValueError):
+        compiler.compile(player)
+
+
+def test_compiled_players_play_the_same_batch_games():
+    compiled = [compiler.compile(aggro_aiden), compiler.compile(p1)]
+    original = batch.simulate([aggro_aiden, p1], n_games=200, seed=4)
+    result = batch.simulate(compiled, n_games=200, seed=4)
+    assert np.array_equal(result.scores, original.scores)
+
+
+def test_edited_specs_get_new_tables(tmp_path):
+    spec = tmp_path / "steady.toml"
+    spec.write_text('name = "Steady"\n[[rules]]\nroll_while = { turn_score = 20 }\n')
+    before = strategy.load(spec)
+    spec.write_text('name = "Steady"\n[[rules]]\nroll_while = { turn_score = 30 }\n')
+    after = strategy.load(spec)
+    assert compiler.source_hash(before) != compiler.source_hash(after)
+    assert compiler.compile(after).roll_again(GameState(turn_score=25))
+
+
+def test_players_without_source_are_not_cached(cache_dir):
+    player = strategy.build(
+        {"name": "Built", "rules": [{"roll_while": {"turn_score": 20}}]}, "built"
+    )
+    del player.source  # type: ignore
+    assert compiler.source_hash(player) is None
+    compiler.compile(player)
+    assert not list(cache_dir.glob("compiled-*.npz"))
+
+
+def test_fields_read_only_outside_the_samples_are_caught():
+    player = ModuleType("late_bloomer")
+    player.roll_again = lambda state: (  # type: ignore
+        state.turn_score < 300 or state.round < 5
+    )
+    with pytest.raises(ValueError, match="round"):
+        compiler.compile(player)
@@ -0,0 +1,111 @@
+import pytest
+
+from notone import console, game, signals, tournament
+from notone.dice import RandomDice
+from notone.players import aggro_aiden, cautious_carter
+from notone.stats import DecisionStats
+
+
+@pytest.fixture
+def cleanup():
+    yield
+    console.close()
+    console.pause_between_rounds = True
+    console.disconnect_output("game")
+    console.disconnect_output("tournament")
+
+
+def test_buffered_writer_prints_in_order(capsys):
+    writer = console.BufferedWriter(batch_size=3)
+    for i in range(10):
+        writer.write(f"line {i}")
+    writer.close()
+    assert capsys.readouterr().out.splitlines() == [f"line {i}" for i in range(10)]
+
+
+def test_buffered_writer_raises_print_errors(mocker):
+    mocker.patch.object(console, "print", side_effect=BrokenPipeError)
+    writer = console.BufferedWriter(batch_size=1, buffer=2)
+    writer.write("line")
+    with pytest.raises(BrokenPipeError):
+        writer.flush()
+    with pytest.raises(BrokenPipeError):
+        for i in range(10):
+            writer.write(f"line {i}")
+    with pytest.raises(BrokenPipeError):
+        writer.close()
+    assert not writer.thread.is_alive()
+
+
+def test_buffered_output_matches_direct_output(capsys, cleanup):
+    console.connect_output("game")
+    game.play([aggro_aiden, cautious_carter], rounds=3, dice=RandomDice(5))
+    console.disconnect_output("game")
+    direct = capsys.readouterr().out
+
+    console.connect_output("game", buffered=True)
+    game.play([aggro_aiden, cautious_carter], rounds=3, dice=RandomDice(5))
+    console.close()
+    assert capsys.readouterr().out == direct
+
+
+def test_non_interactive_tournament_never_waits(mocker, cleanup):
+    wait = mocker.patch("builtins.input")
+    console.connect_output("tournament", buffered=True, interactive=False)
+    tournament.play([aggro_aiden, cautious_carter] * 4, seed=1)
+    console.close()
+    assert not wait.called
+
+
+def test_disconnect_output_stops_printing(capsys, cleanup):
+    console.connect_output("game")
+    console.disconnect_output("game")
+    game.play([aggro_aiden, cautious_carter], rounds=1)
+    assert capsys.readouterr().out == ""
+
+
+def test_summary_tallies_games_and_tournaments(cleanup):
+    console.connect_summary(total=2)
+    tournament.play([aggro_aiden, cautious_carter] * 2, seed=3, engine="mutable")
+    tournament.play([aggro_aiden, cautious_carter] * 2, seed=4, engine="mutable")
+    summary = console.summary
+    assert summary is not None
+    assert summary.tournaments == 2
+    assert summary.games >= 6
+    assert sum(summary.wins.values()) + summary.ties == summary.games
+    assert sum(summary.champions.values()) == 2
+
+
+def test_summary_counts_progress_in_its_unit(cleanup):
+    console.connect_summary(total=4, unit="tournament")
+    tournament.play([aggro_aiden, cautious_carter] * 2, seed=3, engine="mutable")
+    summary = console.summary
+    assert summary is not None
+    title = summary.render().renderables[0]
+    assert "25% done" in title
+
+
+def test_summary_redraws_are_throttled(mocker, cleanup):
+    console.connect_summary()
+    summary = console.summary
+    assert summary is not None
+    update = mocker.spy(summary.live, "update")
+    for _ in range(50):
+        game.play([aggro_aiden, cautious_carter], rounds=1, engine="mutable")
+    assert summary.games == 50
+    assert update.call_count < 50
+
+
+def test_show_decision_stats_lists_slowest_first(capsys):
+    stats = DecisionStats()
+    game.play([aggro_aiden, cautious_carter], dice=RandomDice(2), stats=stats)
+    console.show_decision_stats(stats)
+    lines = capsys.readouterr().out.splitlines()
+    assert lines[0].startswith("PLAYER")
+    assert [line.split()[0] for line in lines[1:]] == list(stats.report())
+
+
+def test_tournament_output_leaves_rolls_unheard(cleanup):
+    console.connect_output("tournament")
+    assert not signals.rolled.receivers
+    assert signals.game_ended.receivers
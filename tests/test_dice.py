@@ -0,0 +1,71 @@
+import random
+
+import pytest
+
+from notone import game
+from notone.dice import GlobalDice, NumpyDice, RandomDice, RecordingDice, ReplayDice
+
+
+def test_global_dice_follow_random_seed():
+    random.seed(3)
+    first = [GlobalDice().roll() for _ in range(20)]
+    random.seed(3)
+    assert [GlobalDice().roll() for _ in range(20)] == first
+
+
+def test_random_dice_match_global_random_for_same_seed():
+    dice = RandomDice(11)
+    random.seed(11)
+    assert [dice.roll() for _ in range(20)] == [random.randint(1, 6) for _ in range(20)]
+
+
+def test_random_dice_spawn_reproducibly():
+    first = RandomDice(5).spawn("1:0")
+    second = RandomDice(5).spawn("1:0")
+    assert [first.roll() for _ in range(20)] == [second.roll() for _ in range(20)]
+
+
+def test_random_dice_spawn_independent_streams():
+    dice = RandomDice(5)
+    first = dice.spawn("1:0")
+    second = dice.spawn("1:1")
+    assert [first.roll() for _ in range(20)] != [second.roll() for _ in range(20)]
+
+
+def test_numpy_dice_roll_in_range_across_blocks():
+    pytest.importorskip("numpy")
+    dice = NumpyDice(1, block=8)
+    rolls = [dice.roll() for _ in range(100)]
+    assert all(1 <= rolled <= 6 for rolled in rolls)
+
+
+def test_numpy_dice_spawn_reproducibly():
+    pytest.importorskip("numpy")
+    first = NumpyDice(1).spawn("a")
+    second = NumpyDice(1).spawn("a")
+    assert [first.roll() for _ in range(20)] == [second.roll() for _ in range(20)]
+
+
+def test_replay_dice_replay_rolls_in_order():
+    dice = ReplayDice([1, 2, 3])
+    assert [dice.roll() for _ in range(3)] == [1, 2, 3]
+
+
+def test_replay_dice_complain_when_exhausted():
+    dice = ReplayDice([])
+    with pytest.raises(ValueError):
+        dice.roll()
+
+
+def test_recorded_game_replays_identically(opponents):
+    recording = RecordingDice(RandomDice(8))
+    original = game.play(opponents, dice=recording)
+    replayed = game.play(opponents, dice=ReplayDice(recording.rolls))
+    assert replayed == original
+
+
+def test_engines_agree_for_the_same_dice(opponents):
+    frozen = game.play(opponents, dice=RandomDice(21))
+    mutable = game.play(opponents, engine="mutable", dice=RandomDice(21))
+    assert mutable == frozen
+    assert game.simulate(opponents, seed=21) == frozen
@@ -0,0 +1,74 @@
+import itertools
+
+import pytest
+
+from notone import exact
+from notone.game import GameState
+from notone.players import aggro_aiden, cautious_carter, load, p1
+from notone.types import Threshold
+
+
+def test_declared_policies_match_roll_again():
+    for player in [aggro_aiden, cautious_carter, *load()]:
+        policy = exact.policy(player)
+        assert policy is not None
+        for turn_rolls, turn_score in itertools.product(range(13), range(121)):
+            state = GameState(turn_rolls=turn_rolls, turn_score=turn_score)
+            assert policy.roll_again(state) == player.roll_again(state)
+
+
+def test_undeclared_player_has_no_policy(mocker):
+    assert exact.policy(mocker.Mock(policy=None)) is None
+
+
+def test_single_roll_turn_is_just_the_dice():
+    outcomes = exact.turn_outcomes(Threshold("turn_rolls", 1))
+    sums = exact.FIRST_ROLL_SUMS
+    assert outcomes == {(total, 1): chance for total, chance in sums.items()}
+
+
+@pytest.mark.parametrize(
+    "threshold", [Threshold("turn_rolls", 4), Threshold("turn_score", 40)]
+)
+def test_turn_outcomes_are_a_distribution(threshold):
+    outcomes = exact.turn_outcomes(threshold)
+    assert sum(outcomes.values()) == pytest.approx(1)
+    if threshold.attribute == "turn_rolls":
+        assert {rolls for _, rolls in outcomes} == {2, 3, 4}
+    else:
+        assert all(score == 0 or score >= 40 for score, _ in outcomes)
+
+
+def test_game_scores_add_up_turns():
+    threshold = Threshold("turn_rolls", 1)
+    scores = exact.game_scores(threshold, 2)
+    assert min(scores) == 4 and max(scores) == 24
+    assert scores[4] == pytest.approx(1 / 36**2)
+    assert sum(scores.values()) == pytest.approx(1)
+
+
+def test_odds_are_complete_and_symmetric():
+    odds = exact.odds([aggro_aiden, p1])
+    assert sum(odds.wins) + odds.tie == pytest.approx(1)
+    flipped = exact.odds([p1, aggro_aiden])
+    assert flipped.wins == pytest.approx(odds.wins[::-1])
+    assert flipped.tie == pytest.approx(odds.tie)
+
+
+def test_odds_match_simulation():
+    pytest.importorskip("numpy")
+    from notone import batch
+
+    result = batch.simulate([aggro_aiden, cautious_carter], 100_000, seed=1)
+    odds = exact.odds([aggro_aiden, cautious_carter])
+    assert result.wins[0] / result.games == pytest.approx(odds.wins[0], abs=0.01)
+
+
+def test_odds_need_declared_policies(mocker):
+    with pytest.raises(ValueError):
+        exact.odds([aggro_aiden, mocker.Mock(__name__="mystery", policy=None)])
+
+
+def test_odds_are_for_two_players():
+    with pytest.raises(ValueError, match="two players"):
+        exact.odds([aggro_aiden, cautious_carter, aggro_aiden])
@@ -0,0 +1,115 @@
+import asyncio
+import sys
+import time
+from types import ModuleType
+
+import pytest
+
+from notone import external, game, players, registry, tournament
+from notone.dice import RandomDice
+from notone.players import aggro_aiden, cautious_carter
+from notone.types import GameState
+
+EVE = [sys.executable, "tests/players/external_eve.py"]
+
+
+@pytest.fixture
+def eve():
+    player = external.load(EVE)
+    yield player
+    player.program.close()
+
+
+def steady(state: GameState) -> bool:
+    return state.turn_score < 20
+
+
+def test_load_reads_introduction(eve):
+    assert eve.name() == "External Eve"
+    assert eve.emoji() == "🛰️"
+    assert eve.victory_cry() == "External Eve wins!"
+    assert game.decides_async(eve)
+
+
+def test_external_player_plays_like_in_process_player(eve):
+    in_process = ModuleType("in_process")
+    in_process.roll_again = steady  # type: ignore
+    played = asyncio.run(game.play_async([eve, cautious_carter], dice=RandomDice(6)))
+    expected = game.play([in_process, cautious_carter], dice=RandomDice(6))
+    assert played == expected
+
+
+def test_concurrent_games_share_messages(eve):
+    async def play_many():
+        return await asyncio.gather(
+            *(
+                game.play_async([eve, aggro_aiden], dice=RandomDice(seed))
+                for seed in range(50)
+            )
+        )
+
+    asyncio.run(play_many())
+    program = eve.program
+    assert program.decisions > 0
+    assert program.messages * 10 < program.decisions
+
+
+def test_program_that_exits_forfeits_and_restarts():
+    crashing = external.load(EVE + ["crash"])
+    try:
+        state = asyncio.run(
+            game.play_async([crashing, cautious_carter], dice=RandomDice(1))
+        )
+        assert state.forfeited == 0
+        state = asyncio.run(
+            game.play_async([cautious_carter, crashing], dice=RandomDice(1))
+        )
+        assert state.forfeited == 1
+    finally:
+        crashing.program.close()
+
+
+def test_program_must_introduce_itself():
+    with pytest.raises(external.ProgramError, match="say hello"):
+        external.load(EVE + ["shy"], startup=0.5)
+
+
+def test_decide_checks_answer_count(eve):
+    state = game.new_game(2)
+    assert eve.program.decide([state, state]) == [True, True]
+
+
+def test_resolve_starts_external_players():
+    command = f"external:{sys.executable} tests/players/external_eve.py"
+    assert registry.select([command]) == [command]
+    player = players.resolve(command)
+    try:
+        assert players.identify(player) == command
+    finally:
+        player.program.close()
+
+
+def test_tournament_with_external_player(eve):
+    state = tournament.play([eve, aggro_aiden, cautious_carter], seed=3)
+    assert state.champion is not None
+
+
+def test_batch_engine_asks_whole_batch_at_once(eve):
+    batch = pytest.importorskip("notone.batch")
+    result = batch.simulate([eve, aggro_aiden], n_games=100, seed=1)
+    assert result.games == 100
+    assert eve.program.messages < eve.program.decisions / 10
+
+
+def test_hung_program_forfeits_and_restarts():
+    hanging = external.load(EVE + ["hang"], timeout=0.3)
+    try:
+        start = time.perf_counter()
+        state = asyncio.run(
+            game.play_async([hanging, cautious_carter], dice=RandomDice(1))
+        )
+        assert state.forfeited == 0
+        assert time.perf_counter() - start < 5
+        assert hanging.program.decide([game.new_game(2)]) == [True]
+    finally:
+        hanging.program.close()
@@ -1,8 +1,13 @@
 from dataclasses import FrozenInstanceError
+from importlib import import_module
+import random
+
 import pytest
 
-from notone import game
-from notone.types import GameState
+from notone import exact, game, signals
+from notone.dice import RandomDice, ReplayDice
+from notone.players import aggro_aiden, cautious_carter, p1
+from notone.types import GameState, MutableGameState
 
 
 def test_game_starts(opponents, game_started):
@@ -87,3 +92,247 @@ def test_prevents_game_state_mutating(mocker):
     malicious_player.roll_again.side_effect = hack_winner
     with pytest.raises(FrozenInstanceError):
         game.play([malicious_player], rounds=1)
+
+
+@pytest.mark.parametrize("seed", [1, 42, 666])
+def test_mutable_engine_matches_frozen_engine(opponents, seed):
+    random.seed(seed)
+    frozen = game.play(opponents)
+    random.seed(seed)
+    mutable = game.play(opponents, engine="mutable")
+    assert mutable == frozen
+
+
+def test_mutable_engine_passes_frozen_state_to_players(mocker):
+    def hack_winner(state: GameState):
+        state.winner = 0  # type: ignore
+
+    malicious_player = mocker.Mock()
+    malicious_player.roll_again.side_effect = hack_winner
+    with pytest.raises(FrozenInstanceError):
+        game.play([malicious_player], rounds=1, engine="mutable")
+
+
+def test_mutable_engine_skips_signals_without_receivers(opponents, mocker, game_ended):
+    send = mocker.spy(signals.Dispatch, "send")
+    snapshot = mocker.spy(MutableGameState, "snapshot")
+    game.play(opponents, engine="mutable")
+    assert signals.rolled not in {call.args[1] for call in send.call_args_list}
+    # Only for the players' decisions, and the final state.
+    decisions = sum(player.roll_again.call_count for player in opponents)
+    assert snapshot.call_count == decisions + 1
+    assert game_ended.called
+
+
+def test_mutable_engine_sends_signals_to_receivers(opponents):
+    received = []
+
+    def receiver(state, **kwargs):
+        received.append(state)
+
+    signals.rolled.connect(receiver)
+    try:
+        game.play(opponents, rounds=1, engine="mutable")
+    finally:
+        signals.rolled.disconnect(receiver)
+    assert received
+    assert all(isinstance(state, GameState) for state in received)
+
+
+@pytest.mark.parametrize("seed", [1, 42, 666])
+def test_simulate_matches_play_for_seed(opponents, seed):
+    random.seed(seed)
+    assert game.simulate(opponents, seed=seed) == game.play(opponents)
+
+
+def test_simulate_goes_headless_without_receivers(opponents, rolled, game_ended):
+    game.simulate(opponents)
+    assert not rolled.called
+    assert not game_ended.called
+
+
+def test_simulate_sends_signals_to_receivers(opponents, game_ended):
+    def receiver(state, **kwargs):
+        pass
+
+    signals.game_ended.connect(receiver)
+    try:
+        game.simulate(opponents, rounds=1)
+    finally:
+        signals.game_ended.disconnect(receiver)
+    assert game_ended.called
+
+
+def test_simulate_can_be_told_to_go_headless(opponents, game_ended):
+    def receiver(state, **kwargs):
+        pass
+
+    signals.game_ended.connect(receiver)
+    try:
+        game.simulate(opponents, rounds=1, headless=True)
+    finally:
+        signals.game_ended.disconnect(receiver)
+    assert not game_ended.called
+
+
+@pytest.mark.parametrize("seed", [1, 42, 666])
+def test_sampled_engine_rolls_for_players_without_policies(opponents, seed):
+    random.seed(seed)
+    mutable = game.play(opponents, engine="mutable")
+    random.seed(seed)
+    sampled = game.play(opponents, engine="sampled")
+    assert sampled == mutable
+
+
+def test_sampled_engine_draws_whole_turns_for_policies():
+    turns = []
+    rolls = []
+
+    def receiver(state, **kwargs):
+        turns.append(state)
+
+    def roll_receiver(state, **kwargs):
+        rolls.append(state)
+
+    signals.turn_ended.connect(receiver)
+    signals.rolled.connect(roll_receiver)
+    try:
+        state = game.play(
+            [aggro_aiden, cautious_carter], engine="sampled", dice=RandomDice(3)
+        )
+    finally:
+        signals.turn_ended.disconnect(receiver)
+        signals.rolled.disconnect(roll_receiver)
+    assert not rolls
+    assert len(turns) == 20
+    for player in range(2):
+        played = [turn for turn in turns if turn.active == player]
+        assert sum(turn.turn_score for turn in played) == state.scores[player]
+        assert sum(turn.turn_rolls for turn in played) == state.rolls[player]
+
+
+def test_sampled_engine_matches_exact_scores():
+    games = 2_000
+    dice = RandomDice(5)
+    total = sum(
+        game.play([aggro_aiden, p1], engine="sampled", dice=dice).scores[0]
+        for _ in range(games)
+    )
+    scores = exact.game_scores(aggro_aiden.policy)
+    expected = sum(score * chance for score, chance in scores.items())
+    assert total / games == pytest.approx(expected, rel=0.03)
+
+
+def test_sampled_engine_needs_uniform_draws():
+    with pytest.raises(ValueError):
+        game.play([aggro_aiden, p1], engine="sampled", dice=ReplayDice([]))
+
+
+@pytest.mark.parametrize("engine", ["frozen", "mutable", "sampled"])
+def test_free_for_all_tracks_every_player(engine):
+    players = [import_module(f"notone.players.p{i}") for i in range(1, 7)]
+    state = game.play(players, engine=engine, dice=RandomDice(8))
+    assert len(state.scores) == len(state.rolls) == 6
+    assert all(rolls >= 10 for rolls in state.rolls)
+    assert state.winner == game.leader(state.scores)
+
+
+@pytest.mark.parametrize("seed", [1, 42, 666])
+def test_free_for_all_engines_match(seed):
+    players = [aggro_aiden, cautious_carter, p1, aggro_aiden, cautious_carter]
+    frozen = game.play(players, dice=RandomDice(seed))
+    mutable = game.play(players, engine="mutable", dice=RandomDice(seed))
+    assert mutable == frozen
+    assert game.simulate(players, dice=RandomDice(seed), headless=True) == frozen
+
+
+@pytest.mark.parametrize(
+    "scores, winner",
+    [
+        ((3, 9, 4, 1), 1),
+        ((3, 9, 9, 1), None),
+        ((0, 0), None),
+        ((5,), 0),
+    ],
+)
+def test_leader_of_any_number_of_players(scores, winner):
+    assert game.leader(scores) == winner
+
+
+def test_leader_can_exclude_a_player():
+    assert game.leader((9, 5, 3), exclude=0) == 1
+    assert game.leader((9, 5, 5), exclude=0) is None
+
+
+def test_forfeit_goes_to_the_best_opponent():
+    state = GameState(scores=(10, 50, 30), rolls=(1, 1, 1))
+    forfeited = game.forfeit_game(state, 1)
+    assert forfeited.winner == 2
+    assert forfeited.forfeited == 1
+
+
+@pytest.mark.parametrize("engine", ["frozen", "mutable"])
+def test_turn_completed_carries_every_roll(engine):
+    turns = []
+
+    def receiver(state, player, rolls):
+        turns.append((state, rolls))
+
+    signals.turn_completed.connect(receiver)
+    try:
+        state = game.play([p1, cautious_carter], engine=engine, dice=RandomDice(2))
+    finally:
+        signals.turn_completed.disconnect(receiver)
+    assert len(turns) == 20
+    for turn, rolls in turns:
+        assert len(rolls) == 2 * turn.turn_rolls
+    for player in range(2):
+        played = [rolls for turn, rolls in turns if turn.active == player]
+        assert sum(len(rolls) for rolls in played) == 2 * state.rolls[player]
+
+
+def test_engines_complete_the_same_turns():
+    completed: dict[str, list] = {"frozen": [], "mutable": []}
+    engine = "frozen"
+
+    def receiver(state, player, rolls):
+        completed[engine].append((state, player, rolls.tolist()))
+
+    signals.turn_completed.connect(receiver)
+    try:
+        game.play([p1, cautious_carter], dice=RandomDice(7))
+        engine = "mutable"
+        game.play([p1, cautious_carter], engine="mutable", dice=RandomDice(7))
+    finally:
+        signals.turn_completed.disconnect(receiver)
+    assert completed["frozen"] == completed["mutable"]
+
+
+def test_mutable_engine_skips_roll_signals_for_turn_receivers(mocker):
+    send = mocker.spy(signals.Dispatch, "send")
+
+    def receiver(state, **kwargs):
+        pass
+
+    signals.turn_completed.connect(receiver)
+    try:
+        game.play([aggro_aiden, cautious_carter], engine="mutable")
+    finally:
+        signals.turn_completed.disconnect(receiver)
+    sent = {call.args[1] for call in send.call_args_list}
+    assert signals.turn_completed in sent
+    assert signals.rolled not in sent
+
+
+def test_sampled_turns_send_no_turn_completed():
+    turns = []
+
+    def receiver(state, player, rolls):
+        turns.append(rolls)
+
+    signals.turn_completed.connect(receiver)
+    try:
+        game.play([aggro_aiden, p1], engine="sampled", dice=RandomDice(3))
+    finally:
+        signals.turn_completed.disconnect(receiver)
+    assert not turns
@@ -0,0 +1,77 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from notone import league  # noqa: E402
+
+PLAYERS = ["aggro_aiden", "cautious_carter", "p1"]
+
+
+@pytest.fixture(scope="module")
+def results() -> league.League:
+    return league.play(PLAYERS, games=200, seed=3, workers=1)
+
+
+def test_every_pair_plays(results):
+    assert (results.games == 200 - 200 * np.eye(3, dtype=int)).all()
+
+
+def test_results_are_consistent(results):
+    assert (results.wins + results.wins.T + results.ties == results.games).all()
+    assert (results.ties >= 0).all()
+
+
+def test_win_rates_are_complementary(results):
+    rates = results.win_rates
+    assert np.allclose(rates[0, 1] + rates[1, 0], 1)
+    assert np.isnan(rates[0, 0])
+
+
+def test_incremental_league_matches_full_league(results):
+    partial = league.play(PLAYERS[:2], games=200, seed=3, workers=1)
+    extended = league.play(PLAYERS, games=200, seed=3, previous=partial, workers=1)
+    assert np.array_equal(extended.wins, results.wins)
+
+
+def test_incremental_league_only_plays_new_pairings(mocker, results):
+    play_pairing = mocker.spy(league, "play_pairing")
+    league.play(PLAYERS + ["p2"], games=200, seed=3, previous=results, workers=1)
+    assert play_pairing.call_count == 3
+
+
+@pytest.mark.parametrize(
+    "settings", [{"games": 100, "seed": 3}, {"games": 200, "seed": 4}]
+)
+def test_incremental_league_refuses_different_settings(results, settings):
+    with pytest.raises(ValueError, match="previous league"):
+        league.play(PLAYERS + ["p2"], previous=results, workers=1, **settings)
+
+
+def test_league_saves_and_loads(results, tmp_path):
+    path = tmp_path / "league.json"
+    results.save(path)
+    loaded = league.League.load(path)
+    assert loaded.players == results.players
+    assert np.array_equal(loaded.wins, results.wins)
+    assert (loaded.seed, loaded.pairing_games, loaded.rounds) == (3, 200, 10)
+
+
+def test_bradley_terry_ranks_the_stronger_player_higher():
+    results = league.League(
+        players=("strong", "weak"),
+        wins=np.array([[0, 75], [25, 0]]),
+        games=np.array([[0, 100], [100, 0]]),
+    )
+    strengths = league.bradley_terry(results)
+    assert strengths[0] / (strengths[0] + strengths[1]) == pytest.approx(0.75)
+
+
+def test_elo_is_centered_on_the_average():
+    ratings = league.elo(np.array([1.0, 10.0]))
+    assert ratings.mean() == pytest.approx(1500)
+    assert ratings[1] - ratings[0] == pytest.approx(400)
+
+
+def test_parallel_league_matches_serial(results):
+    parallel = league.play(PLAYERS, games=200, seed=3, workers=2)
+    assert np.array_equal(parallel.wins, results.wins)
@@ -0,0 +1,46 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from notone import montecarlo  # noqa: E402
+
+PLAYERS = ["aggro_aiden", "cautious_carter"]
+
+
+def test_shard_sizes_cover_every_game():
+    assert montecarlo.shard_sizes(25, 10) == [10, 10, 5]
+
+
+def test_run_plays_every_game():
+    result = montecarlo.run(PLAYERS, 1_000, seed=1, workers=1, shard_size=300)
+    assert result.games == 1_000
+    assert result.wins.sum() + result.ties == 1_000
+    assert (result.score_counts.sum(axis=1) == 1_000).all()
+
+
+def test_run_is_reproducible_for_a_seed():
+    first = montecarlo.run(PLAYERS, 500, seed=5, workers=1, shard_size=100)
+    second = montecarlo.run(PLAYERS, 500, seed=5, workers=1, shard_size=100)
+    assert np.array_equal(first.wins, second.wins)
+    assert np.array_equal(first.score_counts, second.score_counts)
+
+
+def test_run_does_not_depend_on_the_number_of_workers():
+    serial = montecarlo.run(PLAYERS, 400, seed=9, workers=1, shard_size=100)
+    parallel = montecarlo.run(PLAYERS, 400, seed=9, workers=2, shard_size=100)
+    assert np.array_equal(serial.wins, parallel.wins)
+    assert np.array_equal(serial.score_counts, parallel.score_counts)
+
+
+def test_run_handles_no_games():
+    result = montecarlo.run(PLAYERS, 0)
+    assert result.games == 0
+    assert result.win_rates.sum() == 0
+
+
+def test_run_reports_the_seed_it_drew():
+    first = montecarlo.run(PLAYERS, 200, workers=1, shard_size=100)
+    assert first.seed is not None
+    second = montecarlo.run(PLAYERS, 200, seed=first.seed, workers=1, shard_size=100)
+    assert second.seed == first.seed
+    assert np.array_equal(first.score_counts, second.score_counts)
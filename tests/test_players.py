@@ -0,0 +1,20 @@
+from notone import players
+from notone.players import aggro_aiden
+
+
+def test_module_name_expands_short_names():
+    assert players.module_name("p1") == "notone.players.p1"
+
+
+def test_module_name_keeps_module_paths():
+    assert players.module_name("my.player") == "my.player"
+
+
+def test_resolve_imports_modules():
+    assert players.resolve("aggro_aiden") is aggro_aiden
+
+
+def test_resolve_loads_strategy_specs():
+    player = players.resolve("tests/players/steady_stella.json")
+    assert player.name() == "Steady Stella"
+    assert players.identify(player) == "tests/players/steady_stella.json"
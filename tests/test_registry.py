@@ -0,0 +1,93 @@
+import sys
+from importlib.metadata import EntryPoint
+
+import pytest
+
+from notone import players, registry
+
+
+def test_discover_finds_builtin_players_in_natural_order():
+    found = registry.discover()
+    assert found["aggro_aiden"] == "notone.players.aggro_aiden"
+    assert "template" not in found
+    numbered = [name for name in found if name.startswith("p")]
+    assert numbered == [f"p{i}" for i in range(1, 17)]
+
+
+def test_discover_doesnt_import_players(monkeypatch):
+    monkeypatch.delitem(sys.modules, "notone.players.p7", raising=False)
+    registry.discover()
+    registry.select(["p*"])
+    assert "notone.players.p7" not in sys.modules
+
+
+def test_discover_includes_entry_points(mocker):
+    plugin = EntryPoint("stella", "my_players.stella", registry.GROUP)
+    mocker.patch.object(
+        registry, "entry_points", return_value={registry.GROUP: [plugin]}
+    )
+    assert registry.discover()["stella"] == "my_players.stella"
+
+
+def test_select_finds_plugins_by_exact_name(mocker):
+    plugin = EntryPoint("stella", "my_players.stella", registry.GROUP)
+    mocker.patch.object(
+        registry, "entry_points", return_value={registry.GROUP: [plugin]}
+    )
+    assert registry.select(["stella", "p1", "my.player"]) == [
+        "my_players.stella",
+        "notone.players.p1",
+        "my.player",
+    ]
+
+
+def test_select_expands_globs_once_each():
+    assert registry.select(["p1?", "p10", "aggro_aiden"]) == [
+        *(f"notone.players.p{i}" for i in range(10, 17)),
+        "notone.players.aggro_aiden",
+    ]
+
+
+def test_select_expands_spec_globs():
+    assert registry.select(["tests/players/*.json"]) == [
+        "tests/players/steady_stella.json"
+    ]
+
+
+def test_select_rejects_globs_matching_nothing():
+    with pytest.raises(ValueError):
+        registry.select(["nobody*"])
+
+
+@pytest.mark.parametrize(
+    "name, text",
+    [
+        ("field.json", '{"players": ["p1", "p2"]}'),
+        ("field.toml", 'players = ["p1", "p2"]'),
+    ],
+)
+def test_read_config(tmp_path, name, text):
+    if name.endswith(".toml") and sys.version_info < (3, 11):
+        pytest.importorskip("tomli")
+    path = tmp_path / name
+    path.write_text(text)
+    assert registry.read_config(path) == ["p1", "p2"]
+
+
+def test_read_config_needs_players(tmp_path):
+    path = tmp_path / "field.json"
+    path.write_text('{"players": "p1"}')
+    with pytest.raises(ValueError):
+        registry.read_config(path)
+
+
+def test_load_imports_only_the_chosen_players():
+    loaded = players.load(["p2", "cautious_carter"])
+    assert [player.__name__ for player in loaded] == [
+        "notone.players.p2",
+        "notone.players.cautious_carter",
+    ]
+
+
+def test_load_defaults_to_the_list():
+    assert len(players.load()) == 2
@@ -0,0 +1,88 @@
+from contextlib import closing
+import sqlite3
+
+import pytest
+
+from notone import game, players, results, tournament
+from notone.dice import RandomDice
+from notone.players import aggro_aiden, cautious_carter
+from notone.sandbox import Sandbox
+from tests.players import stalling_stan
+
+
+@pytest.fixture
+def store(tmp_path):
+    with results.ResultsStore(tmp_path / "results.db", batch_size=7) as store:
+        yield store
+
+
+def test_records_every_game(store):
+    states = [game.simulate([aggro_aiden, cautious_carter]) for _ in range(20)]
+    store.close()
+    recorded = list(results.games(store.path))
+    assert len(recorded) == 20
+    for (names, state), played in zip(recorded, states):
+        assert names == ["notone.players.aggro_aiden", "notone.players.cautious_carter"]
+        assert state.scores == played.scores
+        assert state.rolls == played.rolls
+        assert state.winner == played.winner
+        assert state.forfeited is None
+
+
+def test_records_tournaments_and_their_games(store):
+    state = tournament.play([aggro_aiden, cautious_carter] * 2, seed=1)
+    store.close()
+    with closing(sqlite3.connect(store.path)) as db:
+        ((champion, tournament_id),) = db.execute(
+            "SELECT champion, id FROM tournaments"
+        ).fetchall()
+        (games,) = db.execute(
+            "SELECT COUNT(*) FROM games WHERE tournament = ?", (tournament_id,)
+        ).fetchone()
+    assert champion == state.champion
+    assert games >= 3
+
+
+def test_stops_recording_when_closed(store):
+    store.close()
+    game.simulate([aggro_aiden, cautious_carter], headless=False)
+    assert list(results.games(store.path)) == []
+
+
+def test_identify_falls_back_to_player_name(mocker):
+    player = mocker.Mock(spec=["name"])
+    player.name.return_value = "Mocky"
+    assert players.identify(player) == "Mocky"
+
+
+def test_records_forfeits(store):
+    with Sandbox(per_call=0.1) as sandbox:
+        played = game.play(
+            [aggro_aiden, stalling_stan], dice=RandomDice(1), sandbox=sandbox
+        )
+    store.close()
+    ((_, state),) = results.games(store.path)
+    assert state.forfeited == played.forfeited == 1
+    assert state.winner == 0
+
+
+def test_adds_forfeits_to_old_databases(tmp_path):
+    path = tmp_path / "old.db"
+    with closing(sqlite3.connect(path)) as db:
+        db.executescript(results.SCHEMA.replace(",\n    forfeited INTEGER", ""))
+    with results.ResultsStore(path):
+        game.simulate([aggro_aiden, cautious_carter], headless=False)
+    ((_, state),) = results.games(path)
+    assert state.forfeited is None
+
+
+def test_writer_errors_reach_the_games(tmp_path):
+    store = results.ResultsStore(tmp_path / "results.db", batch_size=1, buffer=1)
+    with closing(sqlite3.connect(store.path)) as db:
+        db.execute("DROP TABLE games")
+    store.connect()
+    with pytest.raises(sqlite3.OperationalError):
+        for _ in range(10):
+            game.simulate([aggro_aiden, cautious_carter], headless=False)
+    with pytest.raises(sqlite3.OperationalError):
+        store.close()
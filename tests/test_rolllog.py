@@ -0,0 +1,137 @@
+import asyncio
+from types import ModuleType
+
+import pytest
+
+from notone import game, players, rolllog, signals
+from notone.dice import RandomDice
+from notone.players import aggro_aiden, cautious_carter, p1
+
+PLAYERS = [aggro_aiden, cautious_carter]
+
+
+@pytest.fixture
+def log_path(tmp_path):
+    return tmp_path / "games.log"
+
+
+@pytest.fixture
+def played(log_path):
+    with rolllog.RollLogWriter(log_path):
+        return [game.play(PLAYERS, dice=RandomDice(seed)) for seed in range(10)]
+
+
+def test_codes_round_trip():
+    for d1 in range(1, 7):
+        for d2 in range(1, 7):
+            code = rolllog.encode(d1, d2)
+            assert code < 64
+            assert code != rolllog.END_TURN
+            assert rolllog.decode(code) == (d1, d2)
+
+
+def test_logs_every_game(log_path, played):
+    with rolllog.RollLog(log_path) as log:
+        assert len(log) == 10
+        assert log[3].players == (
+            "notone.players.aggro_aiden",
+            "notone.players.cautious_carter",
+        )
+        assert log[3].rounds == 10
+
+
+def test_logs_are_compact(log_path, played):
+    rolls = sum(sum(state.rolls) for state in played)
+    turns = 10 * 20
+    names = 10 * (2 + 2 + len("notone.players.aggro_aiden"))
+    names += 10 * len("notone.players.cautious_carter")
+    overhead = len(rolllog.HEADER) + 10 * 4
+    assert log_path.stat().st_size == rolls + turns + names + overhead
+
+
+def test_replays_games_identically(log_path, played):
+    with rolllog.RollLog(log_path) as log:
+        for logged, state in zip(log, played):
+            assert rolllog.replay(logged) == state
+
+
+def test_replay_sends_the_same_rolls(log_path, rolled):
+    with rolllog.RollLogWriter(log_path):
+        game.play([p1, cautious_carter], dice=RandomDice(1))
+    original = [call.kwargs for call in rolled.call_args_list]
+    rolled.reset_mock()
+
+    received = []
+
+    def receiver(state, **kwargs):
+        received.append(kwargs)
+
+    signals.rolled.connect(receiver)
+    try:
+        with rolllog.RollLog(log_path) as log:
+            rolllog.replay(log[0], players=[p1, cautious_carter])
+    finally:
+        signals.rolled.disconnect(receiver)
+    assert received == original
+
+
+def test_appends_to_existing_logs(log_path, played):
+    with rolllog.RollLogWriter(log_path):
+        game.play(PLAYERS)
+    with rolllog.RollLog(log_path) as log:
+        assert len(log) == 11
+
+
+def test_rejects_other_files(tmp_path):
+    path = tmp_path / "not-a-log"
+    path.write_bytes(b"hello world")
+    with pytest.raises(ValueError):
+        rolllog.RollLog(path)
+
+
+def test_logs_games_from_the_mutable_engine(log_path):
+    with rolllog.RollLogWriter(log_path):
+        state = game.play(PLAYERS, engine="mutable", dice=RandomDice(5))
+    with rolllog.RollLog(log_path) as log:
+        assert rolllog.replay(log[0]) == state
+
+
+def test_refuses_games_with_sampled_turns(log_path):
+    with rolllog.RollLogWriter(log_path):
+        with pytest.raises(ValueError, match="sampled"):
+            game.play(PLAYERS, engine="sampled", dice=RandomDice(5))
+    with rolllog.RollLog(log_path) as log:
+        assert len(log) == 0
+
+
+def test_logs_sampled_games_rolled_die_by_die(log_path):
+    chase = players.resolve("tests/players/chasing_chase.toml")
+    with rolllog.RollLogWriter(log_path):
+        state = game.play([chase, chase], engine="sampled", dice=RandomDice(5))
+    with rolllog.RollLog(log_path) as log:
+        assert rolllog.replay(log[0]) == state
+
+
+def test_logs_concurrent_async_games_separately(log_path):
+    waiting = ModuleType("waiting_wendy")
+
+    async def roll_again(state):
+        await asyncio.sleep(0)
+        return state.turn_rolls < 2
+
+    waiting.roll_again = roll_again  # type: ignore
+
+    async def play_together():
+        return await asyncio.gather(
+            *(
+                game.play_async([waiting, cautious_carter], dice=RandomDice(seed))
+                for seed in range(3)
+            )
+        )
+
+    with rolllog.RollLogWriter(log_path):
+        states = asyncio.run(play_together())
+    with rolllog.RollLog(log_path) as log:
+        assert len(log) == 3
+        replayed = [rolllog.replay(logged) for logged in log]
+    assert sorted(map(repr, replayed)) == sorted(map(repr, states))
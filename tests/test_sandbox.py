@@ -0,0 +1,105 @@
+import time
+
+import pytest
+
+from notone import game, rolllog, tournament
+from notone.dice import RandomDice
+from notone.players import aggro_aiden, cautious_carter
+from notone.sandbox import Forfeit, Sandbox
+from tests.players import crashing_cass, dawdling_dana, stalling_stan
+
+
+@pytest.fixture
+def sandbox():
+    with Sandbox(per_call=0.5) as sandbox:
+        yield sandbox
+
+
+@pytest.mark.parametrize("engine", ["frozen", "mutable"])
+def test_sandboxed_game_matches_direct_game(sandbox, engine):
+    players = [aggro_aiden, cautious_carter]
+    sandboxed = game.play(players, engine=engine, dice=RandomDice(3), sandbox=sandbox)
+    direct = game.play(players, engine=engine, dice=RandomDice(3))
+    assert sandboxed == direct
+    assert sandboxed.forfeited is None
+
+
+@pytest.mark.parametrize("engine", ["frozen", "mutable"])
+def test_slow_decision_forfeits(engine, game_ended):
+    start = time.perf_counter()
+    with Sandbox(per_call=0.1) as sandbox:
+        state = game.play(
+            [aggro_aiden, stalling_stan],
+            engine=engine,
+            dice=RandomDice(1),
+            sandbox=sandbox,
+        )
+    assert time.perf_counter() - start < 10
+    assert state.forfeited == 1
+    assert state.winner == 0
+    game_ended.assert_called_once()
+
+
+def test_game_budget_forfeits():
+    with Sandbox(per_call=1, per_game=0.1) as sandbox:
+        state = game.simulate(
+            [dawdling_dana, cautious_carter], seed=2, headless=True, sandbox=sandbox
+        )
+    assert state.forfeited == 0
+    assert state.winner == 1
+
+
+def test_exception_forfeits(sandbox):
+    state = game.play([crashing_cass, aggro_aiden], dice=RandomDice(1), sandbox=sandbox)
+    assert state.forfeited == 0
+    assert state.winner == 1
+
+
+def test_worker_restarts_after_forfeit():
+    with Sandbox(per_call=0.1) as sandbox:
+        decide = sandbox.deciders([stalling_stan])[0]
+        with pytest.raises(Forfeit) as forfeit:
+            decide(game.GameState())
+        assert forfeit.value.player == 0
+        assert "tests.players.stalling_stan" not in sandbox.workers
+        sandbox.deciders([aggro_aiden])[0](game.GameState())
+        assert sandbox.workers["notone.players.aggro_aiden"].process.is_alive()
+
+
+def test_unimportable_player_forfeits(sandbox, mocker):
+    player = mocker.Mock(__name__="notone.players.nobody")
+    with pytest.raises(Forfeit, match="couldn't be imported"):
+        sandbox.deciders([player])[0](game.GameState())
+
+
+def test_forfeit_decides_tournament_matchup():
+    with Sandbox(per_call=0.1) as sandbox:
+        winner = tournament.play_matchup(
+            (stalling_stan, aggro_aiden), RandomDice(1), sandbox=sandbox
+        )
+    assert winner is aggro_aiden
+
+
+def test_tournament_rejects_sandbox_in_parallel(sandbox):
+    with pytest.raises(ValueError):
+        tournament.play([aggro_aiden, cautious_carter], parallel=True, sandbox=sandbox)
+
+
+def test_forfeited_games_are_not_logged(tmp_path):
+    path = tmp_path / "games.log"
+    with rolllog.RollLogWriter(path), Sandbox(per_call=0.2) as sandbox:
+        game.play(
+            [aggro_aiden, stalling_stan],
+            engine="mutable",
+            dice=RandomDice(1),
+            sandbox=sandbox,
+        )
+        game.play(
+            [aggro_aiden, cautious_carter],
+            engine="mutable",
+            dice=RandomDice(1),
+            sandbox=sandbox,
+        )
+    with rolllog.RollLog(path) as log:
+        assert len(log) == 1
+        assert log[0].players[1] == "notone.players.cautious_carter"
@@ -0,0 +1,61 @@
+import pytest
+
+from notone import signals
+from notone.types import GameState, MutableGameState, SignalHandler, do_nothing
+
+
+@pytest.fixture
+def connected():
+    receivers = []
+
+    def connect(signal, receiver):
+        signal.connect(receiver)
+        receivers.append((signal, receiver))
+
+    yield connect
+    for signal, receiver in receivers:
+        signal.disconnect(receiver)
+
+
+def test_dispatch_drops_no_op_receivers(connected):
+    connected(signals.rolled, do_nothing)
+    dispatch = signals.Dispatch()
+    assert not dispatch.has_receivers(signals.rolled)
+    assert not signals.has_receivers()
+
+
+def test_dispatch_sends_snapshots_to_receivers(connected):
+    received = []
+
+    def receiver(state, **kwargs):
+        received.append((state, kwargs))
+
+    connected(signals.rolled, receiver)
+    dispatch = signals.Dispatch()
+    assert dispatch.has_receivers(*signals.per_roll)
+    state = MutableGameState(GameState(scores=(3, 4), rolls=(1, 2)))
+    dispatch.send(signals.rolled, state, d1=3, d2=4)
+    dispatch.send(signals.roll_failed, state, d1=1, d2=4)
+    assert received == [(state.snapshot(), {"d1": 3, "d2": 4})]
+
+
+def test_dispatch_table_is_built_once(connected):
+    received = []
+    dispatch = signals.Dispatch()
+    connected(signals.rolled, lambda state, **kwargs: received.append(state))
+    dispatch.send(signals.rolled, MutableGameState(), d1=3, d2=4)
+    assert not received
+
+
+def test_connect_skips_no_op_handlers():
+    def handle_rolled(state, **kwargs):
+        pass
+
+    handler = SignalHandler(rolled=handle_rolled)
+    signals.connect(handler)
+    try:
+        assert signals.Dispatch().table == {signals.rolled: (handle_rolled,)}
+        assert not signals.game_started.receivers
+    finally:
+        signals.disconnect(handler)
+    assert not signals.rolled.receivers
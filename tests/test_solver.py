@@ -0,0 +1,104 @@
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from notone import batch, solver  # noqa: E402
+from notone.players import aggro_aiden, optimal_olive  # noqa: E402
+from notone.types import GameState  # noqa: E402
+
+
+@pytest.fixture(scope="module")
+def policy() -> solver.Policy:
+    return solver.solve(rounds=2, max_lead=100, max_turn_score=80)
+
+
+def test_turn_index_follows_turn_order():
+    assert solver.turn_index(round=1, active=0) == 0
+    assert solver.turn_index(round=1, active=1) == 1
+    assert solver.turn_index(round=2, active=1) == 2
+    assert solver.turn_index(round=2, active=0) == 3
+
+
+def test_last_player_behind_keeps_rolling(policy):
+    state = GameState(round=2, active=0, scores=(10, 60), turn_rolls=3, turn_score=40)
+    assert policy.roll_again(state)
+
+
+def test_last_player_ahead_stops_rolling(policy):
+    state = GameState(round=2, active=0, scores=(50, 60), turn_rolls=1, turn_score=12)
+    assert not policy.roll_again(state)
+
+
+def test_first_roll_is_always_taken(policy):
+    # The first roll of a turn can't fail, so it's always worth it.
+    for lead in range(-50, 51, 10):
+        state = GameState(round=1, active=0, scores=(max(lead, 0), max(-lead, 0)))
+        assert policy.roll_again(state)
+
+
+def test_policy_holds_after_the_last_round(policy):
+    assert not policy.roll_again(GameState(round=3))
+
+
+def test_save_and_load_round_trip(policy, tmp_path):
+    path = tmp_path / "policy.npz"
+    solver.save(policy, path)
+    loaded = solver.load(path)
+    assert np.array_equal(loaded.table, policy.table)
+    assert np.array_equal(loaded.opening, policy.opening)
+    assert loaded.rounds == policy.rounds
+
+
+def test_policy_is_cached_on_disk(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOTONE_CACHE_DIR", str(tmp_path))
+    solver.policy.cache_clear()
+    try:
+        solver.policy(rounds=1)
+        assert list(tmp_path.glob("solver-*r1*.npz"))
+        # Nothing's left behind from writing it.
+        assert len(list(tmp_path.iterdir())) == 1
+    finally:
+        solver.policy.cache_clear()
+
+
+def test_policy_is_only_for_two_players(policy):
+    state = GameState(round=1, active=0, scores=(0, 0, 0))
+    with pytest.raises(ValueError, match="two players"):
+        policy.roll_again(state)
+    states = batch.BatchState(
+        active=0,
+        rolls=np.zeros((4, 3), dtype=np.int64),
+        round=1,
+        scores=np.zeros((4, 3), dtype=np.int64),
+        turn_rolls=np.zeros(4, dtype=np.int64),
+        turn_score=np.zeros(4, dtype=np.int64),
+    )
+    with pytest.raises(ValueError, match="two players"):
+        policy.roll_again_batch(states)
+
+
+def test_batch_and_single_decisions_agree(policy):
+    rng = np.random.default_rng(0)
+    scores = rng.integers(0, 120, size=(50, 2))
+    turn_score = rng.integers(0, 90, size=50)
+    turn_rolls = rng.integers(0, 5, size=50)
+    state = batch.BatchState(
+        active=1,
+        rolls=np.zeros((50, 2), dtype=np.int64),
+        round=2,
+        scores=scores,
+        turn_rolls=turn_rolls,
+        turn_score=turn_score,
+    )
+    expected = [policy.roll_again(state.game_state(i)) for i in range(50)]
+    assert list(policy.roll_again_batch(state)) == expected
+
+
+def test_optimal_olive_beats_aggro_aiden(monkeypatch, tmp_path):
+    monkeypatch.setenv("NOTONE_CACHE_DIR", str(tmp_path))
+    solver.policy.cache_clear()
+    try:
+        result = batch.simulate([optimal_olive, aggro_aiden], n_games=2_000, seed=1)
+    finally:
+        solver.policy.cache_clear()
+    assert result.wins[0] > result.wins[1]
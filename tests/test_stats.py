@@ -0,0 +1,89 @@
+from array import array
+from types import ModuleType
+
+import pytest
+
+from notone import game, tournament
+from notone.dice import RandomDice
+from notone.players import aggro_aiden, cautious_carter
+from notone.stats import DecisionStats, percentile
+
+
+@pytest.mark.parametrize("engine", ["frozen", "mutable"])
+def test_stats_count_every_decision(engine):
+    stats = DecisionStats()
+    calls = []
+
+    def roll_again(state):
+        calls.append(state)
+        return aggro_aiden.roll_again(state)
+
+    counting = ModuleType("counting")
+    counting.roll_again = roll_again  # type: ignore
+    game.play(
+        [counting, cautious_carter], engine=engine, dice=RandomDice(1), stats=stats
+    )
+    report = stats.report()
+    assert report["counting"].calls == len(calls)
+    assert report["notone.players.cautious_carter"].calls > 0
+
+
+def test_stats_do_not_change_the_game():
+    timed = game.play(
+        [aggro_aiden, cautious_carter], dice=RandomDice(4), stats=DecisionStats()
+    )
+    untimed = game.play([aggro_aiden, cautious_carter], dice=RandomDice(4))
+    assert timed == untimed
+
+
+def test_simulate_collects_stats_headless():
+    stats = DecisionStats()
+    game.simulate([aggro_aiden, cautious_carter], seed=2, headless=True, stats=stats)
+    assert set(stats.report()) == {
+        "notone.players.aggro_aiden",
+        "notone.players.cautious_carter",
+    }
+
+
+def test_latency_summary():
+    stats = DecisionStats()
+    stats.samples["slow"] = array("q", [1_000, 2_000, 3_000, 4_000])
+    latency = stats.latency("slow")
+    assert latency.calls == 4
+    assert latency.total == pytest.approx(10e-6)
+    assert latency.mean == pytest.approx(2.5e-6)
+    assert latency.p50 == pytest.approx(2e-6)
+    assert latency.max == pytest.approx(4e-6)
+
+
+def test_latency_of_unknown_player_is_empty():
+    assert DecisionStats().latency("nobody").calls == 0
+
+
+def test_report_puts_slowest_first():
+    stats = DecisionStats()
+    stats.samples["fast"] = array("q", [1, 1])
+    stats.samples["slow"] = array("q", [100])
+    assert list(stats.report()) == ["slow", "fast"]
+
+
+def test_percentile_nearest_rank():
+    ordered = list(range(1, 101))
+    assert percentile(ordered, 0.5) == 50
+    assert percentile(ordered, 0.99) == 99
+    assert percentile([7], 0.9) == 7
+
+
+def test_percentile_rounds_ranks_up():
+    assert percentile([1, 2, 3, 4, 5], 0.5) == 3
+    assert percentile(list(range(1, 11)), 0.99) == 10
+    assert percentile(list(range(1, 11)), 0.9) == 9
+    assert percentile(list(range(1, 101)), 0.07) == 7
+    assert percentile([1, 2], 0.0) == 1
+
+
+def test_tournament_rejects_stats_in_parallel():
+    with pytest.raises(ValueError):
+        tournament.play(
+            [aggro_aiden, cautious_carter], parallel=True, stats=DecisionStats()
+        )
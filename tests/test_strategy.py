@@ -0,0 +1,125 @@
+import itertools
+import sys
+
+import pytest
+
+from notone import exact, game, strategy
+from notone.dice import RandomDice
+from notone.players import cautious_carter
+from notone.types import GameState, Threshold
+
+CHASE = "tests/players/chasing_chase.toml"
+STELLA = "tests/players/steady_stella.json"
+
+
+def chase_by_hand(state: GameState) -> bool:
+    deficit = state.scores[1 - state.active] - state.scores[state.active]
+    if state.round >= 8 and deficit >= 30:
+        return state.turn_score < 50
+    if state.round == 10 and deficit <= -40:
+        return state.turn_rolls < 1
+    return state.turn_score < 25
+
+
+def states():
+    for round, active, deficit, turn_rolls, turn_score in itertools.product(
+        range(1, 11), range(2), range(-60, 61, 10), range(4), range(0, 70, 5)
+    ):
+        scores = [100, 100]
+        scores[1 - active] += deficit
+        yield GameState(
+            active=active,
+            round=round,
+            scores=tuple(scores),  # type: ignore
+            turn_rolls=turn_rolls,
+            turn_score=turn_score,
+        )
+
+
+@pytest.fixture
+def chase():
+    if sys.version_info < (3, 11):
+        pytest.importorskip("tomli")
+    return strategy.load(CHASE)
+
+
+def test_spec_personality(chase):
+    assert chase.name() == "Chasing Chase"
+    assert chase.emoji() == "🏃"
+    assert chase.victory_cry() == "Caught you!"
+
+
+def test_rules_compile_to_matching_roll_again(chase):
+    for state in states():
+        assert chase.roll_again(state) == chase_by_hand(state)
+
+
+def test_rules_compile_to_matching_batch_predicate(chase):
+    np = pytest.importorskip("numpy")
+    from notone.batch import BatchState
+
+    all_states = list(states())
+    for (round, active), group in itertools.groupby(
+        all_states, key=lambda state: (state.round, state.active)
+    ):
+        group = list(group)
+        batch = BatchState(
+            active=active,
+            rolls=np.zeros((len(group), 2), dtype=np.int64),
+            round=round,
+            scores=np.array([state.scores for state in group]),
+            turn_rolls=np.array([state.turn_rolls for state in group]),
+            turn_score=np.array([state.turn_score for state in group]),
+        )
+        expected = [chase_by_hand(state) for state in group]
+        assert chase.roll_again_batch(batch).tolist() == expected
+
+
+def test_single_threshold_declares_policy():
+    stella = strategy.load(STELLA)
+    assert stella.policy == Threshold("turn_rolls", 3)
+    assert sum(exact.odds([stella, cautious_carter]).wins) > 0.99
+
+
+def test_conditional_rules_declare_no_policy(chase):
+    assert exact.policy(chase) is None
+
+
+def test_spec_players_play_games(chase):
+    state = game.play([chase, strategy.load(STELLA)], dice=RandomDice(2))
+    assert state.round == 10
+
+
+def test_spec_players_run_on_the_batch_engine(chase):
+    pytest.importorskip("numpy")
+    from notone import batch
+
+    result = batch.simulate([chase, strategy.load(STELLA)], 1_000, seed=1)
+    assert result.games == 1_000
+
+
+@pytest.mark.parametrize(
+    "spec",
+    [
+        {"rules": [{"roll_while": True}]},
+        {"name": "No rules", "rules": []},
+        {"name": "Bad value", "rules": [{"roll_while": {"luck": 3}}]},
+        {"name": "Bad limit", "rules": [{"roll_while": {"turn_score": "lots"}}]},
+        {"name": "Bad key", "rules": [{"roll_while": True, "unless": {}}]},
+        {
+            "name": "Bad range",
+            "rules": [{"when": {"round": {"above": 3}}, "roll_while": True}],
+        },
+        {"name": "No decision", "rules": [{"when": {"round": 1}}]},
+    ],
+)
+def test_invalid_specs_are_rejected(spec):
+    with pytest.raises(ValueError):
+        strategy.build(spec, "invalid")
+
+
+def test_unknown_file_type_is_rejected(tmp_path):
+    path = tmp_path / "player.yaml"
+    path.write_text("name: Nope")
+    with pytest.raises(ValueError):
+        strategy.load(path)
@@ -3,14 +3,17 @@ from typing import Optional
 
 import pytest
 
+from notone import game
+from notone.dice import RandomDice
 from notone.tournament import (
     crown_champion,
+    decide_matchup,
     matchup_players,
     play_matchup,
     rounds_necessary_for_winner,
     seed_players,
 )
-from notone.types import Player, TournamentState
+from notone.types import GameState, Player, TournamentState
 
 
 @pytest.mark.parametrize(
@@ -101,6 +104,21 @@ def test_play_matchup():
     assert play_matchup((p1, p2)) == p1
 
 
+def test_play_matchup_replays_ties(mocker):
+    play = mocker.patch.object(
+        game, "play", side_effect=[GameState(winner=None), GameState(winner=1)]
+    )
+    p1, p2 = Player("p1"), Player("p2")
+    assert play_matchup((p1, p2)) == p2
+    assert play.call_count == 2
+
+
+def test_decide_matchup_replays_ties(mocker):
+    games = [GameState(winner=None), GameState(winner=0)]
+    mocker.patch.object(game, "simulate", side_effect=games)
+    assert decide_matchup(("aggro_aiden", "cautious_carter"), RandomDice(1)) == games
+
+
 def test_play_matchup_handles_p1_bye():
     p1 = Player("p1")
     assert play_matchup((p1, None)) == p1
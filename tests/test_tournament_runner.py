@@ -1,3 +1,7 @@
+from importlib import import_module
+
+import pytest
+
 from notone import tournament
 
 
@@ -28,3 +32,38 @@ def test_tournament_handles_byes(cautious_player):
     state = tournament.play([cautious_player] * 20)
     assert state.round == 5
     assert state.champion is not None
+
+
+@pytest.fixture
+def field():
+    return [import_module(f"notone.players.p{i}") for i in range(1, 17)] + [
+        import_module("notone.players.aggro_aiden"),
+        import_module("notone.players.cautious_carter"),
+    ]
+
+
+def test_seeded_tournament_crowns_same_champion(field):
+    first = tournament.play(field, seed=1234)
+    second = tournament.play(field, seed=1234)
+    assert first.champion == second.champion
+
+
+def test_parallel_tournament_crowns_same_champion_as_serial(field):
+    serial = tournament.play(field, seed=1234)
+    parallel = tournament.play(field, seed=1234, parallel=True, workers=2)
+    assert parallel.champion == serial.champion
+    assert parallel.round == serial.round
+
+
+def test_parallel_tournament_sends_round_signals_in_order(
+    field, game_ended, tournament_round_started, tournament_round_ended, mocker
+):
+    events = mocker.Mock()
+    tournament_round_started.side_effect = lambda *a, **k: events("round_started")
+    game_ended.side_effect = lambda *a, **k: events("game_ended")
+    tournament_round_ended.side_effect = lambda *a, **k: events("round_ended")
+    tournament.play(field, rounds=1, seed=99, parallel=True, workers=2)
+    names = [call.args[0] for call in events.call_args_list]
+    assert names[0] == "round_started"
+    assert names[-1] == "round_ended"
+    assert names.count("game_ended") >= 9